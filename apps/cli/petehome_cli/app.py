@@ -25,7 +25,7 @@ from textual.widgets import (
 )
 from textual_autocomplete import AutoComplete, DropdownItem
 
-from petehome_cli.commands import deploy, dev, git, migrate, pm2
+from petehome_cli.commands import db, deploy, dev, git, migrate, pm2
 
 
 class DropUp(AutoComplete):
@@ -58,6 +58,7 @@ def _build_registry() -> None:
     dev.register(REGISTRY)
     deploy.register(REGISTRY)
     migrate.register(REGISTRY)
+    db.register(REGISTRY)
 
 
 # ---------------------------------------------------------------------------
@@ -87,7 +88,10 @@ _COMMAND_DEFS: list[tuple[str, str]] = [
     ("gpo", "Git push -u origin"),
     ("gpl", "Git pull"),
     ("gl", "Git log"),
+    ("gl browse", "Browse full git log"),
     ("gd", "Git diff"),
+    ("gd more", "Next page of diff"),
+    ("gd staged", "Staged diff"),
     ("gpr", "Create pull request"),
     ("gpr create", "Create pull request"),
     # Git full commands
@@ -104,6 +108,10 @@ _COMMAND_DEFS: list[tuple[str, str]] = [
     ("lint fix", "Run ESLint with --fix"),
     ("format", "Run Prettier"),
     ("build", "Build web app"),
+    ("build swap", "Build aside, swap + reload"),
+    ("build rollback", "Swap back to previous build"),
+    ("build dev", "Back to the dev server"),
+    ("build releases", "List local builds"),
     ("typecheck", "TypeScript type check"),
     ("tsc", "TypeScript type check"),
     ("clean", "Clean build artifacts"),
@@ -112,6 +120,7 @@ _COMMAND_DEFS: list[tuple[str, str]] = [
     ("deploy", "Deploy to production"),
     ("deploy status", "Latest deployment"),
     ("deploy history", "Deployment history"),
+    ("deploy stats", "Build duration trends"),
     ("deploy open", "Open in browser"),
     ("d", "Deploy to production"),
     # Migrate
@@ -119,7 +128,18 @@ _COMMAND_DEFS: list[tuple[str, str]] = [
     ("migrate status", "Migration status"),
     ("migrate mark-applied", "Sync migration history"),
     ("migrate dry-run", "Preview migrations"),
+    ("migrate cancel", "Cancel running migrations"),
+    ("migrate verify", "Check applied migrations for drift"),
+    ("migrate verify accept", "Record checksums for old migrations"),
+    ("migrate report", "Slowest migrations by apply time"),
+    ("migrate --lock-timeout=5s", "Run with a custom lock timeout"),
     ("supabase", "Run migrations"),
+    # Database copy
+    ("db", "Last production dump"),
+    ("db dump", "Dump production tables in parallel"),
+    ("db restore", "Restore the dump into local Supabase"),
+    ("db cancel", "Cancel a running dump or restore"),
+    ("db dump --jobs=4", "Dump with N connections"),
     # Built-ins
     ("clear", "Clear all panels"),
     ("help", "Show help"),
@@ -226,7 +246,10 @@ class HelpScreen(Screen):
                         ("gc [msg]", "Commit"),
                         ("gp / gpo", "Push / push origin"),
                         ("gpl", "Pull"),
-                        ("gl / gd", "Log / diff"),
+                        ("gl", "Log"),
+                        ("gl browse [rev]", "Scrollable log + commit stats"),
+                        ("gd [n|staged]", "Diff summary + paged hunks"),
+                        ("gd more", "Next diff page"),
                         ("gpr [create]", "Pull request"),
                     ],
                     border_style="blue",
@@ -237,6 +260,9 @@ class HelpScreen(Screen):
                         ("lint [fix]", "ESLint"),
                         ("format", "Prettier"),
                         ("build", "Build"),
+                        ("build swap", "Build aside, swap, reload"),
+                        ("build rollback", "Previous build"),
+                        ("build dev", "Dev server again"),
                         ("typecheck / tsc", "Type check"),
                         ("clean", "Clean"),
                         ("sync", "Sync data"),
@@ -248,7 +274,8 @@ class HelpScreen(Screen):
                     [
                         ("deploy / d", "Deploy to production"),
                         ("d status", "Latest deployment"),
-                        ("d history", "Deployment history"),
+                        ("d history [page]", "Deployment history"),
+                        ("d stats", "Build duration trends"),
                         ("d open", "Open in browser"),
                     ],
                     border_style="cyan",
@@ -260,6 +287,13 @@ class HelpScreen(Screen):
                         ("migrate status", "List applied"),
                         ("migrate mark-applied", "Sync history"),
                         ("migrate dry-run", "Preview"),
+                        ("migrate cancel", "Stop + roll back"),
+                        ("migrate verify [accept]", "Drift check"),
+                        ("migrate report [n]", "Slowest migrations"),
+                        ("migrate --lock-timeout=", "Also --statement-timeout= --retries="),
+                        ("db dump", "Prod → ~/.petehome/db-dump"),
+                        ("db restore", "Dump → local stack"),
+                        ("db / db cancel", "Last dump / stop"),
                     ],
                     border_style="magenta",
                 ),
@@ -736,6 +770,10 @@ class PetehomeApp(App):
         self.query_one("#cmd-input", Input).focus()
 
         self.set_interval(2.0, self._refresh_pm2_button)
+        # Keep git ahead/behind counts fresh for `gs`
+        from petehome_cli.services.github import GitHubService
+
+        GitHubService().start_background_fetch()
         # Start PM2 log streaming
         self._start_pm2_log_stream()
 
@@ -837,6 +875,13 @@ class PetehomeApp(App):
     # Lifecycle
     # ------------------------------------------------------------------
 
+    async def on_unmount(self) -> None:
+        from petehome_cli.services.supabase import close_pool
+        from petehome_cli.services.vercel import VercelService
+
+        await VercelService.aclose()
+        close_pool()
+
     def action_quit(self) -> None:
         self.exit()
 
@@ -0,0 +1,193 @@
+"""DB commands: copy the production database into the local Supabase stack.
+
+Handlers write output to a RichLog widget.
+"""
+
+import asyncio
+
+from rich.markup import escape
+from rich.table import Table
+from textual.widgets import RichLog
+
+from petehome_cli.commands.migrate import _fmt_elapsed
+from petehome_cli.services.db_dump import (
+    DEFAULT_JOBS,
+    DUMP_DIR,
+    CopyEvent,
+    current_job,
+    load_manifest,
+    start_dump,
+    start_restore,
+)
+
+_PHASES = {
+    "schema": "Schema",
+    "data": "Table data",
+    "indexes": "Indexes and keys",
+    "constraints": "Foreign keys, triggers, policies",
+}
+# Held from the "already running" check until a dump/restore finishes: the job only
+# registers itself once it starts, after awaits that a second command could slip past
+_job_lock = asyncio.Lock()
+# Schema warnings are expected (prod-only extensions and roles); don't flood the log
+_MAX_WARNINGS = 10
+
+
+def _fmt_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def _parse_jobs(args: list[str]) -> tuple[list[str], int, str | None]:
+    """Split --jobs=N out of args. Returns (remaining args, jobs, error)."""
+    rest: list[str] = []
+    jobs = DEFAULT_JOBS
+    for arg in args:
+        name, sep, value = arg.partition("=")
+        if name not in ("--jobs", "-j"):
+            rest.append(arg)
+        elif not sep or not value.isdigit() or int(value) < 1:
+            return rest, jobs, "--jobs needs a positive number, e.g. --jobs=4"
+        else:
+            jobs = int(value)
+    return rest, jobs, None
+
+
+async def _run_job(run, verb: str, output: RichLog) -> bool:
+    """Stream a dump/restore's events; True if it finished."""
+    warnings = 0
+    finished = False
+    async for event in run.events():
+        warnings = _write_event(event, verb, warnings, output)
+        finished = finished or event.kind == "done"
+    if warnings > _MAX_WARNINGS:
+        output.write(f"[dim]  ... {warnings - _MAX_WARNINGS} more warning(s)[/]")
+    return finished
+
+
+def _write_event(event: CopyEvent, verb: str, warnings: int, output: RichLog) -> int:
+    """Write one progress event; returns the updated warning count."""
+    if event.kind == "phase":
+        count = f" · {event.total}" if event.total else ""
+        output.write(f"[bold]{_PHASES.get(event.message, event.message)}[/][dim]{count}[/]")
+
+    elif event.kind == "table" and event.table is not None:
+        t = event.table
+        rate = t.raw_bytes / t.elapsed if t.elapsed > 0 else 0
+        output.write(
+            f"[green]✓[/] [dim][{event.index}/{event.total}][/] {escape(t.name)}  "
+            f"[dim]{t.rows:,} rows · {_fmt_bytes(t.raw_bytes)} → {_fmt_bytes(t.stored_bytes)} · "
+            f"{_fmt_elapsed(t.elapsed)} · {_fmt_bytes(rate)}/s[/]"
+        )
+
+    elif event.kind == "warning":
+        warnings += 1
+        if warnings <= _MAX_WARNINGS:
+            output.write(f"[yellow]![/] [dim]{escape(event.message)}[/]")
+
+    elif event.kind == "done":
+        output.write(f"[green]✓[/] {verb} {event.total} table(s) in {_fmt_elapsed(event.elapsed)}")
+
+    elif event.kind == "cancelled":
+        output.write(f"[yellow]![/] {escape(event.message)} after {_fmt_elapsed(event.elapsed)}")
+
+    elif event.kind == "error":
+        output.write(f"[red]✗[/] {escape(event.message)}")
+    return warnings
+
+
+async def _db_info(_args: list[str], output: RichLog) -> None:
+    manifest = load_manifest()
+    if manifest is None:
+        output.write(f"[dim]No dump in {DUMP_DIR} · 'db dump' to create one[/]")
+        return
+
+    table = Table(
+        show_header=True,
+        header_style="bold dim",
+        box=None,
+        padding=(0, 2),
+    )
+    table.add_column("Table")
+    table.add_column("Rows", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Stored", justify="right", style="dim")
+    for t in sorted(manifest.tables, key=lambda t: t.raw_bytes, reverse=True):
+        table.add_row(escape(t.name), f"{t.rows:,}", _fmt_bytes(t.raw_bytes), _fmt_bytes(t.stored_bytes))
+    output.write(table)
+    output.write(
+        f"[dim]{escape(manifest.source)} · {manifest.created_at:%Y-%m-%d %H:%M} · "
+        f"{len(manifest.tables)} tables · {manifest.rows:,} rows · "
+        f"{_fmt_bytes(manifest.raw_bytes)} ({_fmt_bytes(manifest.stored_bytes)} on disk)[/]"
+    )
+
+
+async def _db_dump(args: list[str], output: RichLog) -> None:
+    _rest, jobs, error = _parse_jobs(args)
+    if error:
+        output.write(f"[red]✗[/] {escape(error)}")
+        return
+    run, target = start_dump(jobs=jobs)
+    if run is None:
+        output.write(f"[red]✗[/] {escape(target)}")
+        return
+    output.write(f"[dim]Dumping {escape(target)} with {run.jobs} connections · 'db cancel' to stop[/]")
+    await _run_job(run, "Dumped", output)
+
+
+async def _db_restore(args: list[str], output: RichLog) -> None:
+    _rest, jobs, error = _parse_jobs(args)
+    if error:
+        output.write(f"[red]✗[/] {escape(error)}")
+        return
+    # Resolving the local URL may shell out to `supabase status`
+    run, target = await asyncio.to_thread(start_restore, jobs)
+    if run is None:
+        output.write(f"[red]✗[/] {escape(target)}")
+        return
+    output.write(f"[dim]Restoring into {escape(target)} with {run.jobs} connections · 'db cancel' to stop[/]")
+    if await _run_job(run, "Restored", output):
+        output.write("[dim]Point apps/web/.env.local at the local stack and restart the dev server.[/]")
+
+
+async def _db_cancel(_args: list[str], output: RichLog) -> None:
+    job = current_job()
+    if job is None:
+        output.write("[dim]No dump or restore running[/]")
+        return
+    job.cancel()
+    output.write("[yellow]![/] Cancelling...")
+
+
+_DB_SUBCOMMANDS: dict = {
+    "info": _db_info,
+    "dump": _db_dump,
+    "restore": _db_restore,
+    "cancel": _db_cancel,
+}
+
+
+async def cmd_db(args: list[str], output: RichLog) -> None:
+    """Handle db dump/restore commands."""
+    subcmd = args[0].lower() if args else "info"
+    handler = _DB_SUBCOMMANDS.get(subcmd)
+    if handler is None:
+        output.write(f"[red]✗[/] Unknown: db {subcmd}")
+        output.write("[dim]Use: db · db dump · db restore · db cancel · --jobs=N[/]")
+        return
+    if subcmd not in ("dump", "restore"):
+        await handler(args[1:], output)
+        return
+    if _job_lock.locked() or current_job() is not None:
+        output.write("[yellow]![/] A dump or restore is already running")
+        return
+    async with _job_lock:
+        await handler(args[1:], output)
+
+
+def register(registry: dict) -> None:
+    """Register db commands into the command registry."""
+    registry["db"] = cmd_db
@@ -3,13 +3,30 @@
 Handlers write output to a RichLog widget.
 """
 
+import asyncio
+import time
 import webbrowser
 
 from rich.markup import escape
 from rich.table import Table
 from textual.widgets import RichLog
 
-from petehome_cli.services.vercel import VercelService
+from petehome_cli.services.deploy_history import DeploymentHistory
+from petehome_cli.services.vercel import TERMINAL_STATES, VercelService
+
+_HISTORY_PAGE_SIZE = 15
+_STATS_WINDOW = 20
+_SYNC_TIMEOUT = 5.0
+_SPARK = "▁▂▃▄▅▆▇█"
+
+_STATE_DISPLAY: dict[str, str] = {
+    "READY": "[green]● Ready[/]",
+    "ERROR": "[red]● Error[/]",
+    "CANCELED": "[red]○ Canceled[/]",
+    "BUILDING": "[yellow]◐ Building[/]",
+    "INITIALIZING": "[yellow]◐ Initializing[/]",
+    "QUEUED": "[yellow]◐ Queued[/]",
+}
 
 
 async def cmd_deploy(args: list[str], output: RichLog) -> None:
@@ -30,44 +47,20 @@ async def cmd_deploy(args: list[str], output: RichLog) -> None:
             output.write("[dim]No deployments found[/]")
             return
 
-        status_display = {
-            "READY": "[green]● Ready[/]",
-            "ERROR": "[red]● Error[/]",
-            "CANCELED": "[red]○ Canceled[/]",
-            "BUILDING": "[yellow]◐ Building[/]",
-            "QUEUED": "[yellow]◐ Queued[/]",
-        }.get(deployment.state, f"[yellow]◐ {deployment.state}[/]")
+        status_display = _STATE_DISPLAY.get(
+            deployment.state, f"[yellow]◐ {deployment.state}[/]"
+        )
 
         output.write(f"  Status:  {status_display}")
         output.write(f"  URL:     {deployment.deployment_url}")
         output.write(f"  Created: {deployment.created_str}")
 
     elif subcmd == "history":
-        deployments = await vercel.get_deployments(limit=10)
-
-        if not deployments:
-            output.write("[dim]No deployments found[/]")
-            return
-
-        table = Table(
-            show_header=True,
-            header_style="bold dim",
-            box=None,
-            padding=(0, 2),
-        )
-        table.add_column("Status")
-        table.add_column("State")
-        table.add_column("Created")
-
-        for d in deployments:
-            status_icon = {
-                "READY": "[green]●[/]",
-                "ERROR": "[red]●[/]",
-                "CANCELED": "[red]○[/]",
-            }.get(d.state, "[yellow]◐[/]")
-            table.add_row(status_icon, d.state, d.created_str)
+        page = int(args[1]) if len(args) > 1 and args[1].isdigit() else 1
+        await _deploy_history(vercel, page, output)
 
-        output.write(table)
+    elif subcmd in ("stats", "trends"):
+        await _deploy_stats(vercel, output)
 
     elif subcmd == "open":
         deployment = await vercel.get_latest_deployment()
@@ -78,17 +71,179 @@ async def cmd_deploy(args: list[str], output: RichLog) -> None:
             output.write("[dim]No deployment found[/]")
 
     elif subcmd in ("trigger", "prod", "production"):
-        output.write("[dim]Deploying to production...[/]")
-        ok, out = await vercel.trigger_deployment()
-        if ok:
-            output.write("[green]✓[/] Deployment triggered")
-        else:
-            first_line = out.split("\n")[0] if out else "Failed"
-            output.write(f"[red]✗[/] {escape(first_line)}")
+        await _deploy_trigger(vercel, output)
 
     else:
         output.write(f"[red]✗[/] Unknown: deploy {subcmd}")
-        output.write("[dim]Options: status, history, open, trigger[/]")
+        output.write("[dim]Options: status, history [page], stats, open, trigger[/]")
+
+
+def _fmt_secs(secs: float) -> str:
+    if secs < 60:
+        return f"{secs:.0f}s"
+    return f"{int(secs // 60)}m {int(secs % 60):02d}s"
+
+
+async def _sync_history(history: DeploymentHistory, vercel: VercelService) -> bool:
+    """Sync the local store, giving up quickly when offline."""
+    try:
+        ok, _new = await asyncio.wait_for(history.sync(vercel), timeout=_SYNC_TIMEOUT)
+        return ok
+    except asyncio.TimeoutError:
+        return False
+
+
+async def _deploy_history(vercel: VercelService, page: int, output: RichLog) -> None:
+    """Show deployment history from the local store (page 1 syncs first)."""
+    history = DeploymentHistory()
+    try:
+        synced = page > 1 or await _sync_history(history, vercel)
+        total = history.count()
+        if not total:
+            output.write("[dim]No deployments found[/]")
+            return
+        if not synced:
+            output.write("[yellow]![/] [dim]Offline -- showing cached history[/]")
+
+        pages = (total + _HISTORY_PAGE_SIZE - 1) // _HISTORY_PAGE_SIZE
+        deployments = history.page(page, _HISTORY_PAGE_SIZE)
+        stats = history.duration_stats(limit=20)
+    finally:
+        history.close()
+
+    if not deployments:
+        output.write(f"[dim]No page {page} (1-{pages})[/]")
+        return
+
+    table = Table(
+        show_header=True,
+        header_style="bold dim",
+        box=None,
+        padding=(0, 2),
+    )
+    table.add_column("Status")
+    table.add_column("State")
+    table.add_column("Created")
+    table.add_column("Build", justify="right")
+
+    for d in deployments:
+        status_icon = {
+            "READY": "[green]●[/]",
+            "ERROR": "[red]●[/]",
+            "CANCELED": "[red]○[/]",
+        }.get(d.state, "[yellow]◐[/]")
+        duration = f"[dim]{_fmt_secs(d.duration)}[/]" if d.duration is not None else "[dim]-[/]"
+        table.add_row(status_icon, d.state, d.created_str, duration)
+
+    output.write(table)
+    footer = f"[dim]page {page}/{pages} · {total} deployments"
+    if stats:
+        footer += f" · p50 {_fmt_secs(stats.p50)} · p90 {_fmt_secs(stats.p90)}"
+    output.write(footer + "[/]")
+
+
+async def _deploy_stats(vercel: VercelService, output: RichLog) -> None:
+    """Build-duration percentiles, recent window vs the one before it."""
+    history = DeploymentHistory()
+    try:
+        await _sync_history(history, vercel)
+        recent = history.duration_stats(limit=_STATS_WINDOW)
+        previous = history.duration_stats(limit=_STATS_WINDOW, offset=_STATS_WINDOW)
+        trend = list(reversed(history.durations(limit=30)))
+    finally:
+        history.close()
+
+    if not recent:
+        output.write("[dim]No finished deployments yet[/]")
+        return
+
+    table = Table(show_header=True, header_style="bold dim", box=None, padding=(0, 2))
+    table.add_column("")
+    table.add_column(f"Last {recent.count}", justify="right")
+    table.add_column(f"Prev {previous.count if previous else 0}", justify="right")
+    table.add_column("Δ", justify="right")
+
+    for label in ("p50", "p90", "p95", "max"):
+        cur = getattr(recent, label)
+        prev = getattr(previous, label) if previous else None
+        if prev:
+            pct = (cur - prev) / prev * 100
+            color = "red" if pct > 10 else "green" if pct < -10 else "dim"
+            delta = f"[{color}]{pct:+.0f}%[/]"
+        else:
+            delta = "[dim]-[/]"
+        table.add_row(
+            label,
+            _fmt_secs(cur),
+            f"[dim]{_fmt_secs(prev)}[/]" if prev else "[dim]-[/]",
+            delta,
+        )
+    output.write(table)
+
+    if len(trend) > 1:
+        lo, hi = min(trend), max(trend)
+        span = (hi - lo) or 1
+        spark = "".join(_SPARK[int((v - lo) / span * (len(_SPARK) - 1))] for v in trend)
+        output.write(f"  [cyan]{spark}[/] [dim]{_fmt_secs(lo)}–{_fmt_secs(hi)}, oldest → newest[/]")
+
+
+async def _deploy_trigger(vercel: VercelService, output: RichLog) -> None:
+    """Deploy to production, streaming CLI output then live build events."""
+    output.write("[dim]Deploying to production...[/]")
+
+    host: str | None = None
+    last_line = ""
+    async for line in vercel.stream_deployment():
+        if not line.strip():
+            continue
+        last_line = line
+        host = host or vercel.parse_deployment_url(line)
+        output.write(f"[dim]{escape(line)}[/]")
+
+    if not host:
+        output.write(f"[red]✗[/] {escape(last_line or 'Failed')}")
+        return
+    output.write(f"[green]✓[/] Deployment created: https://{host}")
+
+    started = time.monotonic()
+    phase: str | None = None
+    phase_started = started
+    timings: list[tuple[str, float]] = []
+
+    async for ev in vercel.follow_deployment(host):
+        if ev.kind != "state":
+            if ev.kind == "stderr" or "error" in ev.text.lower():
+                output.write(f"[red]{escape(ev.text)}[/]")
+            elif ev.kind == "command":
+                output.write(f"[cyan]{escape(ev.text)}[/]")
+            else:
+                output.write(escape(ev.text))
+            continue
+
+        now = time.monotonic()
+        if phase:
+            timings.append((phase, now - phase_started))
+        phase, phase_started = ev.text, now
+        output.write(f"  {_STATE_DISPLAY.get(phase, f'[yellow]◐ {phase}[/]')}")
+
+    if phase:
+        timings.append((phase, time.monotonic() - phase_started))
+
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column()
+    table.add_column(justify="right", style="dim")
+    for name, secs in timings:
+        if name not in TERMINAL_STATES:
+            table.add_row(name.lower(), f"{secs:.1f}s")
+    table.add_row("[bold]total[/]", f"{time.monotonic() - started:.1f}s")
+    output.write(table)
+
+    if phase == "READY":
+        output.write(f"[green]✓[/] Live: https://{host}")
+    elif phase in TERMINAL_STATES:
+        output.write(f"[red]✗[/] Deployment {phase.lower()}")
+    else:
+        output.write("[yellow]![/] Stopped following -- check 'deploy status'")
 
 
 def register(registry: dict) -> None:
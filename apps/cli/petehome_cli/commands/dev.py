@@ -1,12 +1,17 @@
-"""Dev commands: lint, format, build, clean, typecheck, sync.
+"""Dev commands: lint, format, build (+ blue/green swap), clean, typecheck, sync.
 
 Handlers write output to a RichLog widget.
 """
 
+import time
+
 from rich.markup import escape
+from rich.table import Table
 from textual.widgets import RichLog
 
+from petehome_cli.config import PM2_PROCESSES
 from petehome_cli.services.dev_server import DevServerService
+from petehome_cli.services.pm2 import PM2Service
 
 
 async def cmd_lint(args: list[str], output: RichLog) -> None:
@@ -38,27 +43,154 @@ async def cmd_format(_args: list[str], output: RichLog) -> None:
         output.write(f"[red]✗[/] {e}")
 
 
-async def cmd_build(_args: list[str], output: RichLog) -> None:
-    """Build the web app."""
+def _write_build_line(output: RichLog, line: str) -> None:
+    if not line.strip():
+        return
+    if "error" in line.lower():
+        output.write(f"[red]{escape(line)}[/]")
+    elif "warn" in line.lower():
+        output.write(f"[yellow]{escape(line)}[/]")
+    elif any(kw in line.lower() for kw in ("success", "compiled", "done")):
+        output.write(f"[green]{escape(line)}[/]")
+    else:
+        output.write(escape(line))
+
+
+async def cmd_build(args: list[str], output: RichLog) -> None:
+    """Build the web app. Subcommands: swap, rollback, dev, releases."""
+    subcmd = args[0].lower() if args else ""
+    if subcmd == "swap":
+        await _build_swap(output)
+        return
+    if subcmd == "rollback":
+        await _build_rollback(output)
+        return
+    if subcmd == "dev":
+        await _build_dev(output)
+        return
+    if subcmd == "releases":
+        _build_releases(output)
+        return
+    if subcmd:
+        output.write(f"[red]✗[/] Unknown: build {subcmd}")
+        output.write("[dim]Options: build · build swap · build rollback · build dev · build releases[/]")
+        return
+
     dev = DevServerService()
     output.write("[dim]Building...[/]")
 
     try:
         async for line in dev.build():
-            if line.strip():
-                if "error" in line.lower():
-                    output.write(f"[red]{escape(line)}[/]")
-                elif "warn" in line.lower():
-                    output.write(f"[yellow]{escape(line)}[/]")
-                elif any(kw in line.lower() for kw in ("success", "compiled", "done")):
-                    output.write(f"[green]{escape(line)}[/]")
-                else:
-                    output.write(escape(line))
+            _write_build_line(output, line)
         output.write("[green]✓[/] Build complete")
     except Exception as e:
         output.write(f"[red]✗[/] {e}")
 
 
+async def _reload_main(output: RichLog) -> None:
+    """Reload the main PM2 app if it is running so it picks up the new .next."""
+    name = PM2_PROCESSES["main"]
+    proc = await PM2Service.get_process(name)
+    if not proc or proc.status != "online":
+        output.write(f"[dim]{name} not running -- next start will use the new build[/]")
+        return
+    ok, out = await PM2Service.reload(name)
+    if not ok:
+        first_line = out.split("\n")[0] if out else "Failed"
+        output.write(f"[red]✗[/] Reload failed: {escape(first_line)}")
+
+
+async def _build_swap(output: RichLog) -> None:
+    """Blue/green build: build aside, then swap .next and reload PM2."""
+    dev = DevServerService()
+    output.write("[dim]Building new release (current build keeps serving)...[/]")
+
+    started = time.monotonic()
+    release_id: str | None = None
+    try:
+        async for line in dev.build_release():
+            if line.startswith("release:"):
+                release_id = line.split(":", 1)[1]
+                continue
+            _write_build_line(output, line)
+    except Exception as e:
+        output.write(f"[red]✗[/] {e}")
+        return
+
+    if not release_id:
+        output.write("[red]✗[/] Build failed -- previous build still serving")
+        return
+    build_secs = time.monotonic() - started
+
+    swap_started = time.monotonic()
+    ok, msg = dev.activate_release(release_id)
+    if not ok:
+        output.write(f"[red]✗[/] Swap failed: {escape(msg)}")
+        return
+    await _reload_main(output)
+    swap_secs = time.monotonic() - swap_started
+
+    output.write(
+        f"[green]✓[/] Serving {release_id} "
+        f"[dim](build {build_secs:.0f}s · swap {swap_secs:.1f}s)[/]"
+    )
+    removed = dev.prune_releases()
+    if removed:
+        output.write(f"[dim]Pruned {len(removed)} old release(s)[/]")
+
+
+async def _build_rollback(output: RichLog) -> None:
+    """Point .next back at the previous release and reload."""
+    dev = DevServerService()
+    prev = dev.previous_release()
+    if not prev:
+        output.write("[yellow]![/] No previous release to roll back to")
+        return
+
+    ok, msg = dev.activate_release(prev.release_id)
+    if not ok:
+        output.write(f"[red]✗[/] Rollback failed: {escape(msg)}")
+        return
+    await _reload_main(output)
+    output.write(f"[green]✓[/] Rolled back to {prev.release_id}")
+
+
+async def _build_dev(output: RichLog) -> None:
+    """Stop serving a release: drop the .next link and reload into the dev server."""
+    ok, msg = DevServerService().deactivate_release()
+    if not ok:
+        output.write(f"[yellow]![/] {escape(msg)}")
+        return
+    await _reload_main(output)
+    output.write(f"[green]✓[/] Back on the dev server [dim]({msg} kept for build rollback)[/]")
+
+
+def _build_releases(output: RichLog) -> None:
+    """List blue/green releases."""
+    releases = DevServerService().list_releases()
+    if not releases:
+        output.write("[dim]No releases yet -- run 'build swap'[/]")
+        return
+
+    table = Table(
+        show_header=True,
+        header_style="bold dim",
+        box=None,
+        padding=(0, 2),
+    )
+    table.add_column("")
+    table.add_column("Release")
+    table.add_column("Built")
+    for r in releases:
+        built = r.built_at.strftime("%Y-%m-%d %H:%M:%S") if r.built_at else "-"
+        table.add_row(
+            "[green]●[/]" if r.active else "[dim]○[/]",
+            f"[bold]{r.release_id}[/]" if r.active else r.release_id,
+            f"[dim]{built}[/]",
+        )
+    output.write(table)
+
+
 async def cmd_clean(_args: list[str], output: RichLog) -> None:
     """Clean build artifacts."""
     dev = DevServerService()
@@ -4,16 +4,41 @@ Single-repo: operates on the petehome monorepo root.
 Handlers write output to a RichLog widget.
 """
 
+import asyncio
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+
 from rich.markup import escape
 from rich.panel import Panel
+from rich.syntax import Syntax
 from rich.table import Table
+from rich.text import Text
 from rich.tree import Tree
 from textual.widgets import RichLog
 
-from petehome_cli.services.github import GitHubService
+from petehome_cli.services.github import FileDiffStat, GitHubService
 
 _svc = GitHubService()
 
+# Max diff text rendered per `gd` page (the output panel keeps 1000 lines)
+_DIFF_PAGE_BYTES = 32_000
+_DIFF_PAGE_LINES = 400
+_DIFF_SUMMARY_ROWS = 40
+_DIFF_LINE_CHARS = 1_000  # longer lines (minified files) are cut when shown
+_DIFF_THEME = "monokai"
+
+
+def _fetched_str(age: float | None) -> str:
+    if age is None:
+        return "never fetched"
+    if age < 60:
+        return "fetched just now"
+    if age < 3600:
+        return f"fetched {int(age // 60)}m ago"
+    if age < 86400:
+        return f"fetched {int(age // 3600)}h ago"
+    return f"fetched {int(age // 86400)}d ago"
+
 
 # ---------------------------------------------------------------------------
 # Git subcommand handlers
@@ -30,26 +55,38 @@ async def _git_status(_args: list[str], output: RichLog) -> None:
     header = f"[bold]{status.branch}[/]"
     if status.ahead or status.behind:
         header += f"  [dim]↑{status.ahead} ↓{status.behind}[/]"
+    if status.upstream:
+        header += f"  [dim]· {_fetched_str(status.fetch_age)}[/]"
     tree = Tree(header)
 
+    if status.conflicted:
+        branch = tree.add(f"[bold red]Conflicts ({len(status.conflicted)})[/]")
+        for f in status.conflicted[:10]:
+            branch.add(f"[bold red]![/] [dim]{escape(f)}[/]")
+        if len(status.conflicted) > 10:
+            branch.add(f"[dim]...+{len(status.conflicted) - 10} more[/]")
+
     if status.staged:
         branch = tree.add(f"[green]Staged ({len(status.staged)})[/]")
         for f in status.staged[:10]:
-            branch.add(f"[green]+[/] [dim]{f}[/]")
+            if f in status.renamed:
+                branch.add(f"[green]→[/] [dim]{escape(status.renamed[f])} → {escape(f)}[/]")
+            else:
+                branch.add(f"[green]+[/] [dim]{escape(f)}[/]")
         if len(status.staged) > 10:
             branch.add(f"[dim]...+{len(status.staged) - 10} more[/]")
 
     if status.unstaged:
         branch = tree.add(f"[yellow]Modified ({len(status.unstaged)})[/]")
         for f in status.unstaged[:10]:
-            branch.add(f"[yellow]~[/] [dim]{f}[/]")
+            branch.add(f"[yellow]~[/] [dim]{escape(f)}[/]")
         if len(status.unstaged) > 10:
             branch.add(f"[dim]...+{len(status.unstaged) - 10} more[/]")
 
     if status.untracked:
         branch = tree.add(f"[red]Untracked ({len(status.untracked)})[/]")
         for f in status.untracked[:10]:
-            branch.add(f"[red]?[/] [dim]{f}[/]")
+            branch.add(f"[red]?[/] [dim]{escape(f)}[/]")
         if len(status.untracked) > 10:
             branch.add(f"[dim]...+{len(status.untracked) - 10} more[/]")
 
@@ -118,7 +155,14 @@ async def _git_pull(_args: list[str], output: RichLog) -> None:
         output.write(f"[red]✗[/] {escape(first_line)}")
 
 
-async def _git_log(_args: list[str], output: RichLog) -> None:
+async def _git_log(args: list[str], output: RichLog) -> None:
+    if args and args[0].lower() in ("browse", "b"):
+        from petehome_cli.log_browser import LogBrowserScreen
+
+        rev = args[1] if len(args) > 1 else "HEAD"
+        output.app.push_screen(LogBrowserScreen(rev))
+        return
+
     commits = await _svc.get_log(10)
     if not commits:
         output.write("[dim]No commits[/]")
@@ -142,23 +186,218 @@ async def _git_log(_args: list[str], output: RichLog) -> None:
     )
 
 
-async def _git_diff(_args: list[str], output: RichLog) -> None:
-    ok, diff_output = await _svc.diff()
-    if ok and diff_output.strip():
-        for line in diff_output.split("\n")[:50]:
-            if line.startswith("+") and not line.startswith("+++"):
-                output.write(f"[green]{escape(line)}[/]")
-            elif line.startswith("-") and not line.startswith("---"):
-                output.write(f"[red]{escape(line)}[/]")
-            elif line.startswith("@@"):
-                output.write(f"[cyan]{escape(line)}[/]")
+@dataclass
+class _DiffView:
+    """The last `gd` diff, paused after a page, so `gd more` can continue."""
+
+    paths: list[str] | None
+    staged: bool
+    offset: int = 0  # diff lines already shown
+    files: list[FileDiffStat] = field(default_factory=list)
+    # The running `git diff`, blocked on its pipe between pages; None once drained
+    stream: AsyncGenerator[str, None] | None = None
+    pending: str | None = None  # line read past the end of the last page
+    path: str | None = None  # file of the hunk being shown, for highlighting
+    # `gd more` runs as a worker; two at once must not share the generator
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    async def next_line(self) -> str | None:
+        if self.pending is not None:
+            line, self.pending = self.pending, None
+            return line
+        if self.stream is None:
+            return None
+        try:
+            return await self.stream.__anext__()
+        except StopAsyncIteration:
+            self.stream = None
+            return None
+
+    async def close(self) -> None:
+        """Stop the paused git process, if any."""
+        if self.stream is not None:
+            await self.stream.aclose()
+            self.stream = None
+
+
+_diff_view: _DiffView | None = None
+
+
+async def _open_diff_view(paths: list[str] | None, staged: bool, files: list[FileDiffStat]) -> _DiffView:
+    """Replace the current diff view (stopping its git process) with a new one."""
+    global _diff_view
+    if _diff_view is not None:
+        async with _diff_view.lock:
+            await _diff_view.close()
+    _diff_view = _DiffView(
+        paths=paths,
+        staged=staged,
+        files=files,
+        stream=_svc.stream_diff(paths, staged=staged),
+    )
+    return _diff_view
+
+
+def _diff_line_markup(line: str) -> str:
+    if line.startswith("+") and not line.startswith("+++"):
+        return f"[green]{escape(line)}[/]"
+    if line.startswith("-") and not line.startswith("---"):
+        return f"[red]{escape(line)}[/]"
+    if line.startswith("@@"):
+        return f"[cyan]{escape(line)}[/]"
+    if line.startswith("diff --git"):
+        return f"[bold]{escape(line)}[/]"
+    return f"[dim]{escape(line)}[/]"
+
+
+def _is_code_line(line: str) -> bool:
+    return line[:1] in ("+", "-", " ") and not line.startswith(("+++", "---"))
+
+
+def _highlight_code(path: str, lines: list[str]) -> list[Text]:
+    """Syntax-highlight a run of +/-/context lines as *path*'s language.
+
+    The run is highlighted in one pass so multi-line constructs inside a
+    hunk keep their colors; the +/- marker and a tint stay on each line.
+    """
+    syntax = Syntax("", Syntax.guess_lexer(path), theme=_DIFF_THEME, background_color="default")
+    code = syntax.highlight("\n".join(line[1:] for line in lines))
+    code.rstrip()
+    rendered: list[Text] = []
+    for line, text in zip(lines, code.split("\n", allow_blank=True)):
+        marker = line[0]
+        if marker == "+":
+            text = Text.assemble(("+", "green"), text)
+            text.stylize("on #0f2a17")
+        elif marker == "-":
+            text = Text.assemble(("-", "red"), text)
+            text.stylize("on #2e1216")
+        else:
+            text = Text.assemble(" ", text)
+        rendered.append(text)
+    return rendered
+
+
+def _render_diff_page(view: _DiffView, lines: list[str]) -> list[Text | str]:
+    """Render one page: headers as markup, hunk bodies highlighted by file type."""
+    rendered: list[Text | str] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            if view.path:
+                rendered.extend(_highlight_code(view.path, run))
             else:
-                output.write(f"[dim]{escape(line)}[/]")
-    elif ok:
+                rendered.extend(_diff_line_markup(line) for line in run)
+            run.clear()
+
+    for line in lines:
+        if len(line) > _DIFF_LINE_CHARS:
+            line = line[:_DIFF_LINE_CHARS] + " …"
+        if _is_code_line(line):
+            run.append(line)
+            continue
+        flush()
+        if line.startswith("diff --git "):
+            view.path = line.rsplit(" b/", 1)[-1]
+        rendered.append(_diff_line_markup(line))
+    flush()
+    return rendered
+
+
+async def _show_diff_page(view: _DiffView, output: RichLog) -> None:
+    """Render the next page from the view's open diff stream.
+
+    Only the lines on the page are highlighted, and git stays paused on its
+    pipe between pages, so `gd more` costs one page however deep it is and
+    huge diffs never get buffered.
+    """
+    async with view.lock:
+        page: list[str] = []
+        shown_bytes = 0
+        error: Exception | None = None
+        try:
+            while (line := await view.next_line()) is not None:
+                if shown_bytes >= _DIFF_PAGE_BYTES or len(page) >= _DIFF_PAGE_LINES:
+                    view.pending = line
+                    break
+                page.append(line)
+                shown_bytes += min(len(line), _DIFF_LINE_CHARS) + 1
+        except Exception as e:
+            error = e
+            await view.close()
+
+        for rendered in _render_diff_page(view, page):
+            output.write(rendered)
+
+        view.offset += len(page)
+        if error is not None:
+            output.write(f"[red]✗[/] git diff failed: {escape(str(error))}")
+        elif view.pending is not None:
+            output.write(
+                f"[dim]… {view.offset} lines shown · [bold]gd more[/bold] for the next page[/]"
+            )
+        elif not page:
+            output.write("[dim]End of diff[/]")
+
+
+async def _git_diff(args: list[str], output: RichLog) -> None:
+    """Paged diff: `gd` summary + first page, `gd <n|path>` one file, `gd more` next page."""
+    staged = "staged" in args or "--staged" in args
+    args = [a for a in args if a not in ("staged", "--staged")]
+
+    if args and args[0] == "more":
+        if not _diff_view:
+            output.write("[dim]Nothing to continue -- run gd first[/]")
+            return
+        await _show_diff_page(_diff_view, output)
+        return
+
+    files = await _svc.diff_numstat(staged=staged)
+    if files is None:
+        output.write("[red]✗[/] git diff failed")
+        return
+    if not files:
         output.write("[dim]No changes[/]")
-    else:
-        first_line = diff_output.split("\n")[0] if diff_output else "Failed"
-        output.write(f"[red]✗[/] {escape(first_line)}")
+        return
+
+    if args:
+        target = args[0]
+        if target.isdigit() and 1 <= int(target) <= len(files):
+            path = files[int(target) - 1].path
+        elif any(f.path == target for f in files):
+            path = target
+        else:
+            output.write(f"[red]✗[/] No changed file: {escape(target)}")
+            return
+        await _show_diff_page(await _open_diff_view([path], staged, files), output)
+        return
+
+    table = Table(show_header=False, box=None, padding=(0, 1))
+    table.add_column(style="dim", justify="right")
+    table.add_column()
+    table.add_column(justify="right")
+    for i, f in enumerate(files[:_DIFF_SUMMARY_ROWS], 1):
+        name = f"{escape(f.old_path)} → {escape(f.path)}" if f.old_path else escape(f.path)
+        counts = "[dim]binary[/]" if f.binary else f"[green]+{f.added}[/] [red]-{f.deleted}[/]"
+        table.add_row(str(i), name, counts)
+    if len(files) > _DIFF_SUMMARY_ROWS:
+        table.add_row("", f"[dim]...+{len(files) - _DIFF_SUMMARY_ROWS} more[/]", "")
+    added = sum(f.added for f in files)
+    deleted = sum(f.deleted for f in files)
+    output.write(
+        Panel(
+            table,
+            border_style="dim",
+            padding=(0, 1),
+            title=f"[bold]{len(files)} files[/] [green]+{added}[/] [red]-{deleted}[/]",
+            title_align="left",
+            subtitle="[dim]gd <n> for one file[/]",
+            subtitle_align="right",
+        )
+    )
+
+    await _show_diff_page(await _open_diff_view(None, staged, files), output)
 
 
 async def _git_pr(args: list[str], output: RichLog) -> None:
@@ -257,12 +496,12 @@ async def _shortcut_gpl(_a: list[str], o: RichLog) -> None:
     await _git_pull([], o)
 
 
-async def _shortcut_gl(_a: list[str], o: RichLog) -> None:
-    await _git_log([], o)
+async def _shortcut_gl(args: list[str], o: RichLog) -> None:
+    await _git_log(args, o)
 
 
-async def _shortcut_gd(_a: list[str], o: RichLog) -> None:
-    await _git_diff([], o)
+async def _shortcut_gd(args: list[str], o: RichLog) -> None:
+    await _git_diff(args, o)
 
 
 async def _shortcut_gpr(args: list[str], o: RichLog) -> None:
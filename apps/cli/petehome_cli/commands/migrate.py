@@ -3,6 +3,9 @@
 Handlers write output to a RichLog widget.
 """
 
+import asyncio
+
+from rich.markup import escape
 from rich.table import Table
 from textual.widgets import RichLog
 
@@ -13,13 +16,111 @@ from petehome_cli.services.supabase import (
     mark_applied as supabase_mark_applied,
 )
 from petehome_cli.services.supabase import (
+    DEFAULT_LOCK_RETRIES,
+    DEFAULT_LOCK_TIMEOUT,
+    DEFAULT_STATEMENT_TIMEOUT,
+    MigrationEvent,
+    current_run,
+    is_valid_timeout,
+    migration_report,
     migration_status,
     run_migrations,
+    verify_migrations,
 )
 
+_RUN_OPTIONS = ("--lock-timeout", "--statement-timeout", "--retries")
+
+
+def _fmt_elapsed(secs: float) -> str:
+    if secs < 1:
+        return f"{secs * 1000:.0f}ms"
+    if secs < 60:
+        return f"{secs:.1f}s"
+    return f"{int(secs // 60)}m {int(secs % 60):02d}s"
+
+
+def _statement_preview(sql: str, width: int = 70) -> str:
+    first = " ".join(sql.split())
+    return first if len(first) <= width else first[: width - 1] + "…"
+
+
+def _write_event(event: MigrationEvent, dry_run: bool, output: RichLog) -> None:
+    if event.kind == "pending":
+        if not event.total:
+            output.write("[green]✓[/] No pending migrations.")
+        elif dry_run:
+            output.write(f"[dim]Dry run: would apply {event.total} migration(s)[/]")
+        else:
+            output.write(f"[dim]Applying {event.total} migration(s) · 'migrate cancel' to stop[/]")
+
+    elif event.kind == "start":
+        if dry_run:
+            output.write(f"  {escape(event.migration)} [dim]· {event.total} statements[/]")
+        else:
+            attempt = f" · attempt {event.index}" if event.index > 1 else ""
+            output.write(f"[bold]{escape(event.migration)}[/] [dim]· {event.total} statements{attempt}[/]")
+
+    elif event.kind == "retry":
+        output.write(
+            f"[yellow]![/] {escape(event.migration)}: lock timeout "
+            f"(attempt {event.index}/{event.total}), rolled back · retrying in {event.elapsed:.1f}s"
+        )
+        output.write(f"[dim]  {escape(event.message)}[/]")
+
+    elif event.kind == "statement":
+        output.write(
+            f"[dim]  [{event.index}/{event.total}] {_fmt_elapsed(event.elapsed):>6}  "
+            f"{escape(_statement_preview(event.message))}[/]"
+        )
+
+    elif event.kind == "applied":
+        output.write(f"[green]✓[/] {escape(event.migration)} [dim]{_fmt_elapsed(event.elapsed)}[/]")
+
+    elif event.kind == "done" and not dry_run and event.total:
+        output.write(f"[green]✓[/] Applied {event.total} migration(s) in {_fmt_elapsed(event.elapsed)}.")
+
+    elif event.kind == "cancelled":
+        output.write(f"[yellow]![/] {escape(event.message)}")
+        if event.total:
+            output.write(f"[dim]{event.total} migration(s) were applied before cancelling[/]")
+
+    elif event.kind == "error":
+        output.write(f"[red]✗[/] {escape(event.message)}")
+        if event.total:
+            output.write(f"[dim]{event.total} migration(s) were applied before the failure[/]")
+
+
+def _parse_run_options(args: list[str]) -> tuple[list[str], dict, str | None]:
+    """Split --lock-timeout=/--statement-timeout=/--retries= out of args.
+
+    Returns (remaining args, run_migrations kwargs, error message).
+    """
+    rest: list[str] = []
+    opts: dict = {}
+    for arg in args:
+        name, sep, value = arg.partition("=")
+        if name not in _RUN_OPTIONS:
+            rest.append(arg)
+            continue
+        if not sep or not value:
+            return rest, opts, f"{name} needs a value, e.g. {name}=5s"
+        if name == "--retries":
+            if not value.isdigit():
+                return rest, opts, "--retries must be a whole number"
+            opts["retries"] = int(value)
+        elif not is_valid_timeout(value):
+            return rest, opts, f"Invalid {name} '{value}' (use e.g. 500ms, 5s, 2min, 0 for none)"
+        else:
+            opts[name.removeprefix("--").replace("-", "_")] = value
+    return rest, opts, None
+
 
 async def cmd_migrate(args: list[str], output: RichLog) -> None:
     """Handle migration commands."""
+    args, run_opts, error = _parse_run_options(args)
+    if error:
+        output.write(f"[red]✗[/] {escape(error)}")
+        return
     dry_run = "dry-run" in args or "dry_run" in args
     subcmd = (args[0].lower() if args else "run").strip()
     if subcmd in ("dry-run", "dry_run"):
@@ -63,16 +164,112 @@ async def cmd_migrate(args: list[str], output: RichLog) -> None:
         else:
             output.write(f"[red]✗[/] {msg}")
 
-    elif subcmd in ("run", "up", "") or dry_run:
-        success, msg = run_migrations(dry_run=dry_run)
-        if success:
-            output.write(f"[green]✓[/] {msg}")
+    elif subcmd == "verify":
+        if not supabase_configured():
+            output.write("[red]✗[/] SUPABASE_DB_URL not set")
+            return
+        accept = len(args) > 1 and args[1].lower() == "accept"
+        # psycopg2 blocks; keep the UI responsive while it talks to the database
+        ok, report = await asyncio.to_thread(verify_migrations, accept_unverified=accept)
+        if not ok or isinstance(report, str):
+            output.write(f"[red]✗[/] {escape(str(report))}")
+            return
+
+        table = Table(
+            show_header=True,
+            header_style="bold dim",
+            box=None,
+            padding=(0, 2),
+        )
+        table.add_column("Migration")
+        table.add_column("Problem")
+        for name in report.edited:
+            table.add_row(escape(name), "[red]✗ edited after apply[/]")
+        for name in report.missing:
+            table.add_row(escape(name), "[red]✗ applied, file missing[/]")
+        for name in report.out_of_order:
+            table.add_row(escape(name), "[yellow]! pending, sorts before applied[/]")
+        if table.row_count:
+            output.write(table)
+
+        if report.ok:
+            output.write(f"[green]✓[/] {report.verified} applied migration(s) match their files")
         else:
-            output.write(f"[red]✗[/] {msg}")
+            problems = len(report.edited) + len(report.missing) + len(report.out_of_order)
+            output.write(f"[red]✗[/] {problems} problem(s) · {report.verified} verified")
+        if report.unverified:
+            output.write(
+                f"[dim]{len(report.unverified)} applied before checksums were recorded · "
+                "'migrate verify accept' to record them from the current files[/]"
+            )
+
+    elif subcmd == "report":
+        if not supabase_configured():
+            output.write("[red]✗[/] SUPABASE_DB_URL not set")
+            return
+        limit = int(args[1]) if len(args) > 1 and args[1].isdigit() else 10
+        ok, timings = await asyncio.to_thread(migration_report, limit)
+        if not ok or isinstance(timings, str):
+            output.write(f"[red]✗[/] {escape(str(timings))}")
+            return
+        if not timings:
+            output.write("[dim]No migration timings recorded yet[/]")
+            return
+
+        table = Table(
+            show_header=True,
+            header_style="bold dim",
+            box=None,
+            padding=(0, 2),
+        )
+        table.add_column("Migration")
+        table.add_column("Slowest", justify="right")
+        table.add_column("Avg", justify="right")
+        table.add_column("Runs", justify="right")
+        table.add_column("Failed", justify="right")
+        table.add_column("Last run", style="dim")
+        for t in timings:
+            table.add_row(
+                escape(t.version),
+                _fmt_elapsed(t.slowest_ms / 1000) if t.runs else "[dim]-[/]",
+                _fmt_elapsed(t.avg_ms / 1000) if t.runs else "[dim]-[/]",
+                str(t.runs),
+                f"[yellow]{t.failed_attempts}[/]" if t.failed_attempts else "[dim]0[/]",
+                t.last_run.strftime("%Y-%m-%d %H:%M"),
+            )
+        output.write(table)
+
+    elif subcmd == "cancel":
+        run = current_run()
+        if run is None:
+            output.write("[dim]No migration running[/]")
+            return
+        run.cancel()
+        output.write("[yellow]![/] Cancelling migration run...")
+
+    elif subcmd in ("run", "up", "") or dry_run:
+        if current_run() is not None:
+            output.write("[yellow]![/] A migration run is already in progress")
+            return
+        run = run_migrations(dry_run=dry_run, **run_opts)
+        if not dry_run:
+            output.write(
+                f"[dim]lock_timeout {run.lock_timeout} · statement_timeout {run.statement_timeout} · "
+                f"{run.retries} lock retries[/]"
+            )
+        async for event in run.events():
+            _write_event(event, dry_run, output)
 
     else:
         output.write(f"[red]✗[/] Unknown: migrate {subcmd}")
-        output.write("[dim]Use: migrate · migrate status · migrate mark-applied 001-014 · migrate dry-run[/]")
+        output.write(
+            "[dim]Use: migrate · migrate status · migrate mark-applied 001-014 · "
+            "migrate dry-run · migrate verify · migrate report · migrate cancel[/]"
+        )
+        output.write(
+            f"[dim]Run options: --lock-timeout={DEFAULT_LOCK_TIMEOUT} "
+            f"--statement-timeout={DEFAULT_STATEMENT_TIMEOUT} --retries={DEFAULT_LOCK_RETRIES}[/]"
+        )
 
 
 async def cmd_supabase(args: list[str], output: RichLog) -> None:
@@ -3,22 +3,29 @@
 Handlers write output to a RichLog widget.
 """
 
-import shutil
-
+from rich.markup import escape
 from rich.table import Table
 from textual.widgets import RichLog
 
-from petehome_cli.config import PM2_PROCESSES, WEB_APP_PATH
+from petehome_cli.config import PM2_PROCESSES
+from petehome_cli.services import next_cache
 from petehome_cli.services.pm2 import PM2Service
 
-_NEXT_CACHE = WEB_APP_PATH / ".next"
-
 
 def _clear_next_cache(output: RichLog) -> None:
-    """Delete .next cache so NEXT_PUBLIC_* env changes take effect."""
-    if _NEXT_CACHE.exists():
-        shutil.rmtree(_NEXT_CACHE, ignore_errors=True)
-        output.write("[dim]Cleared .next cache[/]")
+    """Invalidate .next only when NEXT_PUBLIC_* values or yarn.lock changed."""
+    result = next_cache.invalidate()
+    if not result.changed or not (result.removed or result.error):
+        return
+    reason = "yarn.lock" if result.lock_changed else "NEXT_PUBLIC_* env"
+    if result.error:
+        output.write(
+            f"[yellow]![/] Couldn't fully clear .next ({reason} changed): "
+            f"{escape(result.error)} [dim]· retried on next start[/]"
+        )
+        return
+    kept = ", kept .next/cache" if result.kept_cache else ""
+    output.write(f"[dim]Cleared .next ({reason} changed{kept})[/]")
 
 
 def _resolve_service_name(name: str) -> str | None:
@@ -26,11 +26,19 @@ PM2_PROCESSES: dict[str, str] = {
 VERCEL_TOKEN = os.getenv("VERCEL_TOKEN", "")
 VERCEL_PROJECT_ID = os.getenv("VERCEL_PROJECT_ID", "")
 VERCEL_TEAM_ID = os.getenv("VERCEL_TEAM_ID", "")
+# Override to point at a local fake API; HTTP/2 needs `pip install httpx[http2]`
+VERCEL_API_BASE = os.getenv("VERCEL_API_BASE", "https://api.vercel.com")
+VERCEL_HTTP2 = os.getenv("VERCEL_HTTP2", "").lower() in ("1", "true")
 
 # Dev server settings
 DEV_SERVER_PORT = int(os.getenv("PORT", "3000"))
 DEV_SERVER_HOST = os.getenv("HOSTNAME", "0.0.0.0")
 
+# Blue/green local builds: .next is a symlink into NEXT_RELEASES_DIR
+NEXT_DIST_LINK = WEB_APP_PATH / ".next"
+NEXT_RELEASES_DIR = WEB_APP_PATH / ".next-releases"
+NEXT_RELEASES_KEEP = 3
+
 # Monitored ports for process cleanup
 MONITORED_PORTS: dict[str, dict[str, object]] = {
     "dev-server": {"base": 3000, "range": 5, "group": "web"},
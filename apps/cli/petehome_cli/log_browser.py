@@ -0,0 +1,158 @@
+"""Scrollable commit log browser.
+
+Commits are paged in from one long-running `git log -z` as the cursor nears
+the end of the table, so opening the browser costs one page regardless of
+history size. Selecting a row shows the commit message and per-file stats,
+looked up through a persistent `git cat-file --batch` process.
+"""
+
+from rich.console import Group
+from rich.markup import escape
+from rich.table import Table
+from textual import on, work
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.screen import Screen
+from textual.widgets import DataTable, Static
+
+from petehome_cli.config import REPO_ROOT
+from petehome_cli.services.git_log import CatFile, DiffTree, LogReader, commit_detail
+
+PAGE_SIZE = 100
+# Start loading the next page once the cursor is this close to the last row
+PREFETCH_ROWS = 20
+MAX_DETAIL_FILES = 60
+
+
+class LogBrowserScreen(Screen):
+    """Full-screen commit log with a detail pane for the highlighted commit."""
+
+    BINDINGS = [
+        ("escape", "dismiss", "Close"),
+        ("q", "dismiss", "Close"),
+    ]
+
+    DEFAULT_CSS = """
+    LogBrowserScreen {
+        background: $background;
+    }
+    #log-body {
+        height: 1fr;
+    }
+    #log-table {
+        width: 3fr;
+        border: round $primary;
+    }
+    #log-detail {
+        width: 2fr;
+        border: round $surface-lighten-2;
+        padding: 0 1;
+        overflow-y: auto;
+    }
+    #log-footer {
+        height: 1;
+        color: $text-muted;
+        padding: 0 1;
+    }
+    """
+
+    def __init__(self, rev: str = "HEAD") -> None:
+        super().__init__()
+        self._reader = LogReader(REPO_ROOT, rev)
+        self._cat = CatFile(REPO_ROOT)
+        self._diff_tree = DiffTree(REPO_ROOT)
+        self._loading = False
+
+    def compose(self) -> ComposeResult:
+        with Vertical():
+            with Horizontal(id="log-body"):
+                yield DataTable(id="log-table", cursor_type="row", zebra_stripes=True)
+                yield Static("[dim]Select a commit[/]", id="log-detail")
+            yield Static("", id="log-footer")
+
+    async def on_mount(self) -> None:
+        table = self.query_one("#log-table", DataTable)
+        table.add_columns("commit", "subject", "author", "when")
+        table.focus()
+        # Mouse-wheel scrolling doesn't move the cursor, so watch the viewport too
+        self.watch(table, "scroll_y", self._on_scroll, init=False)
+        await self._load_page()
+
+    async def on_unmount(self) -> None:
+        await self._reader.close()
+        await self._cat.close()
+        await self._diff_tree.close()
+
+    async def _load_page(self) -> None:
+        if self._loading or self._reader.exhausted:
+            return
+        self._loading = True
+        try:
+            commits = await self._reader.next_page(PAGE_SIZE)
+        finally:
+            self._loading = False
+
+        table = self.query_one("#log-table", DataTable)
+        for c in commits:
+            table.add_row(
+                f"[yellow]{c.short}[/]",
+                escape(c.subject[:72]),
+                escape(c.author),
+                f"[dim]{c.relative}[/]",
+                key=c.hash,
+            )
+        suffix = "" if self._reader.exhausted else "+"
+        self.query_one("#log-footer", Static).update(
+            f"[dim]{table.row_count}{suffix} commits · ↑↓ browse · enter details · esc close[/]"
+        )
+
+    @on(DataTable.RowHighlighted, "#log-table")
+    async def _on_highlight(self, event: DataTable.RowHighlighted) -> None:
+        if event.cursor_row >= event.data_table.row_count - PREFETCH_ROWS:
+            await self._load_page()
+
+    async def _on_scroll(self, scroll_y: float) -> None:
+        table = self.query_one("#log-table", DataTable)
+        if scroll_y + table.scrollable_content_region.height >= table.row_count - PREFETCH_ROWS:
+            await self._load_page()
+
+    @on(DataTable.RowSelected, "#log-table")
+    def _on_select(self, event: DataTable.RowSelected) -> None:
+        if event.row_key.value:
+            self._show_detail(event.row_key.value)
+
+    @work(exclusive=True, group="log-detail")
+    async def _show_detail(self, commit: str) -> None:
+        pane = self.query_one("#log-detail", Static)
+        detail = await commit_detail(self._cat, self._diff_tree, commit)
+        if detail is None:
+            pane.update(f"[red]✗[/] Could not read {commit[:12]}")
+            return
+
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column(style="green", justify="right")
+        table.add_column(style="red", justify="right")
+        table.add_column()
+        added = deleted = 0
+        for path, a, d in detail.files[:MAX_DETAIL_FILES]:
+            if a < 0:
+                table.add_row("bin", "", escape(path))
+                continue
+            table.add_row(f"+{a}", f"-{d}", escape(path))
+        for _path, a, d in detail.files:
+            added += max(a, 0)
+            deleted += max(d, 0)
+
+        parents = " ".join(p[:10] for p in detail.parents) or "(root)"
+        header = (
+            f"[bold yellow]{detail.hash[:12]}[/]\n"
+            f"[dim]author[/]  {escape(detail.author)}\n"
+            f"[dim]parents[/] {parents}\n\n"
+            f"{escape(detail.message)}\n\n"
+            f"[bold]{len(detail.files)}[/] files  "
+            f"[green]+{added}[/] [red]-{deleted}[/]"
+        )
+        if len(detail.files) > MAX_DETAIL_FILES:
+            header += f"  [dim](first {MAX_DETAIL_FILES} shown)[/]"
+
+        pane.update(Group(header, "", table))
@@ -0,0 +1,214 @@
+"""Local deployment history: SQLite cache of Vercel deployments.
+
+Reads are served straight from ~/.petehome/deployments.db, so history and
+build-duration stats work offline. sync() pulls only what is new since the
+last sync (plus anything still building) using the API's since/until
+pagination, and resumes any range an earlier sync didn't finish.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from petehome_cli.config import STATE_DIR
+from petehome_cli.services.vercel import TERMINAL_STATES, Deployment, VercelService
+
+DB_PATH: Path = STATE_DIR / "deployments.db"
+
+# Pages (of PAGE_SIZE) one sync fetches at most; the rest resume next sync
+MAX_BACKFILL_PAGES = 20
+PAGE_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deployments (
+    uid TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    ready_at INTEGER,
+    inspector_url TEXT
+);
+CREATE INDEX IF NOT EXISTS deployments_created ON deployments (created_at DESC);
+-- Ranges not fully fetched yet: created_at in (since, until]. NULL since is the
+-- start of history; NULL until means the walk hasn't started (i.e. from now).
+CREATE TABLE IF NOT EXISTS sync_gaps (
+    id INTEGER PRIMARY KEY,
+    since INTEGER,
+    until INTEGER
+);
+"""
+
+
+def _ms(dt: datetime | None) -> int | None:
+    return int(dt.timestamp() * 1000) if dt else None
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Linear-interpolated percentile (0-100) of a non-empty list."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * p / 100
+    lo = int(rank)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+
+@dataclass
+class DurationStats:
+    """Build-duration summary for a window of READY deployments."""
+
+    count: int
+    p50: float
+    p90: float
+    p95: float
+    max: float
+
+
+class DeploymentHistory:
+    """SQLite-backed deployment history with incremental Vercel sync."""
+
+    def __init__(self, db_path: Path = DB_PATH) -> None:
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    # -- Write ---------------------------------------------------------------
+
+    def upsert(self, deployments: list[Deployment]) -> int:
+        """Insert or update deployments; returns how many were new."""
+        before = self.count()
+        self.conn.executemany(
+            """
+            INSERT INTO deployments (uid, name, url, state, created_at, ready_at, inspector_url)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (uid) DO UPDATE SET
+                state = excluded.state,
+                ready_at = excluded.ready_at,
+                inspector_url = excluded.inspector_url
+            """,
+            [
+                (d.uid, d.name, d.url, d.state, _ms(d.created_at), _ms(d.ready_at), d.inspector_url)
+                for d in deployments
+            ],
+        )
+        self.conn.commit()
+        return self.count() - before
+
+    async def sync(self, vercel: VercelService) -> tuple[bool, int]:
+        """Fetch deployments created since the last sync. Returns (ok, new rows).
+
+        The lower bound is the oldest still-unfinished deployment we know of
+        (so its final state gets recorded) or else the newest one stored;
+        on an empty store it is the start of history. That range is saved
+        as a gap, and every open gap is walked newest-first, saving the
+        ``until`` reached after each page. A sync cut short (timeout,
+        offline, MAX_BACKFILL_PAGES) leaves its gap open, and the next sync
+        resumes it rather than skipping the older deployments.
+        """
+        row = self.conn.execute(
+            f"SELECT MIN(created_at) FROM deployments WHERE state NOT IN "
+            f"({', '.join('?' * len(TERMINAL_STATES))})",
+            tuple(TERMINAL_STATES),
+        ).fetchone()
+        since = row[0]
+        if since is None:
+            since = self.conn.execute("SELECT MAX(created_at) FROM deployments").fetchone()[0]
+        self._open_head_gap(since)
+
+        new = 0
+        pages = 0
+        gaps = self.conn.execute(
+            "SELECT id, since, until FROM sync_gaps ORDER BY until IS NOT NULL, until DESC"
+        ).fetchall()
+        for gap_id, gap_since, until in gaps:
+            while True:
+                if pages >= MAX_BACKFILL_PAGES:
+                    return True, new
+                page = await vercel.get_deployments_page(limit=PAGE_SIZE, since=gap_since, until=until)
+                pages += 1
+                if page is None:
+                    return False, new
+                deployments, until = page
+                new += self.upsert(deployments)
+                if not deployments or until is None:
+                    self.conn.execute("DELETE FROM sync_gaps WHERE id = ?", (gap_id,))
+                    self.conn.commit()
+                    break
+                self.conn.execute("UPDATE sync_gaps SET until = ? WHERE id = ?", (until, gap_id))
+                self.conn.commit()
+        return True, new
+
+    def _open_head_gap(self, since: int | None) -> None:
+        """Record (since, now] as unfetched, merged with an earlier one that never started."""
+        for (pending,) in self.conn.execute("SELECT since FROM sync_gaps WHERE until IS NULL").fetchall():
+            since = None if pending is None or since is None else min(since, pending)
+        self.conn.execute("DELETE FROM sync_gaps WHERE until IS NULL")
+        self.conn.execute("INSERT INTO sync_gaps (since, until) VALUES (?, NULL)", (since,))
+        self.conn.commit()
+
+    # -- Read ----------------------------------------------------------------
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM deployments").fetchone()[0]
+
+    def page(self, page: int = 1, per_page: int = 15) -> list[Deployment]:
+        """Return one page of stored deployments, newest first (page is 1-based)."""
+        rows = self.conn.execute(
+            """
+            SELECT uid, name, url, state, created_at, ready_at, inspector_url
+            FROM deployments ORDER BY created_at DESC LIMIT ? OFFSET ?
+            """,
+            (per_page, (max(page, 1) - 1) * per_page),
+        ).fetchall()
+        return [
+            Deployment(
+                uid=uid,
+                name=name,
+                url=url,
+                state=state,
+                created_at=datetime.fromtimestamp(created / 1000),
+                ready_at=datetime.fromtimestamp(ready / 1000) if ready else None,
+                inspector_url=inspector_url,
+            )
+            for uid, name, url, state, created, ready, inspector_url in rows
+        ]
+
+    def durations(self, limit: int, offset: int = 0) -> list[float]:
+        """Build durations (seconds) of READY deployments, newest first."""
+        rows = self.conn.execute(
+            """
+            SELECT (ready_at - created_at) / 1000.0 FROM deployments
+            WHERE state = 'READY' AND ready_at IS NOT NULL
+            ORDER BY created_at DESC LIMIT ? OFFSET ?
+            """,
+            (limit, offset),
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def duration_stats(self, limit: int, offset: int = 0) -> DurationStats | None:
+        """Percentiles over a window of READY deployments (None if empty)."""
+        values = self.durations(limit, offset)
+        if not values:
+            return None
+        return DurationStats(
+            count=len(values),
+            p50=percentile(values, 50),
+            p90=percentile(values, 90),
+            p95=percentile(values, 95),
+            max=max(values),
+        )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,9 +1,45 @@
 """Development server management service."""
 
+import asyncio
+import contextlib
+import os
+import shutil
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
 
-from petehome_cli.config import REPO_ROOT
-from petehome_cli.services.process import run_command, stream_command
+from petehome_cli.config import (
+    NEXT_DIST_LINK,
+    NEXT_RELEASES_DIR,
+    NEXT_RELEASES_KEEP,
+    REPO_ROOT,
+    WEB_APP_PATH,
+)
+from petehome_cli.services.process import IS_WINDOWS, run_command, stream_command
+
+TSCONFIG: Path = WEB_APP_PATH / "tsconfig.json"
+
+
+@dataclass
+class Release:
+    """A blue/green build output under .next-releases."""
+
+    release_id: str
+    path: Path
+    active: bool = False
+
+    @property
+    def built_at(self) -> datetime | None:
+        try:
+            return datetime.strptime(self.release_id, "%Y%m%d-%H%M%S")
+        except ValueError:
+            return None
+
+    @property
+    def is_complete(self) -> bool:
+        """Next writes BUILD_ID last, so its presence means the build finished."""
+        return (self.path / "BUILD_ID").exists()
 
 
 class DevServerService:
@@ -66,3 +102,210 @@ class DevServerService:
         """Run sync worker once."""
         async for line in self.run_yarn_command("sync"):
             yield line
+
+    # -- Blue/green builds ---------------------------------------------------
+
+    def list_releases(self) -> list[Release]:
+        """List completed builds, newest first."""
+        if not NEXT_RELEASES_DIR.exists():
+            return []
+        active = self.active_release_path()
+        releases = [
+            Release(release_id=p.name, path=p, active=p == active)
+            for p in NEXT_RELEASES_DIR.iterdir()
+            if p.is_dir()
+        ]
+        releases = [r for r in releases if r.is_complete]
+        releases.sort(key=lambda r: r.release_id, reverse=True)
+        return releases
+
+    def active_release_path(self) -> Path | None:
+        """Return the release .next currently points at, if it is a link."""
+        if not is_release_link(NEXT_DIST_LINK):
+            return None
+        return Path(os.path.realpath(NEXT_DIST_LINK))
+
+    def _adopt_existing_build(self) -> None:
+        """Move a plain .next directory into the releases dir.
+
+        A finished production build becomes a normal release (so it can be
+        rolled back to); anything else (e.g. ``next dev`` output) is parked
+        as ``stale-*`` and removed by prune_releases().
+        """
+        if not NEXT_DIST_LINK.is_dir() or self.active_release_path() is not None:
+            return
+        NEXT_RELEASES_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.fromtimestamp(NEXT_DIST_LINK.stat().st_mtime).strftime("%Y%m%d-%H%M%S")
+        if (NEXT_DIST_LINK / "BUILD_ID").exists():
+            target = NEXT_RELEASES_DIR / stamp
+        else:
+            target = NEXT_RELEASES_DIR / f"stale-{stamp}"
+        if target.exists():
+            target = target.with_name(f"{target.name}-{os.getpid()}")
+        NEXT_DIST_LINK.rename(target)
+
+    async def build_release(self) -> AsyncIterator[str]:
+        """Build the web app into a fresh release dir while .next keeps serving.
+
+        The last yielded line is ``release:<id>`` on success. Nothing is
+        swapped here -- call activate_release() once the build is done. A
+        failed or abandoned build leaves nothing behind.
+        """
+        release_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+        dist = NEXT_RELEASES_DIR / release_id
+        NEXT_RELEASES_DIR.mkdir(parents=True, exist_ok=True)
+        dist_dir = dist.relative_to(WEB_APP_PATH).as_posix()
+        tsconfig = _read_bytes(TSCONFIG)
+        complete = False
+        try:
+            # aclosing: stop yarn before the release dir is removed
+            async with contextlib.aclosing(self._build_into(dist, dist_dir)) as lines:
+                async for line in lines:
+                    yield line
+            complete = Release(release_id=release_id, path=dist).is_complete
+        finally:
+            # Next adds "<distDir>/types/**/*.ts" to tsconfig.json for any
+            # custom distDir; a per-release path there is just churn
+            _restore_tsconfig(tsconfig, dist_dir)
+            if not complete:
+                shutil.rmtree(dist, ignore_errors=True)
+        if complete:
+            yield f"release:{release_id}"
+
+    async def _build_into(self, dist: Path, dist_dir: str) -> AsyncIterator[str]:
+        """Seed the build cache, then run `yarn build` with distDir set to *dist*."""
+        # Start from the serving build's incremental cache so the build isn't cold.
+        # Copied, not hardlinked: Next rewrites some cache files in place, which
+        # would corrupt the active release through the shared inode.
+        cache = NEXT_DIST_LINK / "cache"
+        if cache.is_dir():
+            yield "Seeding build cache from the active release..."
+            try:
+                await asyncio.to_thread(shutil.copytree, cache, dist / "cache", symlinks=True)
+            except (OSError, shutil.Error) as e:
+                shutil.rmtree(dist / "cache", ignore_errors=True)
+                yield f"Cache not seeded, building cold: {e}"
+
+        async for line in stream_command(
+            "yarn", "build",
+            cwd=WEB_APP_PATH,
+            env={"NEXT_DIST_DIR": dist_dir},
+            kill_tree=True,
+        ):
+            yield line
+
+    def activate_release(self, release_id: str) -> tuple[bool, str]:
+        """Atomically repoint .next at a completed release."""
+        target = NEXT_RELEASES_DIR / release_id
+        if not Release(release_id=release_id, path=target).is_complete:
+            return False, f"Release {release_id} not found or incomplete"
+
+        try:
+            self._adopt_existing_build()
+            _point_link(NEXT_DIST_LINK, target)
+        except OSError as e:
+            return False, str(e)
+        return True, release_id
+
+    def deactivate_release(self) -> tuple[bool, str]:
+        """Remove the .next link so the web app runs from its own .next again.
+
+        The release itself is kept (it can be swapped back in). With no
+        link, pm2-start-https.js starts the dev server instead of serving
+        the release.
+        """
+        active = self.active_release_path()
+        if active is None:
+            return False, "No release is active"
+        try:
+            if _is_junction(NEXT_DIST_LINK):
+                os.rmdir(NEXT_DIST_LINK)
+            else:
+                NEXT_DIST_LINK.unlink()
+        except OSError as e:
+            return False, str(e)
+        return True, active.name
+
+    def previous_release(self) -> Release | None:
+        """The newest completed release older than the active one."""
+        releases = self.list_releases()
+        active = next((r for r in releases if r.active), None)
+        for r in releases:
+            if r.active:
+                continue
+            if active is None or r.release_id < active.release_id:
+                return r
+        return None
+
+    def prune_releases(self, keep: int = NEXT_RELEASES_KEEP) -> list[str]:
+        """Delete old releases, never touching the active one."""
+        removed: list[str] = []
+        if NEXT_RELEASES_DIR.exists():
+            for p in NEXT_RELEASES_DIR.glob("stale-*"):
+                shutil.rmtree(p, ignore_errors=True)
+                removed.append(p.name)
+        for r in self.list_releases()[keep:]:
+            if r.active:
+                continue
+            shutil.rmtree(r.path, ignore_errors=True)
+            removed.append(r.release_id)
+        return removed
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _restore_tsconfig(before: bytes | None, dist_dir: str) -> None:
+    """Put back tsconfig.json as it was before a release build (*before*).
+
+    Only if the file now mentions that build's distDir, i.e. Next edited it.
+    """
+    after = _read_bytes(TSCONFIG)
+    if before is None or after is None or after == before or dist_dir.encode() not in after:
+        return
+    try:
+        TSCONFIG.write_bytes(before)
+    except OSError:
+        pass
+
+
+def _is_junction(path: Path) -> bool:
+    is_junction = getattr(os.path, "isjunction", None)
+    return bool(is_junction and is_junction(path))
+
+
+def is_release_link(path: Path) -> bool:
+    """True if ``path`` is a link to a release (a symlink, or a junction on Windows)."""
+    return path.is_symlink() or _is_junction(path)
+
+
+def _point_link(link: Path, target: Path) -> None:
+    """Point ``link`` at ``target`` with a single rename where the OS allows it.
+
+    POSIX: build a temp symlink beside the link and os.replace() it over the
+    old one, so readers always see either the old or the new build.
+    Windows: symlinks need developer mode, so fall back to a directory
+    junction; junctions can't be replaced in place, leaving a sub-ms gap.
+    """
+    if not IS_WINDOWS:
+        tmp = link.with_name(f"{link.name}.swap-{os.getpid()}")
+        if tmp.is_symlink():
+            tmp.unlink()
+        os.symlink(os.path.relpath(target, link.parent), tmp, target_is_directory=True)
+        os.replace(tmp, link)
+        return
+
+    if _is_junction(link):
+        os.rmdir(link)
+    elif link.is_symlink():
+        link.unlink()
+    try:
+        os.symlink(target, link, target_is_directory=True)
+    except OSError:
+        import _winapi
+
+        _winapi.CreateJunction(str(target), str(link))
@@ -0,0 +1,229 @@
+"""Streaming git log reader and persistent object lookups.
+
+LogReader keeps a single `git log -z` process open and pulls commits from
+it a page at a time, so scrolling further back never re-forks git. Fields
+are separated by \\x1f and records by NUL, so subjects containing `|` or
+any other punctuation parse cleanly.
+
+CatFile wraps one `git cat-file --batch` process for commit lookups, and
+DiffTree one `git diff-tree --stdin` process for per-commit file stats, so
+selecting commits in the log browser never forks git either.
+"""
+
+import asyncio
+import contextlib
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from petehome_cli.services.process import spawn
+
+_FIELD_SEP = "\x1f"
+LOG_FORMAT = _FIELD_SEP.join(("%H", "%h", "%an", "%at", "%ar", "%s"))
+
+
+@dataclass
+class CommitInfo:
+    """One commit from the log stream."""
+
+    hash: str
+    short: str
+    author: str
+    timestamp: datetime
+    relative: str
+    subject: str
+
+
+@dataclass
+class CommitDetail:
+    """Full commit object plus per-file stats."""
+
+    hash: str
+    parents: list[str]
+    author: str
+    message: str
+    files: list[tuple[str, int, int]]  # path, added, deleted (-1 for binary)
+
+
+def parse_log_record(record: str) -> CommitInfo | None:
+    parts = record.lstrip("\n").split(_FIELD_SEP, 5)
+    if len(parts) != 6:
+        return None
+    full, short, author, at, relative, subject = parts
+    return CommitInfo(
+        hash=full,
+        short=short,
+        author=author,
+        timestamp=datetime.fromtimestamp(int(at)),
+        relative=relative,
+        subject=subject,
+    )
+
+
+class LogReader:
+    """Pages commits out of one long-running `git log -z` process."""
+
+    def __init__(self, cwd: str | Path, rev: str = "HEAD") -> None:
+        self.cwd = cwd
+        self.rev = rev
+        self.exhausted = False
+        self._proc: asyncio.subprocess.Process | None = None
+
+    async def next_page(self, count: int = 100) -> list[CommitInfo]:
+        """Read up to ``count`` more commits (fewer at the end of history)."""
+        if self.exhausted:
+            return []
+        if self._proc is None:
+            self._proc = await spawn(
+                "git", "log", "-z", f"--format={LOG_FORMAT}", self.rev,
+                cwd=self.cwd,
+            )
+
+        assert self._proc.stdout is not None
+        commits: list[CommitInfo] = []
+        while len(commits) < count:
+            try:
+                raw = await self._proc.stdout.readuntil(b"\0")
+            except asyncio.IncompleteReadError as e:
+                raw = e.partial
+                self.exhausted = True
+            record = raw.rstrip(b"\0").decode("utf-8", errors="replace")
+            commit = parse_log_record(record) if record else None
+            if commit:
+                commits.append(commit)
+            if self.exhausted:
+                await self.close()
+                break
+        return commits
+
+    async def close(self) -> None:
+        if self._proc is not None and self._proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                self._proc.kill()
+            await self._proc.wait()
+        self._proc = None
+
+
+class _BatchProcess:
+    """A persistent git process answering one request per stdin line.
+
+    Requests are serialized. If one is interrupted (e.g. a cancelled
+    worker) the process is killed rather than left with a half-read
+    reply, and the next request starts a fresh one.
+    """
+
+    ARGS: tuple[str, ...] = ()
+
+    def __init__(self, cwd: str | Path) -> None:
+        self.cwd = cwd
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    async def _request(self, line: bytes, read_reply):
+        async with self._lock:
+            if self._proc is None or self._proc.returncode is not None:
+                self._proc = await spawn(*self.ARGS, cwd=self.cwd)
+            assert self._proc.stdin is not None and self._proc.stdout is not None
+            try:
+                self._proc.stdin.write(line)
+                await self._proc.stdin.drain()
+                return await read_reply(self._proc.stdout)
+            except BaseException:
+                await self.close()
+                raise
+
+    async def close(self) -> None:
+        if self._proc is not None and self._proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                self._proc.kill()
+            await self._proc.wait()
+        self._proc = None
+
+
+class CatFile(_BatchProcess):
+    """One persistent `git cat-file --batch` process."""
+
+    ARGS = ("git", "cat-file", "--batch")
+
+    async def read(self, obj: str) -> tuple[str, str, bytes] | None:
+        """Return (sha, type, content) for an object name, or None if missing."""
+
+        async def reply(stdout: asyncio.StreamReader) -> tuple[str, str, bytes] | None:
+            header = (await stdout.readline()).decode().split()
+            if len(header) != 3:
+                return None  # "<obj> missing" / "ambiguous"
+            sha, obj_type, size = header
+            body = await stdout.readexactly(int(size) + 1)
+            return sha, obj_type, body[:-1]
+
+        return await self._request(obj.encode() + b"\n", reply)
+
+
+class DiffTree(_BatchProcess):
+    """One persistent `git diff-tree --stdin` process for per-commit numstat.
+
+    diff-tree echoes (and flushes) any stdin line that isn't an object id,
+    so a sentinel line after each commit marks the end of its records.
+    """
+
+    ARGS = ("git", "diff-tree", "--stdin", "--no-commit-id", "--numstat", "-r", "-z", "--root")
+
+    def __init__(self, cwd: str | Path) -> None:
+        super().__init__(cwd)
+        self._sentinel = f"::end-{uuid.uuid4().hex}::\n".encode()
+
+    async def numstat(self, sha: str) -> list[tuple[str, int, int]]:
+        """(path, added, deleted) per file changed by a commit (-1 for binary)."""
+
+        async def reply(stdout: asyncio.StreamReader) -> bytes:
+            return (await stdout.readuntil(self._sentinel))[: -len(self._sentinel)]
+
+        raw = await self._request(f"{sha}\n".encode() + self._sentinel, reply)
+        return parse_numstat_z(raw.decode("utf-8", errors="replace"))
+
+
+def parse_numstat_z(text: str) -> list[tuple[str, int, int]]:
+    """Parse `--numstat -z` records; renames carry the new path in a third field."""
+    files: list[tuple[str, int, int]] = []
+    records = text.split("\0")
+    i = 0
+    while i < len(records):
+        rec = records[i]
+        i += 1
+        if not rec.strip():
+            continue
+        added, deleted, path = rec.split("\t", 2)
+        if not path:
+            path = records[i + 1]
+            i += 2
+        binary = added == "-"
+        files.append((path, -1 if binary else int(added), -1 if binary else int(deleted)))
+    return files
+
+
+async def commit_detail(cat: CatFile, diff_tree: DiffTree, commit: str) -> CommitDetail | None:
+    """Commit metadata and per-file numstat, both from persistent git processes."""
+    obj = await cat.read(commit)
+    if not obj or obj[1] != "commit":
+        return None
+
+    sha = obj[0]
+    text = obj[2].decode("utf-8", errors="replace")
+    headers, _, message = text.partition("\n\n")
+    parents: list[str] = []
+    author = ""
+    for line in headers.splitlines():
+        key, _, value = line.partition(" ")
+        if key == "parent":
+            parents.append(value)
+        elif key == "author":
+            author = value.rsplit(" ", 2)[0]
+
+    return CommitDetail(
+        hash=sha,
+        parents=parents,
+        author=author,
+        message=message.strip(),
+        files=await diff_tree.numstat(sha),
+    )
@@ -0,0 +1,452 @@
+"""One-shot git status engine.
+
+A single `git status --porcelain=v2 --branch -z` call gives branch, upstream,
+ahead/behind, renames and conflicts. NUL-separated records mean paths with
+spaces, quotes or newlines come through untouched.
+
+StatusCache keeps the last snapshot per repo in memory. It is keyed on the
+mtimes of .git/HEAD, index, packed-refs and the branch/upstream ref files,
+and -- when the optional `watchfiles` package is installed -- a watcher on
+the working tree marks it dirty on any edit. Without the watcher, cached
+snapshots are only trusted for FALLBACK_TTL seconds.
+
+Kept in sync with armhr_cli/services/git_status.py.
+"""
+
+import asyncio
+import contextlib
+import os
+import signal
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from petehome_cli.services.process import run_command
+
+try:
+    import watchfiles
+except ImportError:  # optional: pip install watchfiles
+    watchfiles = None
+
+FALLBACK_TTL = 2.0
+
+# Build output, caches and logs that churn while dev servers run. git
+# ignores them, so their events never change the status; on top of
+# watchfiles' defaults (.git, node_modules, .venv, ...) and the directories
+# the repo's .gitignore names.
+WATCH_IGNORE_DIRS: tuple[str, ...] = (
+    ".next", ".next-releases", ".turbo", ".vercel", ".cache",
+    "logs", "coverage", "dist", "out",
+)
+
+STATUS_ARGS: tuple[str, ...] = (
+    "git", "--no-optional-locks", "status",
+    "--porcelain=v2", "--branch", "-z",
+)
+
+
+@dataclass
+class StatusSnapshot:
+    """Parsed porcelain v2 status."""
+
+    branch: str = ""
+    oid: str | None = None
+    upstream: str | None = None
+    ahead: int = 0
+    behind: int = 0
+    staged: list[str] = field(default_factory=list)
+    unstaged: list[str] = field(default_factory=list)
+    untracked: list[str] = field(default_factory=list)
+    conflicted: list[str] = field(default_factory=list)
+    renamed: dict[str, str] = field(default_factory=dict)  # new path -> original path
+
+
+def parse_porcelain_v2(data: str) -> StatusSnapshot:
+    """Parse `git status --porcelain=v2 --branch -z` output."""
+    snap = StatusSnapshot()
+    records = data.split("\0")
+    i = 0
+    while i < len(records):
+        rec = records[i]
+        i += 1
+        if not rec:
+            continue
+
+        kind = rec[0]
+        if kind == "#":
+            _, key, *rest = rec.split(" ", 2)
+            value = rest[0] if rest else ""
+            if key == "branch.head":
+                snap.branch = value
+            elif key == "branch.oid":
+                snap.oid = None if value == "(initial)" else value
+            elif key == "branch.upstream":
+                snap.upstream = value
+            elif key == "branch.ab":
+                ahead, behind = value.split()
+                snap.ahead, snap.behind = int(ahead), abs(int(behind))
+
+        elif kind == "1":
+            # 1 XY sub mH mI mW hH hI path
+            parts = rec.split(" ", 8)
+            _add_change(snap, parts[1], parts[8])
+
+        elif kind == "2":
+            # 2 XY sub mH mI mW hH hI Xscore path, then origPath as its own record
+            parts = rec.split(" ", 9)
+            path = parts[9]
+            orig = records[i] if i < len(records) else ""
+            i += 1
+            snap.renamed[path] = orig
+            _add_change(snap, parts[1], path)
+
+        elif kind == "u":
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            snap.conflicted.append(rec.split(" ", 10)[10])
+
+        elif kind == "?":
+            snap.untracked.append(rec[2:])
+
+    return snap
+
+
+def _add_change(snap: StatusSnapshot, xy: str, path: str) -> None:
+    if xy[0] != ".":
+        snap.staged.append(path)
+    if xy[1] != ".":
+        snap.unstaged.append(path)
+
+
+async def read_status(cwd: str | Path) -> StatusSnapshot | None:
+    """Run one porcelain v2 status in ``cwd``; None if it isn't a git repo."""
+    code, stdout, _ = await run_command(*STATUS_ARGS, cwd=cwd)
+    if code != 0:
+        return None
+    return parse_porcelain_v2(stdout)
+
+
+def _git_dir(cwd: Path) -> Path:
+    """Resolve the git dir, following the `gitdir:` pointer used by worktrees."""
+    dot_git = cwd / ".git"
+    if dot_git.is_file():
+        text = dot_git.read_text(encoding="utf-8", errors="replace").strip()
+        if text.startswith("gitdir:"):
+            return (cwd / text[len("gitdir:"):].strip()).resolve()
+    return dot_git
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+class StatusCache:
+    """In-memory status for one repo, refreshed only when something changed."""
+
+    def __init__(self, cwd: str | Path) -> None:
+        self.cwd = Path(cwd)
+        self.git_dir = _git_dir(self.cwd)
+        self.snapshot: StatusSnapshot | None = None
+        self.refreshed_at: float = 0.0
+        self._key: tuple[int, ...] | None = None
+        self._dirty = True
+        self._lock = asyncio.Lock()
+        self._watch_task: asyncio.Task | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def watching(self) -> bool:
+        return self._watch_task is not None and not self._watch_task.done()
+
+    @property
+    def common_dir(self) -> Path:
+        """Dir holding refs/packed-refs/FETCH_HEAD (differs from git_dir in worktrees)."""
+        commondir = self.git_dir / "commondir"
+        if commondir.exists():
+            return (self.git_dir / commondir.read_text().strip()).resolve()
+        return self.git_dir
+
+    def fetch_age(self) -> float | None:
+        """Seconds since the last `git fetch` (from FETCH_HEAD), or None if never."""
+        mtime = _mtime(self.common_dir / "FETCH_HEAD")
+        if not mtime:
+            return None
+        return max(0.0, time.time() - mtime / 1e9)
+
+    def _fs_key(self) -> tuple[int, ...]:
+        common = self.common_dir
+        paths = [
+            self.git_dir / "HEAD",
+            self.git_dir / "index",
+            common / "packed-refs",
+            common / "refs" / "heads",
+        ]
+        if self.snapshot and self.snapshot.branch:
+            paths.append(common / "refs" / "heads" / self.snapshot.branch)
+        if self.snapshot and self.snapshot.upstream:
+            paths.append(common / "refs" / "remotes" / self.snapshot.upstream)
+        return tuple(_mtime(p) for p in paths)
+
+    def is_fresh(self) -> bool:
+        """True if the cached snapshot can be served without running git."""
+        if self.snapshot is None or self._dirty:
+            return False
+        if self._fs_key() != self._key:
+            return False
+        if self.watching:
+            return True
+        return time.monotonic() - self.refreshed_at < FALLBACK_TTL
+
+    async def get(self, fresh: bool = False) -> StatusSnapshot | None:
+        """Return the status, running git only if the cache is stale."""
+        self.start_watching()
+        async with self._lock:
+            if not fresh and self.is_fresh():
+                return self.snapshot
+            # Clear before running git so edits made mid-scan re-dirty it
+            self._dirty = False
+            snap = await read_status(self.cwd)
+            self.snapshot = snap
+            self.refreshed_at = time.monotonic()
+            self._key = self._fs_key()
+            return snap
+
+    def invalidate(self) -> None:
+        """Mark the cache stale and notify listeners."""
+        self._dirty = True
+        for listener in list(self._listeners):
+            listener()
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` whenever the repo changes (e.g. for a live indicator)."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        with contextlib.suppress(ValueError):
+            self._listeners.remove(callback)
+
+    def start_watching(self) -> None:
+        """Start the working-tree watcher if watchfiles is available."""
+        if watchfiles is None or self.watching:
+            return
+        try:
+            self._watch_task = asyncio.get_running_loop().create_task(self._watch())
+        except RuntimeError:
+            pass
+
+    async def _watch(self) -> None:
+        # git-internal changes are covered by _fs_key() instead
+        try:
+            async for _changes in watchfiles.awatch(
+                self.cwd,
+                watch_filter=_worktree_filter(self.cwd),
+                debounce=200,
+                recursive=True,
+            ):
+                self.invalidate()
+        except Exception:
+            # e.g. inotify watch limit hit -- fall back to TTL-based caching
+            self._dirty = True
+
+    def stop_watching(self) -> None:
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+
+
+def _gitignored_dirs(root: Path) -> set[str]:
+    """Plain directory names (``name/``) from the repo's top-level .gitignore."""
+    try:
+        lines = (root / ".gitignore").read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return set()
+    names: set[str] = set()
+    for line in lines:
+        line = line.strip()
+        if not line.endswith("/") or line.startswith(("#", "!")):
+            continue
+        name = line.strip("/")
+        if name and "/" not in name and not any(c in name for c in "*?[\\"):
+            names.add(name)
+    return names
+
+
+def _worktree_filter(root: Path) -> Callable[[object, str], bool]:
+    """watch_filter that drops events under ignored directories of ``root``.
+
+    Only path components below ``root`` are matched, so a checkout that
+    itself lives under e.g. ``build/`` is still watched.
+    """
+    default = watchfiles.DefaultFilter()
+    ignored = {*default.ignore_dirs, *WATCH_IGNORE_DIRS, *_gitignored_dirs(root)}
+    prefix = str(root) + os.sep
+
+    def accept(change: object, path: str) -> bool:
+        rel = path[len(prefix):] if path.startswith(prefix) else path
+        if any(part in ignored for part in rel.split(os.sep)):
+            return False
+        return default(change, rel)
+
+    return accept
+
+
+_caches: dict[Path, StatusCache] = {}
+
+
+def status_cache(cwd: str | Path) -> StatusCache:
+    """Return the shared StatusCache for a repo (one per path per session)."""
+    key = Path(cwd).resolve()
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = StatusCache(key)
+    return cache
+
+
+@dataclass
+class _RepoSchedule:
+    """When one repo is next fetched, and how its interval has adapted."""
+
+    interval: float
+    due: float  # time.monotonic()
+    failures: int = 0
+
+
+class FetchScheduler:
+    """Runs `git fetch --prune` in the background so ahead/behind stay current.
+
+    Each registered repo has its own interval: it shrinks while fetches keep
+    bringing in new refs, grows while they don't, and backs off
+    exponentially while that repo's fetches fail (offline, auth, ...), so
+    one broken remote doesn't hold back the others. Repos that come due
+    together are fetched concurrently, and concurrent requests for the
+    same repo share one in-flight fetch.
+    """
+
+    BASE_INTERVAL = 300.0
+    MIN_INTERVAL = 120.0
+    MAX_INTERVAL = 900.0
+    MAX_BACKOFF = 1800.0
+    INITIAL_DELAY = 5.0
+    TIMEOUT = 60.0
+
+    def __init__(self) -> None:
+        self.repos: dict[Path, _RepoSchedule] = {}
+        self._task: asyncio.Task | None = None
+        self._inflight: dict[Path, asyncio.Task] = {}
+        self._wake = asyncio.Event()
+
+    def add(self, cwd: str | Path) -> None:
+        """Register a repo and make sure the scheduler loop is running."""
+        key = Path(cwd).resolve()
+        if key not in self.repos:
+            self.repos[key] = _RepoSchedule(
+                interval=self.BASE_INTERVAL,
+                due=time.monotonic() + self.INITIAL_DELAY,
+            )
+            self._wake.set()
+        if self._task is None or self._task.done():
+            try:
+                self._task = asyncio.get_running_loop().create_task(self._run())
+            except RuntimeError:
+                pass
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            now = time.monotonic()
+            due = sorted(p for p, sched in self.repos.items() if sched.due <= now)
+            if due:
+                await self._fetch_and_schedule(due)
+                continue
+            self._wake.clear()
+            next_due = min((sched.due for sched in self.repos.values()), default=now + self.BASE_INTERVAL)
+            # add() wakes this early so a new repo isn't stuck behind a long backoff
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=max(next_due - now, 0.0))
+
+    async def fetch_all(self) -> dict[Path, bool]:
+        """Fetch every registered repo now, concurrently, and reschedule each."""
+        return await self._fetch_and_schedule(sorted(self.repos))
+
+    async def _fetch_and_schedule(self, repos: list[Path]) -> dict[Path, bool]:
+        results = await asyncio.gather(*(self.fetch(p) for p in repos))
+        for path, (ok, changed) in zip(repos, results):
+            sched = self.repos.get(path)
+            if sched is not None:
+                self._adapt(sched, ok, changed)
+        return {p: r[0] for p, r in zip(repos, results)}
+
+    def _adapt(self, sched: _RepoSchedule, ok: bool, changed: bool) -> None:
+        if not ok:
+            sched.failures += 1
+            sched.interval = min(self.BASE_INTERVAL * 2**sched.failures, self.MAX_BACKOFF)
+        elif sched.failures:
+            sched.failures = 0
+            sched.interval = self.BASE_INTERVAL
+        elif changed:
+            sched.interval = max(sched.interval / 2, self.MIN_INTERVAL)
+        else:
+            sched.interval = min(sched.interval * 1.5, self.MAX_INTERVAL)
+        sched.due = time.monotonic() + sched.interval
+
+    async def fetch(self, cwd: str | Path) -> tuple[bool, bool]:
+        """Fetch one repo, joining a fetch already in flight. Returns (ok, refs changed)."""
+        key = Path(cwd).resolve()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._fetch_one(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_one(self, cwd: Path) -> tuple[bool, bool]:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git", "fetch", "--prune", "--no-progress",
+                cwd=cwd,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                # Own process group, so a kill also takes ssh / remote helpers with it
+                start_new_session=True,
+            )
+        except OSError:
+            return False, False
+        try:
+            _, stderr_bytes = await asyncio.wait_for(proc.communicate(), timeout=self.TIMEOUT)
+        except asyncio.TimeoutError:
+            await _kill_fetch(proc)
+            return False, False
+        except asyncio.CancelledError:
+            await _kill_fetch(proc)
+            raise
+        if proc.returncode != 0:
+            return False, False
+        stderr = stderr_bytes.decode(errors="replace")
+        # fetch only reports on stderr when refs were updated or pruned
+        changed = bool(stderr.strip())
+        if changed:
+            status_cache(cwd).invalidate()
+        return True, changed
+
+
+async def _kill_fetch(proc: asyncio.subprocess.Process) -> None:
+    """Kill a hung fetch and everything it spawned, then reap it."""
+    if proc.returncode is None:
+        with contextlib.suppress(ProcessLookupError):
+            if os.name == "posix":
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+    await proc.wait()
+
+
+fetch_scheduler = FetchScheduler()
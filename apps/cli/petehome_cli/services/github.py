@@ -1,11 +1,14 @@
 """GitHub CLI integration service."""
 
 import json
-from dataclasses import dataclass
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from petehome_cli.config import REPO_ROOT
-from petehome_cli.services.process import run_command
+from petehome_cli.services.git_log import LOG_FORMAT, parse_log_record
+from petehome_cli.services.git_status import fetch_scheduler, status_cache
+from petehome_cli.services.process import run_command, stream_command
 
 
 @dataclass
@@ -18,14 +21,29 @@ class GitStatus:
     untracked: list[str]
     ahead: int
     behind: int
+    upstream: str | None = None
+    fetch_age: float | None = None  # seconds since last fetch
+    conflicted: list[str] = field(default_factory=list)
+    renamed: dict[str, str] = field(default_factory=dict)
 
     @property
     def is_clean(self) -> bool:
-        return not (self.staged or self.unstaged or self.untracked)
+        return not (self.staged or self.unstaged or self.untracked or self.conflicted)
 
     @property
     def has_changes(self) -> bool:
-        return bool(self.staged or self.unstaged or self.untracked)
+        return bool(self.staged or self.unstaged or self.untracked or self.conflicted)
+
+
+@dataclass
+class FileDiffStat:
+    """Per-file line counts from `git diff --numstat`."""
+
+    path: str
+    added: int
+    deleted: int
+    binary: bool = False
+    old_path: str | None = None
 
 
 @dataclass
@@ -50,61 +68,33 @@ class GitHubService:
     def __init__(self) -> None:
         self.repo_root = str(REPO_ROOT)
 
-    async def get_status(self) -> GitStatus | None:
-        """Get current git status."""
+    async def get_status(self, fresh: bool = False) -> GitStatus | None:
+        """Get current git status, served from the status cache when unchanged."""
         try:
-            _, branch_stdout, _ = await run_command(
-                "git", "branch", "--show-current",
-                cwd=self.repo_root,
-            )
-            branch = branch_stdout.strip()
-
-            _, status_stdout, _ = await run_command(
-                "git", "status", "--porcelain",
-                cwd=self.repo_root,
-            )
-
-            staged: list[str] = []
-            unstaged: list[str] = []
-            untracked: list[str] = []
-
-            for line in status_stdout.strip().split("\n"):
-                if not line:
-                    continue
-                index_status = line[0]
-                worktree_status = line[1]
-                filename = line[3:]
-
-                if index_status == "?":
-                    untracked.append(filename)
-                elif index_status != " ":
-                    staged.append(filename)
-
-                if worktree_status not in (" ", "?"):
-                    unstaged.append(filename)
-
-            _, ab_stdout, _ = await run_command(
-                "git", "rev-list", "--left-right", "--count",
-                f"HEAD...origin/{branch}",
-                cwd=self.repo_root,
-            )
-            ahead, behind = 0, 0
-            if ab_stdout.strip():
-                parts = ab_stdout.strip().split()
-                if len(parts) == 2:
-                    ahead, behind = int(parts[0]), int(parts[1])
+            cache = status_cache(self.repo_root)
+            snap = await cache.get(fresh=fresh)
+            if snap is None:
+                return None
 
             return GitStatus(
-                branch=branch,
-                staged=staged,
-                unstaged=unstaged,
-                untracked=untracked,
-                ahead=ahead,
-                behind=behind,
+                branch=snap.branch,
+                staged=snap.staged,
+                unstaged=snap.unstaged,
+                untracked=snap.untracked,
+                ahead=snap.ahead,
+                behind=snap.behind,
+                upstream=snap.upstream,
+                fetch_age=cache.fetch_age(),
+                conflicted=snap.conflicted,
+                renamed=snap.renamed,
             )
         except Exception:
             return None
 
+    def start_background_fetch(self) -> None:
+        """Keep ahead/behind current with periodic background fetches."""
+        fetch_scheduler.add(self.repo_root)
+
     async def add_files(self, files: list[str] | None = None) -> tuple[bool, str]:
         """Stage files for commit."""
         if files:
@@ -141,20 +131,18 @@ class GitHubService:
     async def get_log(self, count: int = 10) -> list[dict]:
         """Get recent commit log."""
         _, stdout, _ = await run_command(
-            "git", "log", f"-{count}", "--format=%H|%s|%an|%ar",
+            "git", "log", f"-{count}", "-z", f"--format={LOG_FORMAT}",
             cwd=self.repo_root,
         )
         commits = []
-        for line in stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("|")
-            if len(parts) >= 4:
+        for record in stdout.split("\0"):
+            commit = parse_log_record(record) if record else None
+            if commit:
                 commits.append({
-                    "hash": parts[0][:7],
-                    "message": parts[1],
-                    "author": parts[2],
-                    "time": parts[3],
+                    "hash": commit.short,
+                    "message": commit.subject,
+                    "author": commit.author,
+                    "time": commit.relative,
                 })
         return commits
 
@@ -212,8 +200,49 @@ class GitHubService:
         code, stdout, stderr = await run_command(*args, cwd=self.repo_root)
         return code == 0, stdout.strip() if code == 0 else stderr
 
-    async def diff(self, staged: bool = False) -> tuple[bool, str]:
-        """Show git diff."""
-        args = ("git", "diff", "--staged") if staged else ("git", "diff")
-        code, stdout, stderr = await run_command(*args, cwd=self.repo_root)
-        return code == 0, stdout if code == 0 else stderr
+    async def diff_numstat(self, staged: bool = False) -> list[FileDiffStat] | None:
+        """Per-file +/- counts for the working tree (or index) diff; None on error."""
+        args = ["git", "diff", "--numstat", "-z"]
+        if staged:
+            args.append("--staged")
+        code, stdout, _ = await run_command(*args, cwd=self.repo_root)
+        if code != 0:
+            return None
+
+        stats: list[FileDiffStat] = []
+        records = stdout.split("\0")
+        i = 0
+        while i < len(records):
+            rec = records[i]
+            i += 1
+            if not rec:
+                continue
+            added, deleted, path = rec.split("\t", 2)
+            old_path = None
+            if not path:
+                # Rename/copy: old and new paths follow as separate records
+                old_path, path = records[i], records[i + 1]
+                i += 2
+            binary = added == "-"
+            stats.append(FileDiffStat(
+                path=path,
+                added=0 if binary else int(added),
+                deleted=0 if binary else int(deleted),
+                binary=binary,
+                old_path=old_path,
+            ))
+        return stats
+
+    async def stream_diff(
+        self,
+        paths: list[str] | None = None,
+        staged: bool = False,
+    ) -> AsyncGenerator[str, None]:
+        """Stream `git diff` output line by line, optionally limited to paths."""
+        args = ["git", "diff", "--no-color", "--no-ext-diff"]
+        if staged:
+            args.append("--staged")
+        if paths:
+            args += ["--", *paths]
+        async for line in stream_command(*args, cwd=self.repo_root):
+            yield line
@@ -0,0 +1,177 @@
+"""Fingerprint-based invalidation of apps/web/.next.
+
+NEXT_PUBLIC_* values are inlined at compile time, so the compiled output
+must go when they change -- but Next's incremental cache (.next/cache) is
+keyed on its own inputs and can stay. A lockfile change throws out the
+incremental cache too, since dependency versions feed into it.
+
+Fingerprints are stored in ~/.petehome (not inside .next, which `next build`
+wipes). Deletion is a rename followed by a background rmtree, so callers
+never wait on the filesystem.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+from petehome_cli.config import NEXT_DIST_LINK, REPO_ROOT, STATE_DIR, WEB_APP_PATH
+from petehome_cli.services.dev_server import is_release_link
+
+STAMP_FILE: Path = STATE_DIR / "next-cache.json"
+LOCKFILE: Path = REPO_ROOT / "yarn.lock"
+KEEP_DIR = "cache"
+TRASH_PREFIX = ".next.trash-"
+
+# Files Next loads env from, in any mode
+_ENV_FILES = (
+    ".env",
+    ".env.local",
+    ".env.development",
+    ".env.development.local",
+    ".env.production",
+    ".env.production.local",
+)
+
+
+@dataclass
+class Invalidation:
+    """What invalidate() did (or would do)."""
+
+    env_changed: bool = False
+    lock_changed: bool = False
+    kept_cache: bool = False
+    removed: int = 0
+    error: str = ""  # set if .next couldn't be moved aside (files in use)
+
+    @property
+    def changed(self) -> bool:
+        return self.env_changed or self.lock_changed
+
+
+def env_fingerprint() -> str:
+    """Hash of every NEXT_PUBLIC_* key/value across the web app's .env files."""
+    h = hashlib.sha256()
+    for name in _ENV_FILES:
+        path = WEB_APP_PATH / name
+        if not path.exists():
+            continue
+        values = dotenv_values(path)
+        for key in sorted(k for k in values if k.startswith("NEXT_PUBLIC_")):
+            h.update(f"{name}\0{key}\0{values[key] or ''}\n".encode())
+    return h.hexdigest()
+
+
+def lock_fingerprint() -> str:
+    """Hash of yarn.lock (empty string if there is no lockfile)."""
+    if not LOCKFILE.exists():
+        return ""
+    h = hashlib.sha256()
+    with open(LOCKFILE, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_stamp() -> dict[str, str]:
+    try:
+        return json.loads(STAMP_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_stamp(env_hash: str, lock_hash: str) -> None:
+    STAMP_FILE.parent.mkdir(parents=True, exist_ok=True)
+    STAMP_FILE.write_text(json.dumps({"env": env_hash, "lock": lock_hash}))
+
+
+def _remove_in_background(path: Path) -> None:
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(path,),
+        kwargs={"ignore_errors": True},
+        daemon=True,
+    ).start()
+
+
+def sweep_trash() -> None:
+    """Remove trash dirs left behind by a previous session that exited mid-delete."""
+    for path in WEB_APP_PATH.glob(f"{TRASH_PREFIX}*"):
+        _remove_in_background(path)
+
+
+def _discard(keep_cache: bool) -> tuple[int, bool, str]:
+    """Move .next (or everything in it but cache/) aside and delete it in the background.
+
+    Returns (entries removed, whether cache/ was kept, error). If an entry
+    can't be moved (e.g. Windows while the server still holds files), it is
+    deleted in place as far as possible and the error is returned.
+    """
+    trash = WEB_APP_PATH / f"{TRASH_PREFIX}{time.time_ns()}"
+    cache_dir = NEXT_DIST_LINK / KEEP_DIR
+
+    if not keep_cache or not cache_dir.is_dir():
+        try:
+            NEXT_DIST_LINK.rename(trash)
+        except OSError as e:
+            shutil.rmtree(NEXT_DIST_LINK, ignore_errors=True)
+            return 1, False, str(e)
+        _remove_in_background(trash)
+        return 1, False, ""
+
+    removed = 0
+    error = ""
+    try:
+        trash.mkdir()
+        entries = [e for e in NEXT_DIST_LINK.iterdir() if e.name != KEEP_DIR]
+    except OSError as e:
+        return 0, True, str(e)
+    for entry in entries:
+        try:
+            os.replace(entry, trash / entry.name)
+        except OSError as e:
+            error = error or str(e)
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                with contextlib.suppress(OSError):
+                    entry.unlink()
+        removed += 1
+    _remove_in_background(trash)
+    return removed, True, error
+
+
+def invalidate(force: bool = False) -> Invalidation:
+    """Drop stale parts of .next if the env or lockfile fingerprint changed.
+
+    A .next symlink or junction is a blue/green release (see DevServerService)
+    and is never touched -- its env was baked in when it was built.
+    """
+    sweep_trash()
+
+    env_hash = env_fingerprint()
+    lock_hash = lock_fingerprint()
+    stamp = _read_stamp()
+
+    result = Invalidation(
+        env_changed=force or stamp.get("env") != env_hash,
+        lock_changed=force or stamp.get("lock") != lock_hash,
+    )
+
+    if is_release_link(NEXT_DIST_LINK) or not NEXT_DIST_LINK.is_dir():
+        _write_stamp(env_hash, lock_hash)
+        return Invalidation()
+
+    if result.changed:
+        result.removed, result.kept_cache, result.error = _discard(keep_cache=not result.lock_changed)
+
+    if not result.error:
+        _write_stamp(env_hash, lock_hash)  # else try again next time
+    return result
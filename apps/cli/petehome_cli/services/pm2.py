@@ -113,6 +113,14 @@ class PM2Service:
         output = stdout if success else stderr
         return success, output
 
+    @staticmethod
+    async def reload(name: str) -> tuple[bool, str]:
+        """Reload a PM2 process (graceful restart, keeps its pm_id and logs)."""
+        returncode, stdout, stderr = await run_command("pm2", "reload", name)
+        success = returncode == 0
+        output = stdout if success else stderr
+        return success, output
+
     @staticmethod
     async def delete(name: str) -> tuple[bool, str]:
         """Delete a PM2 process."""
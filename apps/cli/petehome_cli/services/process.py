@@ -5,13 +5,18 @@ Handles Windows shell execution automatically.
 """
 
 import asyncio
+import contextlib
 import os
+import signal
 import sys
 from collections.abc import AsyncIterator
 from pathlib import Path
 
 IS_WINDOWS = sys.platform == "win32"
 
+# StreamReader buffer for streamed output; a longer line is cut short
+STREAM_LIMIT = 1 << 20
+
 
 async def run_command(
     *args: str,
@@ -52,14 +57,43 @@ async def run_command(
     )
 
 
+async def _read_lines(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """Lines from *reader*, like ``async for`` but without failing on long lines.
+
+    A line longer than the reader's limit (minified bundles, lockfiles in a
+    diff) keeps its first chunk plus " …"; the rest of it is skipped.
+    """
+    while True:
+        try:
+            yield await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                yield e.partial
+            return
+        except asyncio.LimitOverrunError as e:
+            head = await reader.read(e.consumed)
+            while True:
+                try:
+                    await reader.readuntil(b"\n")
+                    break
+                except asyncio.LimitOverrunError as skip:
+                    await reader.read(skip.consumed)
+                except asyncio.IncompleteReadError:
+                    break
+            yield head + " …".encode()
+
+
 async def stream_command(
     *args: str,
     cwd: str | Path | None = None,
     env: dict[str, str] | None = None,
+    kill_tree: bool = False,
 ) -> AsyncIterator[str]:
     """Run a command and stream output lines (stdout + stderr merged).
 
     Yields output lines as they arrive, with trailing whitespace stripped.
+    If the caller stops iterating early, the process is killed -- with
+    *kill_tree*, everything it started too (e.g. the node behind `yarn`).
     """
     run_env = None
     if env:
@@ -73,6 +107,7 @@ async def stream_command(
             env=run_env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
+            limit=STREAM_LIMIT,
         )
     else:
         proc = await asyncio.create_subprocess_exec(
@@ -81,12 +116,62 @@ async def stream_command(
             env=run_env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
+            limit=STREAM_LIMIT,
+            start_new_session=kill_tree,
         )
 
-    if proc.stdout:
-        async for line in proc.stdout:
-            yield line.decode("utf-8", errors="replace").rstrip()
-    await proc.wait()
+    try:
+        if proc.stdout:
+            async for line in _read_lines(proc.stdout):
+                yield line.decode("utf-8", errors="replace").rstrip()
+        await proc.wait()
+    finally:
+        if proc.returncode is None:
+            if kill_tree:
+                await _kill_tree(proc)
+            else:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+            await proc.wait()
+
+
+async def _kill_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kill *proc* and its descendants (its process group, or taskkill /T)."""
+    if IS_WINDOWS:
+        killer = await asyncio.create_subprocess_shell(
+            f"taskkill /F /T /PID {proc.pid}",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        await killer.wait()
+        return
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGKILL)
+
+
+async def spawn(
+    *args: str,
+    cwd: str | Path | None = None,
+    env: dict[str, str] | None = None,
+) -> asyncio.subprocess.Process:
+    """Start a long-lived process with piped stdin/stdout (stderr discarded).
+
+    For persistent helpers like `git cat-file --batch`; the caller owns the
+    process and must kill it when done.
+    """
+    run_env = None
+    if env:
+        run_env = {**os.environ, **env}
+
+    return await asyncio.create_subprocess_exec(
+        *args,
+        cwd=str(cwd) if cwd else None,
+        env=run_env,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        limit=1 << 20,
+    )
 
 
 async def run_shell(
@@ -1,6 +1,16 @@
 """Supabase integration: run migrations against production database."""
 
+import asyncio
+import contextlib
+import hashlib
 import os
+import random
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 
 from petehome_cli.config import WEB_APP_PATH
@@ -9,6 +19,18 @@ MIGRATIONS_DIR = WEB_APP_PATH / "supabase" / "migrations"
 # Same schema/table Supabase CLI uses for migration history
 MIGRATION_SCHEMA = "supabase_migrations"
 MIGRATION_TABLE = "schema_migrations"
+# One row per apply attempt (ours only; the Supabase CLI doesn't know about it)
+HISTORY_TABLE = "migration_history"
+
+# Production-safe defaults: give up on a lock quickly instead of queueing
+# every other query behind our ALTER TABLE, and retry a few times.
+DEFAULT_LOCK_TIMEOUT = "5s"
+DEFAULT_STATEMENT_TIMEOUT = "5min"
+DEFAULT_LOCK_RETRIES = 3
+RETRY_BACKOFF = 2.0  # seconds before the first retry; doubles each time
+RETRY_BACKOFF_MAX = 30.0
+
+_TIMEOUT_VALUE = re.compile(r"^\d+(ms|s|min|h)?$")
 
 
 def get_db_url() -> str | None:
@@ -36,9 +58,167 @@ def _ensure_migration_table(conn) -> None:
             )
             """
         )
+        # Our own bookkeeping; nullable so the Supabase CLI can keep writing rows
+        cur.execute(
+            f"""
+            ALTER TABLE {MIGRATION_SCHEMA}.{MIGRATION_TABLE}
+                ADD COLUMN IF NOT EXISTS checksum TEXT,
+                ADD COLUMN IF NOT EXISTS duration_ms INTEGER,
+                ADD COLUMN IF NOT EXISTS applied_at TIMESTAMPTZ DEFAULT now()
+            """
+        )
+        cur.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {MIGRATION_SCHEMA}.{HISTORY_TABLE} (
+                id BIGSERIAL PRIMARY KEY,
+                version TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempt INTEGER NOT NULL,
+                duration_ms INTEGER NOT NULL,
+                lock_timeout TEXT,
+                statement_timeout TEXT,
+                finished_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+            """
+        )
     conn.commit()
 
 
+def is_valid_timeout(value: str) -> bool:
+    """True for Postgres durations like 0, 500ms, 5s, 2min, 1h."""
+    return bool(_TIMEOUT_VALUE.match(value))
+
+
+class ConnectionPool:
+    """Session-wide pool of psycopg2 connections to one database URL.
+
+    Connections are kept in autocommit mode, so a read is a single round
+    trip; callers that need a transaction pass ``transaction=True``. An idle
+    connection is reused as-is if it was used within PING_AFTER seconds,
+    pinged first if it has been idle longer, and replaced if it has been idle
+    past IDLE_TIMEOUT (poolers drop idle clients). The migration table is
+    set up once, on the first connection of the session.
+    """
+
+    MAX_IDLE = 4
+    PING_AFTER = 30.0
+    IDLE_TIMEOUT = 300.0
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self._idle: list[tuple[object, float]] = []  # (connection, last used), most recent last
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    @contextlib.contextmanager
+    def connection(self, transaction: bool = False):
+        """Borrow a connection; it goes back to the pool when the block exits."""
+        conn = self._acquire()
+        broken = False
+        try:
+            if not self._schema_ready:
+                _ensure_migration_table(conn)
+                self._schema_ready = True
+            if transaction:
+                conn.autocommit = False
+            yield conn
+        except Exception as e:
+            broken = _is_connection_error(e) or conn.closed
+            raise
+        finally:
+            self._release(conn, broken)
+
+    def _acquire(self):
+        import psycopg2
+
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            idle_for = now - last_used
+            if conn.closed or idle_for > self.IDLE_TIMEOUT:
+                _close_quietly(conn)
+                continue
+            if idle_for > self.PING_AFTER:
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute("SELECT 1")
+                except psycopg2.Error:
+                    _close_quietly(conn)
+                    continue
+            return conn
+
+        conn = psycopg2.connect(self.url)
+        conn.autocommit = True
+        return conn
+
+    def _release(self, conn, broken: bool) -> None:
+        if broken or conn.closed:
+            _close_quietly(conn)
+            return
+        try:
+            if not conn.autocommit:
+                conn.rollback()  # no-op unless the caller left a transaction open
+                conn.autocommit = True
+        except Exception:
+            _close_quietly(conn)
+            return
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+            while len(self._idle) > self.MAX_IDLE:
+                _close_quietly(self._idle.pop(0)[0])
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            _close_quietly(conn)
+
+
+def _is_connection_error(e: Exception) -> bool:
+    try:
+        import psycopg2
+    except ImportError:
+        return False
+    return isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError))
+
+
+def _close_quietly(conn) -> None:
+    with contextlib.suppress(Exception):
+        conn.close()
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(url: str) -> ConnectionPool:
+    """Return the session pool, replacing it if SUPABASE_DB_URL changed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.url != url:
+            if _pool is not None:
+                _pool.close()
+            _pool = ConnectionPool(url)
+        return _pool
+
+
+def close_pool() -> None:
+    """Close pooled connections (on app exit)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+def file_checksum(path: Path) -> str:
+    """sha256 of a migration file, with CRLF normalized so Windows checkouts match."""
+    return hashlib.sha256(path.read_bytes().replace(b"\r\n", b"\n")).hexdigest()
+
+
 def get_applied_versions(conn) -> set[str]:
     """Return set of migration version strings (filenames) already applied."""
     with conn.cursor() as cur:
@@ -57,57 +237,374 @@ def list_migration_files() -> list[Path]:
     return files
 
 
-def run_migrations(dry_run: bool = False) -> tuple[bool, str]:
+_DOLLAR_TAG = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)?\$")
+
+
+def split_statements(sql: str) -> list[str]:
+    """Split a SQL script on top-level semicolons.
+
+    Understands -- and (nested) /* */ comments, '...' / E'...' strings,
+    "quoted" identifiers and $tag$ dollar-quoted bodies, so function
+    definitions stay in one piece. Comment-only chunks are dropped.
     """
-    Run pending Supabase migrations against the database.
-    Uses SUPABASE_DB_URL (Postgres connection URI from Supabase dashboard).
-    Returns (success, message).
+    statements: list[str] = []
+    start = 0
+    has_code = False
+    i, n = 0, len(sql)
+    while i < n:
+        c = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = n if end < 0 else end + 1
+            continue
+        if sql.startswith("/*", i):
+            depth, i = 1, i + 2
+            while i < n and depth:
+                if sql.startswith("/*", i):
+                    depth, i = depth + 1, i + 2
+                elif sql.startswith("*/", i):
+                    depth, i = depth - 1, i + 2
+                else:
+                    i += 1
+            continue
+        if c == ";":
+            if has_code:
+                statements.append(sql[start:i].strip())
+            i += 1
+            start, has_code = i, False
+            continue
+
+        if not c.isspace():
+            has_code = True
+        if c in ("'", '"'):
+            backslash = c == "'" and i > 0 and sql[i - 1] in "eE"
+            i += 1
+            while i < n:
+                if backslash and sql[i] == "\\":
+                    i += 2
+                elif sql[i] == c:
+                    if sql.startswith(c * 2, i):
+                        i += 2
+                        continue
+                    i += 1
+                    break
+                else:
+                    i += 1
+            continue
+        if c == "$" and not (i > 0 and (sql[i - 1].isalnum() or sql[i - 1] == "_")):
+            m = _DOLLAR_TAG.match(sql, i)
+            if m:
+                end = sql.find(m.group(0), m.end())
+                i = n if end < 0 else end + len(m.group(0))
+                continue
+        i += 1
+
+    if has_code:
+        statements.append(sql[start:].strip())
+    return statements
+
+
+@dataclass
+class MigrationEvent:
+    """Progress from a MigrationRun.
+
+    kind is one of: pending, start, statement, retry, applied, done, error,
+    cancelled. For retry, index is the attempt that failed and elapsed the
+    backoff before the next one.
     """
-    try:
-        import psycopg2
-    except ImportError:
-        return False, "psycopg2 not installed. Run: pip install psycopg2-binary"
 
-    url = get_db_url()
-    if not url:
-        return False, "SUPABASE_DB_URL not set. Set it to your Supabase Postgres URI (Project Settings → Database → Connection string)."
+    kind: str
+    migration: str = ""
+    index: int = 0  # 1-based statement number within the migration
+    total: int = 0  # statements in the migration (or migrations, for pending/done)
+    elapsed: float = 0.0  # seconds for this statement / migration / run
+    message: str = ""
 
-    files = list_migration_files()
-    if not files:
-        return False, f"No migration files in {MIGRATIONS_DIR}"
 
-    try:
-        conn = psycopg2.connect(url)
-        conn.autocommit = False
-    except Exception as e:
-        return False, f"Connection failed: {e}"
+class _Cancelled(Exception):
+    pass
 
-    try:
-        _ensure_migration_table(conn)
-        applied = get_applied_versions(conn)
-        pending = [f for f in files if f.name not in applied]
-        if not pending:
-            return True, "No pending migrations."
-        if dry_run:
-            names = [p.name for p in pending]
-            return True, f"Dry run: would apply {len(pending)} migration(s): " + ", ".join(names)
-
-        for path in pending:
-            sql = path.read_text(encoding="utf-8", errors="replace")
-            with conn.cursor() as cur:
-                cur.execute(sql)
+
+class _LockTimeout(Exception):
+    pass
+
+
+class MigrationRun:
+    """Applies pending migrations on a worker thread, one statement at a time.
+
+    Each migration runs in its own transaction and is recorded in the same
+    transaction, so cancelling (or an error) rolls back only the migration
+    in progress. cancel() is safe to call from the event loop: it also asks
+    the server to abort the statement currently executing.
+
+    lock_timeout / statement_timeout are SET LOCAL for every migration. A
+    migration that hits the lock timeout is rolled back and retried with
+    exponential backoff, up to ``retries`` times. Every attempt is written
+    to the history table.
+    """
+
+    def __init__(
+        self,
+        dry_run: bool = False,
+        lock_timeout: str = DEFAULT_LOCK_TIMEOUT,
+        statement_timeout: str = DEFAULT_STATEMENT_TIMEOUT,
+        retries: int = DEFAULT_LOCK_RETRIES,
+    ) -> None:
+        self.dry_run = dry_run
+        self.lock_timeout = lock_timeout
+        self.statement_timeout = statement_timeout
+        self.retries = retries
+        self._cancel = threading.Event()
+        self._conn = None
+
+    def cancel(self) -> None:
+        self._cancel.set()
+        conn = self._conn
+        if conn is not None:
+            with contextlib.suppress(Exception):
+                conn.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    async def events(self) -> AsyncIterator[MigrationEvent]:
+        """Run the migrations and yield progress as it happens.
+
+        If the consumer stops early (e.g. its worker is cancelled), the run
+        is cancelled and rolled back before this returns.
+        """
+        global _current_run
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[MigrationEvent | None] = asyncio.Queue()
+
+        def emit(event: MigrationEvent | None) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        def work() -> None:
+            try:
+                self._run(emit)
+            except Exception as e:
+                emit(MigrationEvent("error", message=str(e)))
+            finally:
+                emit(None)
+
+        _current_run = self
+        thread = loop.run_in_executor(None, work)
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+        finally:
+            if not thread.done():
+                self.cancel()
+                await asyncio.shield(thread)
+            if _current_run is self:
+                _current_run = None
+
+    def _run(self, emit: Callable[[MigrationEvent], None]) -> None:
+        try:
+            import psycopg2
+        except ImportError:
+            emit(MigrationEvent("error", message="psycopg2 not installed. Run: pip install psycopg2-binary"))
+            return
+
+        url = get_db_url()
+        if not url:
+            emit(MigrationEvent(
+                "error",
+                message="SUPABASE_DB_URL not set. Set it to your Supabase Postgres URI "
+                "(Project Settings → Database → Connection string).",
+            ))
+            return
+
+        files = list_migration_files()
+        if not files:
+            emit(MigrationEvent("error", message=f"No migration files in {MIGRATIONS_DIR}"))
+            return
+
+        try:
+            with get_pool(url).connection(transaction=True) as conn:
+                self._run_on(conn, files, emit)
+        except psycopg2.OperationalError as e:
+            emit(MigrationEvent("error", message=f"Connection failed: {e}"))
+
+    def _run_on(self, conn, files: list[Path], emit: Callable[[MigrationEvent], None]) -> None:
+        import psycopg2
+
+        self._conn = conn
+        run_started = time.monotonic()
+        applied_count = 0
+        try:
+            applied = get_applied_versions(conn)
+            pending = [f for f in files if f.name not in applied]
+            emit(MigrationEvent("pending", total=len(pending)))
+            if not pending or self.dry_run:
+                for path in pending:
+                    sql = path.read_text(encoding="utf-8", errors="replace")
+                    emit(MigrationEvent("start", migration=path.name, total=len(split_statements(sql))))
+                emit(MigrationEvent("done", total=0, elapsed=time.monotonic() - run_started))
+                return
+
+            for path in pending:
+                self._apply_with_retries(conn, path, emit)
+                applied_count += 1
+            emit(MigrationEvent("done", total=applied_count, elapsed=time.monotonic() - run_started))
+        except (_Cancelled, psycopg2.extensions.QueryCanceledError):
+            with contextlib.suppress(Exception):
+                conn.rollback()
+            emit(MigrationEvent(
+                "cancelled",
+                total=applied_count,
+                message="Cancelled; migration in progress rolled back",
+            ))
+        except Exception as e:
+            with contextlib.suppress(Exception):
+                conn.rollback()
+            emit(MigrationEvent("error", total=applied_count, message=str(e)))
+        finally:
+            self._conn = None
+
+    def _apply_with_retries(self, conn, path: Path, emit: Callable[[MigrationEvent], None]) -> None:
+        for attempt in range(1, self.retries + 2):
+            started = time.monotonic()
+            try:
+                self._apply(conn, path, attempt, emit)
+                return
+            except _LockTimeout as e:
+                conn.rollback()
+                self._record(conn, path.name, "lock_timeout", attempt, started)
+                if attempt > self.retries:
+                    raise RuntimeError(
+                        f"{path.name}: lock not acquired within {self.lock_timeout} "
+                        f"after {attempt} attempt(s): {e}"
+                    ) from e
+                delay = min(RETRY_BACKOFF * 2 ** (attempt - 1), RETRY_BACKOFF_MAX)
+                delay *= random.uniform(0.8, 1.2)
+                emit(MigrationEvent(
+                    "retry",
+                    migration=path.name,
+                    index=attempt,
+                    total=self.retries + 1,
+                    elapsed=delay,
+                    message=str(e),
+                ))
+                waiting = time.monotonic()
+                if self._cancel.wait(delay):
+                    # The retry never started, but record it so history has no hole
+                    self._record(conn, path.name, "cancelled", attempt + 1, waiting)
+                    raise _Cancelled from e
+            except _Cancelled:
+                with contextlib.suppress(Exception):
+                    conn.rollback()
+                self._record(conn, path.name, "cancelled", attempt, started)
+                raise
+            except Exception:
+                with contextlib.suppress(Exception):
+                    conn.rollback()
+                self._record(conn, path.name, "failed", attempt, started)
+                raise
+
+    def _record(self, conn, version: str, status: str, attempt: int, started: float) -> None:
+        """Write a history row in its own transaction (best effort)."""
+        try:
             with conn.cursor() as cur:
-                cur.execute(
-                    f"INSERT INTO {MIGRATION_SCHEMA}.{MIGRATION_TABLE} (version) VALUES (%s)",
-                    (path.name,),
-                )
+                self._insert_history(cur, version, status, attempt, started)
             conn.commit()
-        return True, f"Applied {len(pending)} migration(s)."
-    except Exception as e:
-        conn.rollback()
-        return False, str(e)
-    finally:
-        conn.close()
+        except Exception:
+            with contextlib.suppress(Exception):
+                conn.rollback()
+
+    def _insert_history(self, cur, version: str, status: str, attempt: int, started: float) -> None:
+        cur.execute(
+            f"INSERT INTO {MIGRATION_SCHEMA}.{HISTORY_TABLE} "
+            "(version, status, attempt, duration_ms, lock_timeout, statement_timeout) "
+            "VALUES (%s, %s, %s, %s, %s, %s)",
+            (
+                version,
+                status,
+                attempt,
+                int((time.monotonic() - started) * 1000),
+                self.lock_timeout,
+                self.statement_timeout,
+            ),
+        )
+
+    def _apply(self, conn, path: Path, attempt: int, emit: Callable[[MigrationEvent], None]) -> None:
+        from psycopg2 import errors
+
+        sql = path.read_text(encoding="utf-8", errors="replace")
+        statements = split_statements(sql)
+        emit(MigrationEvent("start", migration=path.name, index=attempt, total=len(statements)))
+
+        checksum = file_checksum(path)
+        started = time.monotonic()
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT set_config('lock_timeout', %s, true), set_config('statement_timeout', %s, true)",
+                (self.lock_timeout, self.statement_timeout),
+            )
+            for index, statement in enumerate(statements, 1):
+                if self._cancel.is_set():
+                    raise _Cancelled
+                t0 = time.monotonic()
+                try:
+                    cur.execute(statement)
+                except Exception as e:
+                    if self._cancel.is_set():
+                        raise _Cancelled from e
+                    if isinstance(e, errors.LockNotAvailable):
+                        raise _LockTimeout(f"statement {index}: {str(e).strip()}") from e
+                    if isinstance(e, errors.QueryCanceled):
+                        raise RuntimeError(
+                            f"{path.name} statement {index}: exceeded statement_timeout {self.statement_timeout}"
+                        ) from e
+                    raise RuntimeError(f"{path.name} statement {index}: {e}".strip()) from e
+                emit(MigrationEvent(
+                    "statement",
+                    migration=path.name,
+                    index=index,
+                    total=len(statements),
+                    elapsed=time.monotonic() - t0,
+                    message=statement,
+                ))
+            cur.execute(
+                f"INSERT INTO {MIGRATION_SCHEMA}.{MIGRATION_TABLE} (version, checksum, duration_ms) "
+                "VALUES (%s, %s, %s)",
+                (path.name, checksum, int((time.monotonic() - started) * 1000)),
+            )
+            self._insert_history(cur, path.name, "applied", attempt, started)
+        if self._cancel.is_set():
+            raise _Cancelled
+        conn.commit()
+        emit(MigrationEvent("applied", migration=path.name, total=len(statements), elapsed=time.monotonic() - started))
+
+
+_current_run: MigrationRun | None = None
+
+
+def run_migrations(
+    dry_run: bool = False,
+    lock_timeout: str = DEFAULT_LOCK_TIMEOUT,
+    statement_timeout: str = DEFAULT_STATEMENT_TIMEOUT,
+    retries: int = DEFAULT_LOCK_RETRIES,
+) -> MigrationRun:
+    """Create a migration run; iterate ``run.events()`` to execute it.
+
+    Uses SUPABASE_DB_URL (Postgres connection URI from Supabase dashboard).
+    Timeouts are Postgres durations (e.g. "5s", "2min"; "0" disables).
+    """
+    return MigrationRun(
+        dry_run=dry_run,
+        lock_timeout=lock_timeout,
+        statement_timeout=statement_timeout,
+        retries=retries,
+    )
+
+
+def current_run() -> MigrationRun | None:
+    """The migration run in progress, if any (for `migrate cancel`)."""
+    return _current_run
 
 
 def migration_status() -> tuple[bool, list[dict]]:
@@ -128,12 +625,8 @@ def migration_status() -> tuple[bool, list[dict]]:
         return True, []
 
     try:
-        conn = psycopg2.connect(url)
-        try:
-            _ensure_migration_table(conn)
+        with get_pool(url).connection() as conn:
             applied = get_applied_versions(conn)
-        finally:
-            conn.close()
     except Exception:
         return False, []
 
@@ -202,23 +695,159 @@ def mark_applied(specs: list[str]) -> tuple[bool, str]:
         return True, "Nothing to mark."
 
     try:
-        conn = psycopg2.connect(url)
-        conn.autocommit = False
-        try:
-            _ensure_migration_table(conn)
+        with get_pool(url).connection(transaction=True) as conn:
             applied = get_applied_versions(conn)
             new_ones = [v for v in to_mark if v not in applied]
             if not new_ones:
                 return True, "All specified migrations already marked as applied."
+            by_name = {f.name: f for f in files}
             with conn.cursor() as cur:
                 for v in new_ones:
                     cur.execute(
-                        f"INSERT INTO {MIGRATION_SCHEMA}.{MIGRATION_TABLE} (version) VALUES (%s) ON CONFLICT (version) DO NOTHING",
-                        (v,),
+                        f"INSERT INTO {MIGRATION_SCHEMA}.{MIGRATION_TABLE} (version, checksum) VALUES (%s, %s) "
+                        "ON CONFLICT (version) DO NOTHING",
+                        (v, file_checksum(by_name[v])),
                     )
             conn.commit()
             return True, f"Marked {len(new_ones)} migration(s) as applied."
-        finally:
-            conn.close()
     except Exception as e:
         return False, str(e)
+
+
+@dataclass
+class VerifyReport:
+    """Differences between migration files on disk and the applied history."""
+
+    edited: list[str] = field(default_factory=list)  # applied, file changed since
+    missing: list[str] = field(default_factory=list)  # applied, no file anymore
+    out_of_order: list[str] = field(default_factory=list)  # pending, sorts before an applied one
+    unverified: list[str] = field(default_factory=list)  # applied before checksums were recorded
+    verified: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.edited or self.missing or self.out_of_order)
+
+
+def compare_migrations(files: list[Path], rows: list[tuple[str, str | None]]) -> VerifyReport:
+    """Compare files against (version, checksum) history rows."""
+    report = VerifyReport()
+    stored = dict(rows)
+    on_disk = {f.name: f for f in files}
+
+    for version in sorted(stored):
+        if version not in on_disk:
+            report.missing.append(version)
+
+    applied_on_disk = [name for name in on_disk if name in stored]
+    latest_applied = max(applied_on_disk, default="")
+    for name, path in sorted(on_disk.items()):
+        if name not in stored:
+            if name < latest_applied:
+                report.out_of_order.append(name)
+            continue
+        checksum = stored[name]
+        if checksum is None:
+            report.unverified.append(name)
+        elif checksum != file_checksum(path):
+            report.edited.append(name)
+        else:
+            report.verified += 1
+    return report
+
+
+def verify_migrations(accept_unverified: bool = False) -> tuple[bool, VerifyReport | str]:
+    """Check applied migrations against the files on disk.
+
+    History is read in a single query and compared locally. With
+    ``accept_unverified``, rows applied before checksums existed get the
+    current file's checksum recorded (files are trusted as-is).
+    Returns (success, report or error message).
+    """
+    try:
+        import psycopg2
+    except ImportError:
+        return False, "psycopg2 not installed. Run: pip install psycopg2-binary"
+
+    url = get_db_url()
+    if not url:
+        return False, "SUPABASE_DB_URL not set."
+
+    files = list_migration_files()
+    try:
+        with get_pool(url).connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT version, checksum FROM {MIGRATION_SCHEMA}.{MIGRATION_TABLE}")
+                report = compare_migrations(files, cur.fetchall())
+
+            if accept_unverified and report.unverified:
+                by_name = {f.name: f for f in files}
+                with conn.cursor() as cur:
+                    cur.executemany(
+                        f"UPDATE {MIGRATION_SCHEMA}.{MIGRATION_TABLE} SET checksum = %s "
+                        "WHERE version = %s AND checksum IS NULL",
+                        [(file_checksum(by_name[v]), v) for v in report.unverified],
+                    )
+                report.verified += len(report.unverified)
+                report.unverified = []
+    except Exception as e:
+        return False, str(e)
+    return True, report
+
+
+@dataclass
+class MigrationTiming:
+    """Apply-time summary for one migration from the history table."""
+
+    version: str
+    slowest_ms: int
+    avg_ms: int
+    runs: int
+    failed_attempts: int
+    last_run: datetime
+
+
+def migration_report(limit: int = 10) -> tuple[bool, list[MigrationTiming] | str]:
+    """Slowest migrations by recorded apply time. Returns (success, rows or error)."""
+    try:
+        import psycopg2  # noqa: F401
+    except ImportError:
+        return False, "psycopg2 not installed. Run: pip install psycopg2-binary"
+
+    url = get_db_url()
+    if not url:
+        return False, "SUPABASE_DB_URL not set."
+
+    try:
+        with get_pool(url).connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT version,
+                           MAX(duration_ms) FILTER (WHERE status = 'applied'),
+                           ROUND(AVG(duration_ms) FILTER (WHERE status = 'applied')),
+                           COUNT(*) FILTER (WHERE status = 'applied'),
+                           COUNT(*) FILTER (WHERE status <> 'applied'),
+                           MAX(finished_at)
+                    FROM {MIGRATION_SCHEMA}.{HISTORY_TABLE}
+                    GROUP BY version
+                    ORDER BY 2 DESC NULLS LAST
+                    LIMIT %s
+                    """,
+                    (limit,),
+                )
+                rows = cur.fetchall()
+    except Exception as e:
+        return False, str(e)
+
+    return True, [
+        MigrationTiming(
+            version=version,
+            slowest_ms=slowest or 0,
+            avg_ms=int(avg or 0),
+            runs=runs,
+            failed_attempts=failed,
+            last_run=last_run,
+        )
+        for version, slowest, avg, runs, failed, last_run in rows
+    ]
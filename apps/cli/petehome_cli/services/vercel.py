@@ -1,18 +1,34 @@
 """Vercel deployment service."""
 
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from importlib.util import find_spec
+from typing import Any, Literal
 
 import httpx
 
-from petehome_cli.config import VERCEL_PROJECT_ID, VERCEL_TEAM_ID, VERCEL_TOKEN
-from petehome_cli.services.process import run_command
+from petehome_cli.config import (
+    VERCEL_API_BASE,
+    VERCEL_HTTP2,
+    VERCEL_PROJECT_ID,
+    VERCEL_TEAM_ID,
+    VERCEL_TOKEN,
+)
+from petehome_cli.services.process import stream_command
 
 DeploymentState = Literal[
     "QUEUED", "INITIALIZING", "BUILDING", "READY", "ERROR", "CANCELED"
 ]
 
+TERMINAL_STATES: frozenset[str] = frozenset({"READY", "ERROR", "CANCELED"})
+
+_DEPLOYMENT_URL_RE = re.compile(r"https://([\w-]+\.vercel\.app)")
+
 
 @dataclass
 class Deployment:
@@ -36,11 +52,37 @@ class Deployment:
     def created_str(self) -> str:
         return self.created_at.strftime("%Y-%m-%d %H:%M:%S")
 
+    @property
+    def duration(self) -> float | None:
+        """Seconds from creation to ready, for finished deployments."""
+        if not self.ready_at:
+            return None
+        return (self.ready_at - self.created_at).total_seconds()
+
+
+@dataclass
+class BuildEvent:
+    """One line of build output, or a deployment state change."""
+
+    kind: Literal["stdout", "stderr", "command", "state"]
+    text: str
+    created_at: datetime
+    state: DeploymentState | None = None
+
 
 class VercelService:
-    """Service for interacting with Vercel API."""
+    """Service for interacting with Vercel API.
 
-    API_BASE = "https://api.vercel.com"
+    All instances share one pooled httpx client for the CLI session, so
+    repeated calls reuse the TLS connection. GET responses that carry an
+    ETag are cached and revalidated with If-None-Match.
+    """
+
+    API_BASE = VERCEL_API_BASE
+    ETAG_CACHE_SIZE = 64
+
+    _client: httpx.AsyncClient | None = None
+    _etag_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
 
     def __init__(self) -> None:
         self.token = VERCEL_TOKEN
@@ -62,59 +104,226 @@ class VercelService:
             params["teamId"] = self.team_id
         return params
 
+    # -- Connection pool -----------------------------------------------------
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                base_url=cls.API_BASE,
+                http2=VERCEL_HTTP2 and find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=120),
+                timeout=15.0,
+            )
+        return cls._client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared client (call on app shutdown)."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+    async def _get_json(self, path: str, params: dict[str, str]) -> Any | None:
+        """GET a JSON endpoint, revalidating cached bodies via ETag.
+
+        Returns None on any non-200/304 response.
+        """
+        client = self._get_client()
+        key = str(httpx.URL(path, params=params))
+        headers = self._get_headers()
+        cached = self._etag_cache.get(key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        resp = await client.get(path, headers=headers, params=params)
+        if resp.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return cached[1]
+        if resp.status_code != 200:
+            return None
+
+        data = resp.json()
+        etag = resp.headers.get("etag")
+        if etag:
+            self._etag_cache[key] = (etag, data)
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return data
+
+    @staticmethod
+    def _parse_deployment(d: dict) -> Deployment:
+        """Parse a deployment from the list (v6) or single-deployment (v13) API."""
+        created_at = datetime.fromtimestamp((d.get("created") or d["createdAt"]) / 1000)
+        ready_at = None
+        if d.get("ready"):
+            ready_at = datetime.fromtimestamp(d["ready"] / 1000)
+
+        return Deployment(
+            uid=d.get("uid") or d["id"],
+            name=d.get("name", "unknown"),
+            url=d.get("url", ""),
+            state=d.get("state") or d.get("readyState", "QUEUED"),
+            created_at=created_at,
+            ready_at=ready_at,
+            alias_error=d.get("aliasError"),
+            alias_assigned=d.get("aliasAssigned", False),
+            inspector_url=d.get("inspectorUrl"),
+        )
+
     async def get_deployments(self, limit: int = 10) -> list[Deployment]:
         """Get recent deployments."""
+        page = await self.get_deployments_page(limit=limit)
+        return page[0] if page else []
+
+    async def get_deployments_page(
+        self,
+        limit: int = 100,
+        since: int | None = None,
+        until: int | None = None,
+    ) -> tuple[list[Deployment], int | None] | None:
+        """Get one page of deployments, newest first.
+
+        ``since``/``until`` are created-at timestamps in ms. Returns
+        (deployments, next_until) where next_until is the ``until`` for the
+        next (older) page, or None on the last page. Returns None if the
+        request failed, so callers can tell "offline" from "no results".
+        """
         if not self.is_configured:
-            return []
+            return None
 
         try:
-            async with httpx.AsyncClient() as client:
-                params = self._get_params()
-                params["limit"] = str(limit)
-
-                resp = await client.get(
-                    f"{self.API_BASE}/v6/deployments",
-                    headers=self._get_headers(),
-                    params=params,
-                )
-                if resp.status_code != 200:
-                    return []
-
-                data = resp.json()
-                deployments = []
-
-                for d in data.get("deployments", []):
-                    created_at = datetime.fromtimestamp(d["created"] / 1000)
-                    ready_at = None
-                    if d.get("ready"):
-                        ready_at = datetime.fromtimestamp(d["ready"] / 1000)
-
-                    deployments.append(Deployment(
-                        uid=d["uid"],
-                        name=d.get("name", "unknown"),
-                        url=d.get("url", ""),
-                        state=d.get("state", "QUEUED"),
-                        created_at=created_at,
-                        ready_at=ready_at,
-                        alias_error=d.get("aliasError"),
-                        alias_assigned=d.get("aliasAssigned", False),
-                        inspector_url=d.get("inspectorUrl"),
-                    ))
-
-                return deployments
+            params = self._get_params()
+            params["limit"] = str(limit)
+            if since is not None:
+                params["since"] = str(since)
+            if until is not None:
+                params["until"] = str(until)
+
+            data = await self._get_json("/v6/deployments", params)
+            if data is None:
+                return None
+
+            deployments = [self._parse_deployment(d) for d in data.get("deployments", [])]
+            next_until = (data.get("pagination") or {}).get("next")
+            return deployments, next_until
         except Exception:
-            return []
+            return None
 
     async def get_latest_deployment(self) -> Deployment | None:
         """Get the most recent deployment."""
         deployments = await self.get_deployments(limit=1)
         return deployments[0] if deployments else None
 
-    async def trigger_deployment(self) -> tuple[bool, str]:
-        """Trigger a new deployment using Vercel CLI."""
-        returncode, stdout, stderr = await run_command(
-            "vercel", "--prod", "--yes",
-        )
-        success = returncode == 0
-        output = stdout if success else stderr
-        return success, output
+    async def get_deployment(self, id_or_url: str) -> Deployment | None:
+        """Get a single deployment by id or URL."""
+        if not self.is_configured:
+            return None
+        try:
+            data = await self._get_json(f"/v13/deployments/{id_or_url}", self._get_params())
+            return self._parse_deployment(data) if data else None
+        except Exception:
+            return None
+
+    async def get_events(self, id_or_url: str, since: int | None = None) -> list[dict]:
+        """Get build events for a deployment, oldest first, from ``since`` (ms) on."""
+        params = self._get_params()
+        params.pop("projectId", None)
+        params["direction"] = "forward"
+        params["builds"] = "1"
+        if since is not None:
+            params["since"] = str(since)
+        try:
+            data = await self._get_json(f"/v3/deployments/{id_or_url}/events", params)
+        except Exception:
+            return []
+        return data if isinstance(data, list) else []
+
+    @staticmethod
+    async def stream_deployment() -> AsyncIterator[str]:
+        """Trigger a production deployment, streaming Vercel CLI output.
+
+        Runs with --no-wait so the CLI returns once the deployment is
+        created; follow_deployment() then tails the build via the API.
+        """
+        async for line in stream_command("vercel", "--prod", "--yes", "--no-wait"):
+            yield line
+
+    @staticmethod
+    def parse_deployment_url(line: str) -> str | None:
+        """Extract a *.vercel.app deployment host from a CLI output line."""
+        match = _DEPLOYMENT_URL_RE.search(line)
+        return match.group(1) if match else None
+
+    async def follow_deployment(
+        self,
+        id_or_url: str,
+        min_interval: float = 1.0,
+        max_interval: float = 8.0,
+        timeout: float = 1800.0,
+    ) -> AsyncIterator[BuildEvent]:
+        """Tail a deployment's build events until it reaches a terminal state.
+
+        Events are fetched incrementally (``since`` = last seen timestamp)
+        and the poll interval backs off from min_interval to max_interval
+        while the build is quiet, snapping back when new output arrives.
+        Once the deployment is terminal, events are fetched one last time so
+        the final log lines come before the terminal state event.
+        """
+        cursor: int | None = None
+        seen_at_cursor: set[str] = set()
+        last_state: str | None = None
+        final: BuildEvent | None = None  # terminal state, yielded after the last drain
+        interval = min_interval
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            new_events = 0
+            for ev in await self.get_events(id_or_url, since=cursor):
+                payload = ev.get("payload") or {}
+                created = ev.get("created") or payload.get("date") or 0
+                ev_id = str(ev.get("id") or payload.get("id") or f"{created}:{ev.get('serial')}")
+                if cursor is not None and created < cursor:
+                    continue
+                if created == cursor and ev_id in seen_at_cursor:
+                    continue
+                if created != cursor:
+                    cursor = created
+                    seen_at_cursor = set()
+                seen_at_cursor.add(ev_id)
+
+                text = ev.get("text") or payload.get("text") or ""
+                kind = ev.get("type", "stdout")
+                if not text or kind not in ("stdout", "stderr", "command"):
+                    continue
+                new_events += 1
+                yield BuildEvent(
+                    kind=kind,
+                    text=text.rstrip(),
+                    created_at=datetime.fromtimestamp(created / 1000),
+                )
+
+            if final is not None:
+                yield final
+                return
+
+            deployment = await self.get_deployment(id_or_url)
+            if deployment and deployment.state != last_state:
+                last_state = deployment.state
+                state_event = BuildEvent(
+                    kind="state",
+                    text=deployment.state,
+                    created_at=datetime.now(),
+                    state=deployment.state,
+                )
+                if last_state in TERMINAL_STATES:
+                    # Lines logged just before the state flipped (often the error)
+                    # may have missed the page above: fetch once more, then stop
+                    final = state_event
+                    continue
+                yield state_event
+
+            interval = min_interval if new_events else min(interval * 1.5, max_interval)
+            await asyncio.sleep(interval)
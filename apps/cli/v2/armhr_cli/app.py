@@ -36,7 +36,7 @@ from textual.widgets import (
 )
 from textual_autocomplete import AutoComplete, DropdownItem
 
-from armhr_cli.commands import auth, backend, env, frontend, git, servers
+from armhr_cli.commands import auth, backend, env, frontend, git, servers, worktrees
 
 
 class DropUp(AutoComplete):
@@ -69,6 +69,7 @@ def _build_registry():
     frontend.register(REGISTRY)
     git.register(REGISTRY)
     servers.register(REGISTRY)
+    worktrees.register(REGISTRY)
 
 
 # ---------------------------------------------------------------------------
@@ -89,6 +90,9 @@ _COMMAND_DEFS: list[tuple[str, str]] = [
     ("env", "Show active env presets"),
     ("env init", "Seed presets.toml from .env"),
     ("env backup", "Backup current .env"),
+    ("env history", "List .env backups"),
+    ("env restore", "Restore .env from a backup"),
+    ("env apply", "Restart backends on the current .env"),
     ("env auth0", "Auth0 presets"),
     ("env prism", "PrismHR presets"),
     ("env db", "Database presets"),
@@ -114,6 +118,8 @@ _COMMAND_DEFS: list[tuple[str, str]] = [
     ("gd", "Git diff"),
     ("gpr", "Create pull request"),
     ("gpr create", "Create pull request"),
+    ("prs", "Open PRs across repos (cached)"),
+    ("prs refresh", "Refetch open PRs now"),
     # Git full commands
     ("git status", "Git status"),
     ("git add", "Stage all changes"),
@@ -123,6 +129,15 @@ _COMMAND_DEFS: list[tuple[str, str]] = [
     ("git log", "Show commit log"),
     ("git diff", "Show diff"),
     ("git pr", "Pull request commands"),
+    ("git prs", "Open PRs across repos"),
+    # Worktrees
+    ("wt", "List worktrees"),
+    ("wt add", "Create worktree for a branch"),
+    ("wt up", "Start servers in a worktree"),
+    ("wt down", "Stop servers in a worktree"),
+    ("wt use", "Point panels at a worktree"),
+    ("wt use main", "Point panels at main checkout"),
+    ("wt rm", "Remove a worktree"),
 ]
 
 
@@ -287,6 +302,10 @@ class HelpScreen(Screen):
                         ("start [be|fe]", "Start servers"),
                         ("down [be|fe]", "Stop servers"),
                         ("status", "Show running"),
+                        ("wt add <name> [branch]", "New worktree + port slot"),
+                        ("wt up/down <name>", "Worktree servers"),
+                        ("wt use <name|main>", "Switch panels"),
+                        ("wt / wt rm <name>", "List / remove"),
                     ],
                     border_style="green",
                 ),
@@ -322,6 +341,9 @@ class HelpScreen(Screen):
                         ("env", "Active presets"),
                         ("env <grp> <pre>", "Swap + restart"),
                         ("env init", "Seed from .env"),
+                        ("env history", "List .env backups"),
+                        ("env restore <n>", "Roll back .env"),
+                        ("env apply", "Restart BE on current .env"),
                     ],
                     border_style="magenta",
                 ),
@@ -335,6 +357,7 @@ class HelpScreen(Screen):
                         ("gpl", "Pull"),
                         ("gl / gd", "Log / diff"),
                         ("gpr", "Pull request"),
+                        ("prs [refresh]", "Open PRs, CI + reviews"),
                     ],
                     border_style="blue",
                 ),
@@ -583,6 +606,7 @@ class SettingsScreen(Screen):
             ("clear_output_on_cmd", "Clear output panel on each command", False),
             ("input_at_top", "Place input bar at top (restart required)", True),
             ("stacked_logs", "Stack log panels full-width (restart required)", True),
+            ("env_restart_prompt", "Suggest a backend restart when .env is edited", False),
         ]
 
         kb_meta: list[tuple[str, str]] = [
@@ -1382,10 +1406,12 @@ class ArmhrApp(App):
     _tailer_keys: set[str] = set()
     _tailer_threads: list[threading.Thread] = []
     _tailer_stop: threading.Event = threading.Event()
+    _tailer_worktree: str | None = None  # worktree the running tailers follow
     _focused_panel: str | None = None  # "be-log", "fe-log", or None
     _active_section: str = "cmd-output"  # last clicked log panel
     _env_select_syncing: bool = True  # Start True; cleared after mount
     _env_mode: str = "individual"  # "individual" or "full"
+    _env_watcher: Any = None  # EnvWatcher, when watchfiles is installed
     _proxy_sessions: list[dict] = []
     _proxy_primary: dict | None = None  # first active session for the bar
     _proxy_auth_needed: bool = False  # True when auth0 enabled + no token
@@ -1542,6 +1568,9 @@ class ArmhrApp(App):
         self.set_interval(1.0, self._refresh_ui_state)
         self.set_interval(5.0, self._refresh_proxy_bar)
         self._start_tailers()
+        self._start_background_fetch()
+        self._start_pr_refresh()
+        self._start_env_watcher()
         # Allow initial Select.Changed events from compose to be ignored
         self.set_timer(0.5, self._clear_env_sync_flag)
         # Initial proxy bar refresh
@@ -1552,6 +1581,33 @@ class ArmhrApp(App):
         """Return all command candidates for the autocomplete dropdown."""
         return _DROPDOWN_ITEMS
 
+    @staticmethod
+    def _start_background_fetch() -> None:
+        """Keep git ahead/behind counts fresh for `gs` across all repos."""
+        from armhr_cli.services.github import GitHubService, configured_repos
+
+        for path in configured_repos().values():
+            GitHubService(cwd=path).start_background_fetch()
+
+    @staticmethod
+    def _start_pr_refresh() -> None:
+        """Warm the PR dashboard cache so `prs` opens instantly."""
+        from armhr_cli.services.pull_requests import pr_dashboard
+
+        pr_dashboard.start()
+
+    def _start_env_watcher(self) -> None:
+        """Follow edits to .env / presets.toml made outside the CLI."""
+        from armhr_cli.services.env_watch import EnvWatcher
+
+        self._env_watcher = EnvWatcher(self._on_env_files_changed, on_error=self._on_env_watch_error)
+        self._env_watcher.start()
+
+    def _on_env_watch_error(self, message: str) -> None:
+        from rich.markup import escape
+
+        self.query_one("#cmd-output", RichLog).write(f"[yellow]![/] [dim]{escape(message)}[/]")
+
     # ------------------------------------------------------------------
     # Log queue drain (runs on main thread via set_interval)
     # Alternates between be/fe each tick to avoid repainting both
@@ -1635,7 +1691,7 @@ class ArmhrApp(App):
         handler = REGISTRY.get(command)
         if handler:
             await handler(args, output)
-            if command in ("start", "up", "down", "env"):
+            if command in ("start", "up", "down", "env", "wt", "worktree"):
                 self._start_tailers()
             if command == "env":
                 self._refresh_env_selects()
@@ -1652,10 +1708,23 @@ class ArmhrApp(App):
     # ------------------------------------------------------------------
 
     def _start_tailers(self) -> None:
-        from armhr_cli.commands.servers import _processes
+        from armhr_cli.commands.servers import _processes, active_worktree, split_key
+
+        if active_worktree != self._tailer_worktree:
+            # Switched worktree: drop the old tailers and replay the new logs
+            self._tailer_stop.set()
+            self._tailer_stop = threading.Event()
+            self._tailer_keys = set()
+            self._tailer_threads = []
+            self._tailer_worktree = active_worktree
+            self.query_one("#be-log", RichLog).clear()
+            self.query_one("#fe-log", RichLog).clear()
+            self._refresh_ui_state()
 
         for key, mp in _processes.items():
-            base_key = key.split(":")[0]
+            base_key, worktree = split_key(key)
+            if worktree != active_worktree:
+                continue
             if base_key in ("be", "fe") and mp.log_file.exists():
                 if key not in self._tailer_keys:
                     self._tailer_keys.add(key)
@@ -1972,20 +2041,16 @@ class ArmhrApp(App):
 
     def _toggle_server(self, key: str) -> None:
         """Toggle a server on/off by key ('be' or 'fe')."""
-        from armhr_cli.commands.servers import _get_or_create, _processes
+        from armhr_cli.commands import servers as srv
 
         try:
             output = self.query_one("#cmd-output", RichLog)
             log_widget = self.query_one(f"#{key}-log", RichLog)
 
-            # Find existing process or create one
-            mp = None
-            for proc_key, proc in _processes.items():
-                if proc_key.split(":")[0] == key:
-                    mp = proc
-                    break
+            # Find existing process (in the active worktree) or create one
+            mp = srv.find_process(key, srv.active_worktree)
             if mp is None:
-                mp = _get_or_create(key)
+                mp = srv._get_or_create(key, worktree=srv.active_worktree)
 
             if mp.is_running:
                 # Stop
@@ -2009,7 +2074,7 @@ class ArmhrApp(App):
 
     def _refresh_ui_state(self) -> None:
         """Update buttons, panel titles, and border accents based on server state."""
-        from armhr_cli.commands.servers import _processes
+        from armhr_cli.commands.servers import active_worktree, find_process
 
         for key, btn_id, log_id, col_id in (
             ("be", "#btn-be", "#be-log", "#col-be"),
@@ -2023,13 +2088,11 @@ class ArmhrApp(App):
             col = self.query_one(col_id, Collapsible)
             label = "BE" if key == "be" else "FE"
             name = "backend" if key == "be" else "frontend"
+            if active_worktree:
+                name += f" @{active_worktree}"
 
             # Find process for this key
-            mp = None
-            for proc_key, proc in _processes.items():
-                if proc_key.split(":")[0] == key:
-                    mp = proc
-                    break
+            mp = find_process(key, active_worktree)
 
             running = mp is not None and mp.is_running
 
@@ -2059,8 +2122,12 @@ class ArmhrApp(App):
     # Env preset dropdowns
     # ------------------------------------------------------------------
 
-    def _refresh_env_selects(self) -> None:
-        """Re-sync the env Select widgets after a swap or seed (e.g. from the `env` command)."""
+    def _refresh_env_selects(self, groups: set[str] | None = None) -> None:
+        """Re-sync the env Select widgets after a swap or seed (e.g. from the `env` command).
+
+        With *groups*, only those group selects are touched; the full-preset
+        select and the summary always are, since they depend on every group.
+        """
         from armhr_cli.config import GROUP_PREFIXES, PRESETS_FILE
         from armhr_cli.services.envfile import (
             identify_active_full_preset,
@@ -2077,6 +2144,8 @@ class ArmhrApp(App):
             # --- Individual group selects ---
             all_presets = list_presets()
             for group in GROUP_PREFIXES:
+                if groups is not None and group not in groups:
+                    continue
                 sel = self.query_one(f"#sel-{group}", Select)
                 preset_names = all_presets.get(group, [])
                 if not preset_names:
@@ -2118,6 +2187,30 @@ class ArmhrApp(App):
         except Exception:
             pass
 
+    def _on_env_files_changed(self, change) -> None:
+        """Watcher callback: update only what the edit to .env / presets.toml affected."""
+        from armhr_cli.services.settings import get_pref
+
+        if change.presets_changed:
+            self._rebuild_dropdown_items()
+        if change.groups:
+            self._refresh_env_selects(groups=change.groups)
+        else:
+            self._refresh_env_summary()
+
+        # Our own swaps already restart the backend; only prompt for outside edits
+        if not change.external or not env.backends_running():
+            return
+        if not get_pref("env_restart_prompt"):
+            return
+        what = ", ".join(sorted(change.groups)) or "other vars"
+        output = self.query_one("#cmd-output", RichLog)
+        output.write(
+            f"[yellow]![/] .env changed outside the CLI ({what}) · "
+            "the running backend still has the old values · 'env apply' to restart it"
+        )
+        self.notify(f".env changed ({what}) · run 'env apply' to restart the backend", severity="warning")
+
     def _clear_env_sync_flag(self) -> None:
         self._env_select_syncing = False
 
@@ -1,16 +1,26 @@
-"""Environment preset commands: env, env <group> <preset>, env init, env backup."""
+"""Environment preset commands: env, env <group> <preset>, env init, env backup,
+env history, env restore <n>, env apply."""
 
+import asyncio
+import time
+
+from rich.markup import escape
 from rich.table import Table
 from textual.widgets import RichLog
 
 from armhr_cli.commands import servers
-from armhr_cli.config import GROUP_PREFIXES, PRESETS_FILE
+from armhr_cli.config import ENV_FILE, GROUP_PREFIXES, MONITORED_PORTS, PRESETS_FILE
+from armhr_cli.services.env_backups import content_hash, list_backups
 from armhr_cli.services.envfile import (
     backup_env,
+    closest_preset,
     identify_active_preset,
     list_presets,
+    read_env,
+    restore_env,
     seed_presets_from_env,
     swap_group,
+    swap_groups,
 )
 
 
@@ -30,6 +40,22 @@ async def cmd_env(args: list[str], output: RichLog) -> None:
         await _backup(output)
         return
 
+    if sub == "history":
+        limit = int(args[1]) if len(args) > 1 and args[1].isdigit() else 15
+        await _history(limit, output)
+        return
+
+    if sub == "apply":
+        await _restart_backends("env apply", output)
+        return
+
+    if sub == "restore":
+        if len(args) < 2 or not args[1].isdigit():
+            output.write("[yellow]![/] Usage: env restore <n>  (n from 'env history')")
+            return
+        await _restore(int(args[1]), output)
+        return
+
     # env <group> <preset>
     if len(args) >= 2:
         group = sub
@@ -43,7 +69,7 @@ async def cmd_env(args: list[str], output: RichLog) -> None:
         return
 
     output.write(f"[red]✗[/] Unknown env sub-command: {sub}")
-    output.write("[dim]Usage: env, env <group> <preset>, env init, env backup[/]")
+    output.write("[dim]Usage: env, env <group> <preset>, env init, env backup, env history, env restore <n>, env apply[/]")
 
 
 # ---------------------------------------------------------------------------
@@ -66,7 +92,13 @@ async def _show_status(output: RichLog, group_filter: str | None = None) -> None
     for group in groups:
         preset_name, rep = identify_active_preset(group)
         style = "green" if preset_name != "custom" else "yellow"
-        table.add_row(group, f"[{style}]{preset_name}[/]", rep or "")
+        if preset_name == "custom":
+            closest = closest_preset(group)
+            if closest:
+                name, differing = closest
+                shown = ", ".join(differing[:3]) + (", …" if len(differing) > 3 else "")
+                rep = f"closest: {name} · {len(differing)} differ: {shown}"
+        table.add_row(group, f"[{style}]{preset_name}[/]", escape(rep or ""))
 
     output.write(table)
 
@@ -85,84 +117,125 @@ async def _show_status(output: RichLog, group_filter: str | None = None) -> None
 
 
 async def _swap(group: str, preset_name: str, output: RichLog) -> None:
-    """Swap a group to a preset and restart running servers."""
-    ok, msg = swap_group(group, preset_name)
+    """Swap a group to a preset and restart running servers if anything changed."""
+    ok, msg, changed = swap_group(group, preset_name)
     if not ok:
         output.write(f"[red]✗[/] {msg}")
         return
 
     output.write(f"[green]✓[/] {msg}")
-
-    # Restart running backend servers so they pick up the new env
-    # (frontend doesn't read .env, so skip it)
-    restarted: list[str] = []
-    for proc_key, mp in servers._processes.items():
-        if not mp.is_running or not proc_key.startswith("be:"):
-            continue
-
-        # Write a separator to the log file before restarting
-        if mp.log_file.exists():
-            with open(mp.log_file, "a") as f:
-                f.write(f"\n--- env {group} → {preset_name} · restarting ---\n\n")
-
-        ok_stop, stop_msg = mp.stop()
-        if ok_stop:
-            ok_start, start_msg = mp.start()
-            if ok_start:
-                restarted.append(f"{mp.name} (pid {mp.pid})")
-                output.write(f"[green]✓[/] Restarted {start_msg}")
-            else:
-                output.write(f"[red]✗[/] Failed to restart {mp.name}: {start_msg}")
-        else:
-            output.write(f"[red]✗[/] Failed to stop {mp.name}: {stop_msg}")
-
-    if not restarted:
-        output.write("[dim]No backend servers were running — start with 'start' to apply.[/]")
+    await _restart_backends(f"env {group} → {preset_name}", output, changed)
 
 
 async def _swap_all(mapping: dict[str, str], output: RichLog) -> None:
     """Swap every group according to *mapping* and restart BE servers once.
 
     *mapping* is ``{group: preset_name}`` — typically from a full preset.
-    All groups are swapped first (so only one backup + one restart cycle).
+    All groups are swapped in one rewrite of .env (one backup, one atomic
+    write), then running backends restart once.
     """
-    # 1. Swap each group (swap_group backs up on each call, which is fine)
-    any_failed = False
-    for group, preset_name in mapping.items():
-        ok, msg = swap_group(group, preset_name)
-        if ok:
-            output.write(f"[green]✓[/] {msg}")
-        else:
-            output.write(f"[red]✗[/] {msg}")
-            any_failed = True
-
-    if any_failed:
+    # 1. Swap all groups together; nothing is written if any preset is missing
+    ok, msg, changed = swap_groups(mapping)
+    if not ok:
+        output.write(f"[red]✗[/] {msg}")
         return
+    output.write(f"[green]✓[/] {msg}")
 
     # 2. Restart running backend servers once
     label = ", ".join(f"{g}→{p}" for g, p in mapping.items())
-    restarted: list[str] = []
-    for proc_key, mp in servers._processes.items():
-        if not mp.is_running or not proc_key.startswith("be:"):
+    await _restart_backends(f"env full swap ({label})", output, changed)
+
+
+def backends_running() -> bool:
+    """True if any backend server (main checkout or worktree) is up."""
+    return any(
+        mp.is_running and servers.split_key(key)[0] == "be"
+        for key, mp in servers._processes.items()
+    )
+
+
+# How long a restarted backend gets to accept connections (migrations + imports)
+READY_TIMEOUT = 120.0
+
+
+def _backend_port(mp: servers.ManagedProcess) -> int:
+    """Port a backend listens on: its slot's PORT for worktrees, else UV_PORT."""
+    port = mp.env.get("PORT") or read_env().active.get("UV_PORT", "").strip("\"'")
+    return int(port) if port.isdigit() else int(MONITORED_PORTS["backend"]["base"])  # type: ignore[arg-type]
+
+
+async def _wait_ready(mp: servers.ManagedProcess, port: int) -> tuple[bool, str]:
+    """Poll until *port* accepts connections, the process dies, or the timeout."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + READY_TIMEOUT
+    while loop.time() < deadline:
+        if not mp.is_running:
+            return False, f"{mp.name} exited during startup · check its log"
+        try:
+            _reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.5)
             continue
+        writer.close()
+        return True, ""
+    return False, f"{mp.name} not listening on :{port} after {READY_TIMEOUT:.0f}s"
+
+
+async def _restart_one(mp: servers.ManagedProcess, reason: str, output: RichLog) -> bool:
+    # Write a separator to the log file before restarting
+    if mp.log_file.exists():
+        with open(mp.log_file, "a") as f:
+            f.write(f"\n--- {reason} · restarting ---\n\n")
+
+    started = time.monotonic()
+    # stop() can block for seconds waiting on the process tree; keep the UI responsive
+    ok_stop, stop_msg = await asyncio.to_thread(mp.stop)
+    if not ok_stop:
+        output.write(f"[red]✗[/] Failed to stop {mp.name}: {stop_msg}")
+        return False
+    ok_start, start_msg = await asyncio.to_thread(mp.start)
+    if not ok_start:
+        output.write(f"[red]✗[/] Failed to restart {mp.name}: {start_msg}")
+        return False
+
+    port = _backend_port(mp)
+    ready, err = await _wait_ready(mp, port)
+    if not ready:
+        output.write(f"[red]✗[/] {escape(err)}")
+        return False
+    output.write(
+        f"[green]✓[/] Restarted {mp.name} (pid {mp.pid}) · ready on :{port} "
+        f"[dim]in {time.monotonic() - started:.1f}s[/]"
+    )
+    return True
+
+
+async def _restart_backends(reason: str, output: RichLog, changed: set[str] | None = None) -> None:
+    """Restart running backend servers so they pick up the new env.
+
+    *changed* is the set of .env keys a swap actually changed; when it is
+    empty the backends already have the right values and are left alone
+    (None means unknown, e.g. ``env apply``, so always restart). All
+    running backends restart concurrently, each waited on until it accepts
+    connections. The frontend doesn't read .env, so it is left alone.
+    """
+    if changed is not None and not changed:
+        output.write("[dim]No env values changed · servers left running[/]")
+        return
 
-        if mp.log_file.exists():
-            with open(mp.log_file, "a") as f:
-                f.write(f"\n--- env full swap ({label}) · restarting ---\n\n")
-
-        ok_stop, stop_msg = mp.stop()
-        if ok_stop:
-            ok_start, start_msg = mp.start()
-            if ok_start:
-                restarted.append(f"{mp.name} (pid {mp.pid})")
-                output.write(f"[green]✓[/] Restarted {start_msg}")
-            else:
-                output.write(f"[red]✗[/] Failed to restart {mp.name}: {start_msg}")
-        else:
-            output.write(f"[red]✗[/] Failed to stop {mp.name}: {stop_msg}")
-
-    if not restarted:
+    running = [
+        mp
+        for proc_key, mp in servers._processes.items()
+        if mp.is_running and servers.split_key(proc_key)[0] == "be"
+    ]
+    if not running:
         output.write("[dim]No backend servers were running — start with 'start' to apply.[/]")
+        return
+
+    if changed:
+        keys = ", ".join(sorted(changed)[:6]) + (f" +{len(changed) - 6}" if len(changed) > 6 else "")
+        output.write(f"[dim]Changed: {escape(keys)} · restarting {len(running)} backend(s)...[/]")
+    await asyncio.gather(*(_restart_one(mp, reason, output) for mp in running))
 
 
 async def _init(output: RichLog) -> None:
@@ -178,11 +251,49 @@ async def _init(output: RichLog) -> None:
 async def _backup(output: RichLog) -> None:
     """Manually back up the current .env."""
     try:
-        path = backup_env()
-        output.write(f"[green]✓[/] Backed up .env → {path.name}")
+        entry = backup_env()
+        output.write(f"[green]✓[/] Backed up .env → {entry.short}")
     except Exception as e:
         output.write(f"[red]✗[/] Backup failed: {e}")
 
 
+async def _history(limit: int, output: RichLog) -> None:
+    """List .env backups, newest first."""
+    backups = list_backups()
+    if not backups:
+        output.write("[dim]No backups yet.[/]")
+        return
+
+    current = content_hash(ENV_FILE.read_bytes()) if ENV_FILE.exists() else None
+    table = Table(show_header=True, header_style="bold dim", box=None, padding=(0, 2))
+    table.add_column("#", justify="right")
+    table.add_column("When")
+    table.add_column("Hash", style="dim")
+    table.add_column("Size", justify="right", style="dim")
+    table.add_column("Label")
+    for i, entry in enumerate(backups[:limit], start=1):
+        marker = " [green]● current[/]" if entry.sha == current else ""
+        table.add_row(
+            str(i),
+            entry.at.strftime("%Y-%m-%d %H:%M:%S"),
+            entry.short,
+            f"{entry.size:,}",
+            escape(entry.label) + marker,
+        )
+    output.write(table)
+    unique = len({e.sha for e in backups})
+    output.write(f"[dim]{len(backups)} backups · {unique} unique versions · 'env restore <n>' to roll back[/]")
+
+
+async def _restore(n: int, output: RichLog) -> None:
+    """Restore .env from backup *n* and restart running backends."""
+    ok, msg, changed = restore_env(n)
+    if not ok:
+        output.write(f"[red]✗[/] {escape(msg)}")
+        return
+    output.write(f"[green]✓[/] {escape(msg)}")
+    await _restart_backends(f"env restore #{n}", output, changed)
+
+
 def register(registry: dict) -> None:
     registry["env"] = cmd_env
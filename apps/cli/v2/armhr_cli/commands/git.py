@@ -1,7 +1,8 @@
 """Git commands and shortcuts.
 
-Multi-repo aware: `gs` shows status for both backend and frontend.
-Handlers write output to a RichLog widget.
+Multi-repo aware: commands fan out concurrently over backend, frontend and
+any extra repos from [repos] in settings.toml, printing each repo as it
+finishes. Handlers write output to a RichLog widget.
 """
 
 from rich.markup import escape
@@ -10,13 +11,9 @@ from rich.table import Table
 from rich.tree import Tree
 from textual.widgets import RichLog
 
-from armhr_cli.config import BACKEND_ROOT, FRONTEND_ROOT
-from armhr_cli.services.github import GitHubService
-
-_REPOS = {
-    "backend": BACKEND_ROOT,
-    "frontend": FRONTEND_ROOT,
-}
+from armhr_cli.config import BACKEND_ROOT
+from armhr_cli.services.github import GitHubService, GitStatus, run_per_repo
+from armhr_cli.services.pull_requests import pr_dashboard
 
 
 # ---------------------------------------------------------------------------
@@ -24,57 +21,89 @@ _REPOS = {
 # ---------------------------------------------------------------------------
 
 
-async def _git_status(_args: list[str], output: RichLog):
-    """Show git status for both repos."""
-    for name, path in _REPOS.items():
-        svc = GitHubService(cwd=path)
-        status = await svc.get_status()
-        if not status:
-            output.write(f"[red]✗[/] {name}: not a git repo")
-            continue
+def _fetched_str(age: float | None) -> str:
+    if age is None:
+        return "never fetched"
+    if age < 60:
+        return "fetched just now"
+    if age < 3600:
+        return f"fetched {int(age // 60)}m ago"
+    if age < 86400:
+        return f"fetched {int(age // 3600)}h ago"
+    return f"fetched {int(age // 86400)}d ago"
 
-        header = f"[bold]{status.branch}[/]"
-        if status.ahead or status.behind:
-            header += f"  [dim]↑{status.ahead} ↓{status.behind}[/]"
-        tree = Tree(header)
-
-        if status.staged:
-            branch = tree.add(f"[green]Staged ({len(status.staged)})[/]")
-            for f in status.staged[:8]:
-                branch.add(f"[green]+[/] [dim]{f}[/]")
-            if len(status.staged) > 8:
-                branch.add(f"[dim]...+{len(status.staged) - 8} more[/]")
-
-        if status.unstaged:
-            branch = tree.add(f"[yellow]Modified ({len(status.unstaged)})[/]")
-            for f in status.unstaged[:8]:
-                branch.add(f"[yellow]~[/] [dim]{f}[/]")
-            if len(status.unstaged) > 8:
-                branch.add(f"[dim]...+{len(status.unstaged) - 8} more[/]")
-
-        if status.untracked:
-            branch = tree.add(f"[red]Untracked ({len(status.untracked)})[/]")
-            for f in status.untracked[:8]:
-                branch.add(f"[red]?[/] [dim]{f}[/]")
-            if len(status.untracked) > 8:
-                branch.add(f"[dim]...+{len(status.untracked) - 8} more[/]")
-
-        subtitle = "[green]✓ clean[/]" if status.is_clean else ""
-        output.write(
-            Panel(
-                tree,
-                title=f"[bold]{name}[/]",
-                subtitle=subtitle,
-                border_style="dim",
-                padding=(0, 1),
-            )
+
+def _render_status(name: str, status: GitStatus | None, output: RichLog):
+    if not status:
+        output.write(f"[red]✗[/] {name}: not a git repo")
+        return
+
+    header = f"[bold]{status.branch}[/]"
+    if status.ahead or status.behind:
+        header += f"  [dim]↑{status.ahead} ↓{status.behind}[/]"
+    if status.upstream:
+        header += f"  [dim]· {_fetched_str(status.fetch_age)}[/]"
+    tree = Tree(header)
+
+    if status.conflicted:
+        branch = tree.add(f"[bold red]Conflicts ({len(status.conflicted)})[/]")
+        for f in status.conflicted[:8]:
+            branch.add(f"[bold red]![/] [dim]{escape(f)}[/]")
+        if len(status.conflicted) > 8:
+            branch.add(f"[dim]...+{len(status.conflicted) - 8} more[/]")
+
+    if status.staged:
+        branch = tree.add(f"[green]Staged ({len(status.staged)})[/]")
+        for f in status.staged[:8]:
+            if f in status.renamed:
+                branch.add(f"[green]→[/] [dim]{escape(status.renamed[f])} → {escape(f)}[/]")
+            else:
+                branch.add(f"[green]+[/] [dim]{escape(f)}[/]")
+        if len(status.staged) > 8:
+            branch.add(f"[dim]...+{len(status.staged) - 8} more[/]")
+
+    if status.unstaged:
+        branch = tree.add(f"[yellow]Modified ({len(status.unstaged)})[/]")
+        for f in status.unstaged[:8]:
+            branch.add(f"[yellow]~[/] [dim]{escape(f)}[/]")
+        if len(status.unstaged) > 8:
+            branch.add(f"[dim]...+{len(status.unstaged) - 8} more[/]")
+
+    if status.untracked:
+        branch = tree.add(f"[red]Untracked ({len(status.untracked)})[/]")
+        for f in status.untracked[:8]:
+            branch.add(f"[red]?[/] [dim]{escape(f)}[/]")
+        if len(status.untracked) > 8:
+            branch.add(f"[dim]...+{len(status.untracked) - 8} more[/]")
+
+    subtitle = "[green]✓ clean[/]" if status.is_clean else ""
+    output.write(
+        Panel(
+            tree,
+            title=f"[bold]{name}[/]",
+            subtitle=subtitle,
+            border_style="dim",
+            padding=(0, 1),
         )
+    )
+
+
+def _write_result(name: str, ok: bool, out: str, done: str, output: RichLog):
+    if ok:
+        output.write(f"[green]✓[/] [{name}] {done}")
+    else:
+        first_line = out.split("\n")[0] if out else "Failed"
+        output.write(f"[red]✗[/] [{name}] {escape(first_line)}")
+
+
+async def _git_status(_args: list[str], output: RichLog):
+    """Show git status for all repos, each as soon as it is ready."""
+    async for name, status in run_per_repo(lambda _n, svc: svc.get_status()):
+        _render_status(name, status, output)
 
 
 async def _git_add(_args: list[str], output: RichLog):
-    for name, path in _REPOS.items():
-        svc = GitHubService(cwd=path)
-        ok, _ = await svc.add_files()
+    async for name, (ok, _) in run_per_repo(lambda _n, svc: svc.add_files()):
         if ok:
             output.write(f"[green]✓[/] [{name}] staged all changes")
         else:
@@ -83,60 +112,44 @@ async def _git_add(_args: list[str], output: RichLog):
 
 async def _git_commit(args: list[str], output: RichLog):
     """Commit changes. Auto-stages if nothing staged. Message from args."""
-    for name, path in _REPOS.items():
-        svc = GitHubService(cwd=path)
+    message = " ".join(args)
+
+    async def _commit_one(name: str, svc: GitHubService) -> list[tuple[bool, str, str]]:
+        results: list[tuple[bool, str, str]] = []
         status = await svc.get_status()
         if status and not status.staged and status.has_changes:
             ok, _ = await svc.add_files()
             if ok:
-                output.write(f"[green]✓[/] [{name}] staged all changes")
+                results.append((True, "", "staged all changes"))
+                status = await svc.get_status()
+        if not message or not status or not status.staged:
+            return results
+        ok, out = await svc.commit(message)
+        results.append((ok, out, "committed"))
+        return results
+
+    async for name, results in run_per_repo(_commit_one):
+        for ok, out, done in results:
+            _write_result(name, ok, out, done, output)
 
     if not args:
         output.write("[yellow]![/] Usage: gc <message>")
         output.write("[dim]Provide the commit message as arguments, e.g.: gc fix login bug[/]")
-        return
-    message = " ".join(args)
-
-    for name, path in _REPOS.items():
-        svc = GitHubService(cwd=path)
-        status = await svc.get_status()
-        if not status or not status.staged:
-            continue
-        ok, out = await svc.commit(message)
-        if ok:
-            output.write(f"[green]✓[/] [{name}] committed")
-        else:
-            first_line = out.split("\n")[0] if out else "Failed"
-            output.write(f"[red]✗[/] [{name}] {escape(first_line)}")
 
 
 async def _git_push(args: list[str], output: RichLog):
     set_upstream = "origin" in args or "-u" in args
-    for name, path in _REPOS.items():
-        svc = GitHubService(cwd=path)
-        ok, out = await svc.push(set_upstream=set_upstream)
-        if ok:
-            output.write(f"[green]✓[/] [{name}] pushed")
-        else:
-            first_line = out.split("\n")[0] if out else "Failed"
-            output.write(f"[red]✗[/] [{name}] {escape(first_line)}")
+    async for name, (ok, out) in run_per_repo(lambda _n, svc: svc.push(set_upstream=set_upstream)):
+        _write_result(name, ok, out, "pushed", output)
 
 
 async def _git_pull(_args: list[str], output: RichLog):
-    for name, path in _REPOS.items():
-        svc = GitHubService(cwd=path)
-        ok, out = await svc.pull()
-        if ok:
-            output.write(f"[green]✓[/] [{name}] pulled")
-        else:
-            first_line = out.split("\n")[0] if out else "Failed"
-            output.write(f"[red]✗[/] [{name}] {escape(first_line)}")
+    async for name, (ok, out) in run_per_repo(lambda _n, svc: svc.pull()):
+        _write_result(name, ok, out, "pulled", output)
 
 
 async def _git_log(_args: list[str], output: RichLog):
-    for name, path in _REPOS.items():
-        svc = GitHubService(cwd=path)
-        commits = await svc.get_log(10)
+    async for name, commits in run_per_repo(lambda _n, svc: svc.get_log(10)):
         if not commits:
             output.write(f"[dim][{name}] No commits[/]")
             continue
@@ -160,9 +173,7 @@ async def _git_log(_args: list[str], output: RichLog):
 
 
 async def _git_diff(_args: list[str], output: RichLog):
-    for name, path in _REPOS.items():
-        svc = GitHubService(cwd=path)
-        ok, diff_output = await svc.diff()
+    async for name, (ok, diff_output) in run_per_repo(lambda _n, svc: svc.diff()):
         if ok and diff_output.strip():
             output.write(f"[bold]{name}[/]")
             for line in diff_output.split("\n")[:50]:
@@ -199,26 +210,90 @@ async def _git_pr(args: list[str], output: RichLog):
             first_line = out.split("\n")[0] if out else "Failed"
             output.write(f"[red]✗[/] {escape(first_line)}")
     else:
-        prs = await svc.list_prs()
-        if not prs:
+        await _git_prs(args[1:] if args and args[0] == "list" else args, output)
+
+
+_CHECK_DISPLAY = {
+    "SUCCESS": "[green]✓[/]",
+    "FAILURE": "[red]✗[/]",
+    "ERROR": "[red]✗[/]",
+    "PENDING": "[yellow]●[/]",
+    "EXPECTED": "[yellow]●[/]",
+}
+
+_REVIEW_DISPLAY = {
+    "APPROVED": "[green]approved[/]",
+    "CHANGES_REQUESTED": "[red]changes[/]",
+    "REVIEW_REQUIRED": "[yellow]review[/]",
+}
+
+
+def _age_str(seconds: float) -> str:
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h"
+    return f"{int(seconds // 86400)}d"
+
+
+async def _git_prs(args: list[str], output: RichLog):
+    """Open PRs across all repos from the cached dashboard (`refresh` forces a fetch)."""
+    try:
+        snap = await pr_dashboard.get(fresh=bool(args and args[0] == "refresh"))
+    except Exception as e:
+        output.write(f"[red]✗[/] Couldn't load pull requests: {escape(str(e).strip() or type(e).__name__)}")
+        return
+
+    if pr_dashboard.last_error:
+        output.write(f"[yellow]![/] Last refresh failed, showing older data: {escape(pr_dashboard.last_error)}")
+    for name, error in snap.errors.items():
+        output.write(f"[red]✗[/] [{name}] {escape(error.splitlines()[0] if error else 'failed')}")
+
+    prs = [pr for repo_prs in snap.prs.values() for pr in repo_prs]
+    if not prs:
+        if snap.prs:
             output.write("[dim]No open pull requests[/]")
-            return
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column(style="yellow")
-        table.add_column()
-        table.add_column(style="dim")
-        for pr in prs:
-            table.add_row(f"#{pr.number}", pr.title[:45], pr.head_branch)
-        output.write(
-            Panel(
-                table,
-                border_style="dim",
-                padding=(0, 1),
-                title="[bold]Open PRs[/]",
-                title_align="left",
-            )
+        return
+
+    now = snap.fetched_at
+    table = Table(show_header=True, header_style="bold dim", box=None, padding=(0, 1))
+    table.add_column("repo", style="dim")
+    table.add_column("#", style="yellow", justify="right")
+    table.add_column("title")
+    table.add_column("ci", justify="center")
+    table.add_column("review")
+    table.add_column("author", style="dim")
+    table.add_column("updated", style="dim", justify="right")
+    for pr in sorted(prs, key=lambda p: p.updated_at, reverse=True):
+        title = escape(pr.title[:50])
+        if pr.draft:
+            title = f"[dim]{title} (draft)[/]"
+        table.add_row(
+            pr.repo,
+            str(pr.number),
+            title,
+            _CHECK_DISPLAY.get(pr.checks or "", "[dim]–[/]"),
+            _REVIEW_DISPLAY.get(pr.review or "", "[dim]–[/]"),
+            pr.author,
+            _age_str(now - pr.updated_at.timestamp()),
         )
 
+    subtitle = f"[dim]as of {_age_str(snap.age)} ago"
+    subtitle += " · refreshing[/]" if pr_dashboard.refreshing else "[/]"
+    output.write(
+        Panel(
+            table,
+            border_style="dim",
+            padding=(0, 1),
+            title=f"[bold]Open PRs ({len(prs)})[/]",
+            title_align="left",
+            subtitle=subtitle,
+            subtitle_align="right",
+        )
+    )
+
 
 # ---------------------------------------------------------------------------
 # Dispatch
@@ -233,6 +308,7 @@ _GIT_SUBCOMMANDS: dict = {
     "log": _git_log,
     "diff": _git_diff,
     "pr": _git_pr,
+    "prs": _git_prs,
 }
 
 
@@ -293,6 +369,10 @@ async def _shortcut_gpr(args, o: RichLog):
         await _git_pr(["create"], o)
 
 
+async def _shortcut_prs(args, o: RichLog):
+    await _git_prs(args, o)
+
+
 def register(registry: dict):
     registry["git"] = cmd_git
     registry["gs"] = _shortcut_gs
@@ -304,3 +384,4 @@ def register(registry: dict):
     registry["gl"] = _shortcut_gl
     registry["gd"] = _shortcut_gd
     registry["gpr"] = _shortcut_gpr
+    registry["prs"] = _shortcut_prs
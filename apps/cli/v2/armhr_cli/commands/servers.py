@@ -16,7 +16,8 @@ from pathlib import Path
 from rich.table import Table
 from textual.widgets import RichLog
 
-from armhr_cli.config import FRONTEND_APPS, MANAGED_SERVERS
+from armhr_cli.config import ENV_FILE, FRONTEND_APPS, MANAGED_SERVERS
+from armhr_cli.services.worktrees import get_worktree
 
 STATE_DIR = Path.home() / ".armhr"
 LOG_DIR = STATE_DIR / "logs"
@@ -195,23 +196,72 @@ class ManagedProcess:
 
 _processes: dict[str, ManagedProcess] = {}
 
+# Worktree whose servers the BE/FE panels and buttons follow (None = main checkout)
+active_worktree: str | None = None
 
-def _get_or_create(key: str, fe_app: str | None = None) -> ManagedProcess:
-    effective_key = f"{key}:{fe_app}" if key == "fe" and fe_app else key
+
+def process_key(key: str, fe_app: str | None = None, worktree: str | None = None) -> str:
+    """Registry key: be, fe:hcm, be@<worktree>, fe@<worktree>:hcm."""
+    effective_key = f"{key}@{worktree}" if worktree else key
+    if key == "fe" and fe_app:
+        effective_key += f":{fe_app}"
+    return effective_key
+
+
+def split_key(proc_key: str) -> tuple[str, str | None]:
+    """(be|fe, worktree or None) for a registry key."""
+    base, _, worktree = proc_key.split(":")[0].partition("@")
+    return base, worktree or None
+
+
+def find_process(key: str, worktree: str | None = None) -> ManagedProcess | None:
+    """First registered be/fe process belonging to ``worktree``."""
+    for proc_key, proc in _processes.items():
+        if split_key(proc_key) == (key, worktree):
+            return proc
+    return None
+
+
+def _get_or_create(
+    key: str,
+    fe_app: str | None = None,
+    worktree: str | None = None,
+) -> ManagedProcess:
+    if worktree and key == "fe":
+        # Worktree frontends always run one app so it can be given its slot's port
+        fe_app = fe_app or FRONTEND_APPS[0]
+    effective_key = process_key(key, fe_app, worktree)
     if effective_key in _processes:
         return _processes[effective_key]
 
     server_def = MANAGED_SERVERS[key]
     cmd = list(server_def["cmd"])
+    cwd = Path(server_def["cwd"])
+    env = dict(server_def.get("env", {}))
     if key == "fe" and fe_app:
         cmd = ["yarn", f"start:{fe_app}"]
 
+    name = server_def["name"]
+    if worktree:
+        wt = get_worktree(worktree)
+        if wt is None:
+            raise KeyError(f"no worktree named '{worktree}'")
+        name += f"@{worktree}"
+        if key == "be":
+            cwd = wt.paths["backend"]
+            # .env is untracked, so worktrees share the main checkout's
+            cmd = [str(ENV_FILE) if a == ".env" else a for a in cmd]
+            env["PORT"] = str(wt.port("backend"))
+        else:
+            cwd = wt.paths["frontend"]
+            cmd = ["yarn", f"start:{fe_app}", "--port", str(wt.port(fe_app)), "--strictPort"]
+
     mp = ManagedProcess(
         key=effective_key,
-        name=server_def["name"] + (f":{fe_app}" if fe_app else ""),
+        name=name + (f":{fe_app}" if fe_app else ""),
         cmd=cmd,
-        cwd=Path(server_def["cwd"]),
-        env=dict(server_def.get("env", {})),
+        cwd=cwd,
+        env=env,
     )
     _processes[effective_key] = mp
     return mp
@@ -252,8 +302,7 @@ async def cmd_down(args: list[str], output: RichLog):
         output.write("[red]✗[/] Unknown target. Options: be, fe")
         return
     for key, fe_app in targets:
-        effective_key = f"{key}:{fe_app}" if key == "fe" and fe_app else key
-        mp = _processes.get(effective_key)
+        mp = _processes.get(process_key(key, fe_app))
         if not mp or not mp.is_running:
             name = f"{key}" + (f":{fe_app}" if fe_app else "")
             output.write(f"[dim]{name} not running[/]")
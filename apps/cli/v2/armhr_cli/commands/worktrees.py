@@ -0,0 +1,197 @@
+"""Worktree commands: wt add / list / up / down / use / rm.
+
+Each worktree runs its own backend and frontend on the ports of its slot,
+with its own log files, so several branches can stay up at once. `wt use`
+points the BE/FE panels and buttons at a worktree without restarting
+anything.
+"""
+
+from rich.markup import escape
+from rich.table import Table
+from textual.widgets import RichLog
+
+from armhr_cli.commands import servers
+from armhr_cli.services.worktrees import (
+    MAX_SLOT,
+    create_worktree,
+    get_worktree,
+    list_worktrees,
+    remove_worktree,
+)
+
+
+def _running_in(name: str | None) -> list[servers.ManagedProcess]:
+    """Running servers of a worktree (None = main checkout)."""
+    return [
+        mp
+        for key, mp in servers._processes.items()
+        if servers.split_key(key)[1] == name and mp.is_running
+    ]
+
+
+async def _wt_list(_args: list[str], output: RichLog):
+    worktrees = list_worktrees()
+    if not worktrees:
+        output.write("[dim]No worktrees. Use 'wt add <name> [branch]'.[/]")
+        return
+
+    table = Table(
+        show_header=True,
+        header_style="bold dim",
+        box=None,
+        padding=(0, 2),
+        expand=False,
+    )
+    table.add_column("")
+    table.add_column("Worktree")
+    table.add_column("Branch")
+    table.add_column("Slot", justify="right")
+    table.add_column("Ports")
+    table.add_column("Running")
+
+    active = servers.active_worktree
+    table.add_row(
+        "[cyan]▶[/]" if active is None else "",
+        "[bold]main[/]",
+        "[dim]-[/]",
+        "[dim]0[/]",
+        "[dim]base[/]",
+        ", ".join(mp.name for mp in _running_in(None)) or "[dim]-[/]",
+    )
+    for wt in worktrees:
+        running = _running_in(wt.name)
+        table.add_row(
+            "[cyan]▶[/]" if active == wt.name else "",
+            f"[bold]{escape(wt.name)}[/]",
+            escape(wt.branch),
+            f"[dim]{wt.slot}[/]",
+            f"[dim]be {wt.port('backend')} · fe +{wt.slot}[/]",
+            ", ".join(f"[green]{mp.name}[/]" for mp in running) or "[dim]-[/]",
+        )
+    output.write(table)
+    output.write(f"[dim]{len(worktrees)}/{MAX_SLOT} slots used[/]")
+
+
+async def _wt_add(args: list[str], output: RichLog):
+    if not args:
+        output.write("[yellow]![/] Usage: wt add <name> [branch]")
+        return
+    name = args[0]
+    branch = args[1] if len(args) > 1 else name
+    if "@" in name or ":" in name or "/" in name:
+        output.write("[red]✗[/] Worktree names can't contain @, : or /")
+        return
+
+    output.write(f"[dim]Creating worktree {escape(name)} for {escape(branch)}...[/]")
+    ok, messages = await create_worktree(name, branch)
+    for msg in messages:
+        output.write(f"[dim]  {escape(msg)}[/]")
+    if not ok:
+        output.write(f"[red]✗[/] Could not create worktree {escape(name)}")
+        return
+
+    wt = get_worktree(name)
+    assert wt is not None
+    output.write(
+        f"[green]✓[/] Worktree {escape(name)} · slot {wt.slot} · backend :{wt.port('backend')}"
+    )
+    output.write("[dim]Install frontend deps there before the first 'wt up' (yarn install)[/]")
+
+
+async def _wt_up(args: list[str], output: RichLog):
+    if not args:
+        output.write("[yellow]![/] Usage: wt up <name> [be|fe [app]]")
+        return
+    name, rest = args[0], args[1:]
+    if get_worktree(name) is None:
+        output.write(f"[red]✗[/] No worktree named '{escape(name)}'")
+        return
+    targets = servers._resolve_target(rest)
+    if not targets:
+        output.write("[red]✗[/] Unknown target. Options: be, fe")
+        return
+    for key, fe_app in targets:
+        try:
+            mp = servers._get_or_create(key, fe_app, worktree=name)
+        except KeyError as e:
+            output.write(f"[red]✗[/] {escape(e.args[0])}")
+            continue
+        ok, msg = mp.start()
+        output.write(f"[green]✓[/] {msg}" if ok else f"[red]✗[/] {msg}")
+
+
+async def _wt_down(args: list[str], output: RichLog):
+    if not args:
+        output.write("[yellow]![/] Usage: wt down <name> [be|fe]")
+        return
+    name, rest = args[0], args[1:]
+    keys = {key for key, _ in servers._resolve_target(rest)}
+    stopped = False
+    for proc_key, mp in servers._processes.items():
+        key, worktree = servers.split_key(proc_key)
+        if worktree == name and key in keys and mp.is_running:
+            ok, msg = mp.stop()
+            output.write(f"[green]✓[/] {msg}" if ok else f"[red]✗[/] {msg}")
+            stopped = True
+    if not stopped:
+        output.write(f"[dim]Nothing running in {escape(name)}[/]")
+
+
+async def _wt_use(args: list[str], output: RichLog):
+    if not args:
+        output.write("[yellow]![/] Usage: wt use <name|main>")
+        return
+    name = args[0]
+    if name == "main":
+        servers.active_worktree = None
+        output.write("[green]✓[/] Panels following main checkout")
+        return
+    if get_worktree(name) is None:
+        output.write(f"[red]✗[/] No worktree named '{escape(name)}'")
+        return
+    servers.active_worktree = name
+    output.write(f"[green]✓[/] Panels following worktree {escape(name)}")
+
+
+async def _wt_rm(args: list[str], output: RichLog):
+    if not args:
+        output.write("[yellow]![/] Usage: wt rm <name>")
+        return
+    name = args[0]
+    for mp in _running_in(name):
+        mp.stop()
+    ok, msg = await remove_worktree(name)
+    if ok:
+        for key in [k for k in servers._processes if servers.split_key(k)[1] == name]:
+            del servers._processes[key]
+        if servers.active_worktree == name:
+            servers.active_worktree = None
+    output.write(f"[green]✓[/] {escape(msg)}" if ok else f"[red]✗[/] {escape(msg)}")
+
+
+_WT_SUBCOMMANDS: dict = {
+    "list": _wt_list,
+    "ls": _wt_list,
+    "add": _wt_add,
+    "up": _wt_up,
+    "down": _wt_down,
+    "use": _wt_use,
+    "rm": _wt_rm,
+    "remove": _wt_rm,
+}
+
+
+async def cmd_wt(args: list[str], output: RichLog):
+    if not args:
+        args = ["list"]
+    subcmd = args[0].lower()
+    handler = _WT_SUBCOMMANDS.get(subcmd)
+    if handler:
+        await handler(args[1:], output)
+    else:
+        output.write(f"[red]✗[/] Unknown: wt {subcmd}")
+
+
+def register(registry: dict):
+    registry["wt"] = cmd_wt
+    registry["worktree"] = cmd_wt
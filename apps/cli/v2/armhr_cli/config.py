@@ -55,6 +55,16 @@ CLEAR_OUTPUT_ON_CMD: bool = _get_pref("clear_output_on_cmd")
 INPUT_AT_TOP: bool = _get_pref("input_at_top")
 STACKED_LOGS: bool = _get_pref("stacked_logs")
 
+
+def _get_git_repos() -> dict[str, Path]:
+    from armhr_cli.services.settings import get_extra_repos
+
+    return {"backend": BACKEND_ROOT, "frontend": FRONTEND_ROOT, **get_extra_repos()}
+
+
+# Repos the git commands fan out over; add more under [repos] in settings.toml
+GIT_REPOS: dict[str, Path] = _get_git_repos()
+
 # ── Monitored ports for process cleanup ──
 # Each entry: base port + range of ports to scan (Vite auto-increments on conflict)
 MONITORED_PORTS: dict[str, dict[str, object]] = {
@@ -14,6 +14,7 @@ import httpx
 
 from armhr_cli.config import ENV_FILE
 from armhr_cli.services.auth import get_access_token
+from armhr_cli.services.dotenv import get_var
 
 # ── Timeout config ──────────────────────────────────────────────────────
 
@@ -51,17 +52,8 @@ PROXY_CATEGORIES: list[str] = [
 
 
 def _get_base_url() -> str:
-    """Read UV_PORT from .env and return the ops API base URL."""
-    port = "8000"
-    try:
-        if ENV_FILE.exists():
-            for line in ENV_FILE.read_text().splitlines():
-                line = line.strip()
-                if line.startswith("UV_PORT="):
-                    port = line.split("=", 1)[1].strip().strip('"').strip("'")
-                    break
-    except Exception:
-        pass
+    """Return the ops API base URL for the UV_PORT in .env (cached, no I/O per call)."""
+    port = get_var(ENV_FILE, "UV_PORT") or "8000"
     return f"http://localhost:{port}/ops"
 
 
@@ -23,13 +23,13 @@ import threading
 import time
 import webbrowser
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import httpx
 
 from armhr_cli.config import ENV_FILE, FRONTEND_ROOT, STATE_DIR
+from armhr_cli.services.dotenv import get_var, read_dotenv
 
 # ── Paths ────────────────────────────────────────────────────────────────
 
@@ -44,24 +44,6 @@ _TIMEOUT = httpx.Timeout(15.0, connect=5.0)
 _SCOPES = "openid profile email offline_access"
 
 
-# ── .env reader helper ──────────────────────────────────────────────────
-
-
-def _read_env_var(path: Path, key: str) -> str:
-    """Read a single env var value from a dotenv file."""
-    try:
-        if path.exists():
-            for line in path.read_text().splitlines():
-                stripped = line.strip()
-                if stripped.startswith("#"):
-                    continue
-                if stripped.startswith(f"{key}="):
-                    return stripped.split("=", 1)[1].strip().strip('"').strip("'")
-    except Exception:
-        pass
-    return ""
-
-
 # ── Auth0 configuration ─────────────────────────────────────────────────
 
 
@@ -70,15 +52,15 @@ def get_auth0_config() -> dict[str, Any]:
 
     Returns dict with keys: enabled, domain, audience, client_id, connection.
     """
-    enabled_str = _read_env_var(ENV_FILE, "HCM_AUTH0_ENABLED")
-    domain = _read_env_var(ENV_FILE, "HCM_AUTH0_DOMAIN")
-    audience = _read_env_var(ENV_FILE, "HCM_AUTH0_AUDIENCE")
+    backend_env = read_dotenv(ENV_FILE)
+    enabled_str = backend_env.get("HCM_AUTH0_ENABLED", "")
+    domain = backend_env.get("HCM_AUTH0_DOMAIN", "")
+    audience = backend_env.get("HCM_AUTH0_AUDIENCE", "")
 
     # Client ID: prefer CLI-specific override, then ops frontend
-    client_id = _read_env_var(ENV_FILE, "CLI_AUTH0_CLIENT_ID")
+    client_id = backend_env.get("CLI_AUTH0_CLIENT_ID", "")
     if not client_id:
-        ops_env = FRONTEND_ROOT / "packages" / "ops" / ".env"
-        client_id = _read_env_var(ops_env, "VITE_APP_CLIENT_ID")
+        client_id = get_var(FRONTEND_ROOT / "packages" / "ops" / ".env", "VITE_APP_CLIENT_ID")
 
     # Okta connection (enterprise IdP): dev vs prod
     connection = ""
@@ -96,7 +78,7 @@ def get_auth0_config() -> dict[str, Any]:
 
 def is_auth0_enabled() -> bool:
     """Check whether Auth0 is enabled in the backend .env."""
-    return _read_env_var(ENV_FILE, "HCM_AUTH0_ENABLED").lower() == "true"
+    return get_var(ENV_FILE, "HCM_AUTH0_ENABLED").lower() == "true"
 
 
 # ── PKCE helpers ─────────────────────────────────────────────────────────
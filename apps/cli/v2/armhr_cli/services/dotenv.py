@@ -0,0 +1,154 @@
+"""Cached dotenv reading shared by the env, auth and API services.
+
+A file is parsed once and re-parsed only when its (mtime, size, inode)
+changes. Hot readers (every API request looks up UV_PORT) also pass
+``max_age`` to skip even the stat for a moment after a check, so they do no
+file I/O at all. Code in this package that writes a .env calls
+``invalidate()`` so the change is seen immediately.
+
+Lines follow what python-dotenv and ``uv run --env-file`` accept:
+optional ``export``, single-quoted values taken literally, double-quoted
+values with backslash escapes, and unquoted values trimmed and cut at an
+inline `` #`` comment. Quoted values can't span lines. ``format_line``
+writes values back so that they read the same way.
+"""
+
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+# Seconds a hot reader trusts its cached copy before stat-ing the file again
+STAT_INTERVAL = 1.0
+
+_LINE_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
+_INLINE_COMMENT_RE = re.compile(r"\s+#.*$")
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+_UNESCAPES = {v: "\\" + k for k, v in _ESCAPES.items()}
+# Values that can't be written bare: a quote or backslash, a control char,
+# whitespace at either end (trimmed), or an inline comment
+_NEEDS_QUOTES_RE = re.compile(r"[\"'\\\n\r\t]|^\s|\s$|\s#")
+
+# (path, parser) -> (stat key, checked at, parsed value)
+_cache: dict[tuple[Path, Callable], tuple[tuple[int, int, int] | None, float, object]] = {}
+
+
+# ── Parsing ─────────────────────────────────────────────────────────────
+
+
+def _unquote_double(raw: str) -> str:
+    out: list[str] = []
+    i = 1
+    while i < len(raw):
+        ch = raw[i]
+        if ch == "\\" and i + 1 < len(raw):
+            out.append(_ESCAPES.get(raw[i + 1], "\\" + raw[i + 1]))
+            i += 2
+            continue
+        if ch == '"':
+            break
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def parse_value(raw: str) -> str:
+    """The value of a KEY=<raw> assignment, with quotes and comments removed."""
+    if raw.startswith("'"):
+        end = raw.find("'", 1)
+        return raw[1:end] if end != -1 else raw[1:]
+    if raw.startswith('"'):
+        return _unquote_double(raw)
+    return _INLINE_COMMENT_RE.sub("", raw)
+
+
+def parse_line(line: str) -> tuple[str, str] | None:
+    """(key, value) for an active assignment line, else None (comments, blanks)."""
+    m = _LINE_RE.match(line)
+    if m is None:
+        return None
+    return m.group(1), parse_value(m.group(2))
+
+
+def parse_dotenv(text: str) -> dict[str, str]:
+    """All active assignments in *text*; a later assignment wins."""
+    result: dict[str, str] = {}
+    for line in text.splitlines():
+        kv = parse_line(line)
+        if kv is not None:
+            result[kv[0]] = kv[1]
+    return result
+
+
+def format_value(value: str) -> str:
+    """*value* as it should appear after ``KEY=``, so parse_value() gives it back.
+
+    Left bare when it reads back unchanged, otherwise double-quoted with
+    backslash escapes.
+    """
+    if not _NEEDS_QUOTES_RE.search(value):
+        return value
+    return '"' + "".join(_UNESCAPES.get(ch, ch) for ch in value) + '"'
+
+
+def format_line(key: str, value: str) -> str:
+    """An assignment line (with newline) that parse_line() reads as (key, value)."""
+    return f"{key}={format_value(value)}\n"
+
+
+# ── Caching ─────────────────────────────────────────────────────────────
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    """(mtime_ns, size, inode), or None if the file doesn't exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def cached(path: Path, parse: Callable[[Path | None], _T], max_age: float = 0.0) -> _T:
+    """Return parse(path), re-parsing only when the file's stat key changes.
+
+    *parse* gets None for a missing file. With *max_age*, a copy checked
+    less than that many seconds ago is returned without touching the disk.
+    """
+    now = time.monotonic()
+    entry = _cache.get((path, parse))
+    if entry is not None and max_age and now - entry[1] < max_age:
+        return entry[2]  # type: ignore[return-value]
+    key = _stat_key(path)
+    if entry is not None and entry[0] == key:
+        _cache[(path, parse)] = (key, now, entry[2])
+        return entry[2]  # type: ignore[return-value]
+    value = parse(path if key is not None else None)
+    _cache[(path, parse)] = (key, now, value)
+    return value
+
+
+def invalidate() -> None:
+    """Drop every cached file (after a write, or when a watcher saw a change)."""
+    _cache.clear()
+
+
+def _read_vars(path: Path | None) -> dict[str, str]:
+    if path is None:
+        return {}
+    try:
+        return parse_dotenv(path.read_text())
+    except (OSError, UnicodeDecodeError):
+        return {}
+
+
+def read_dotenv(path: Path) -> dict[str, str]:
+    """Active vars of a dotenv file ({} if it is missing or unreadable). Don't mutate."""
+    return cached(path, _read_vars, max_age=STAT_INTERVAL)
+
+
+def get_var(path: Path, key: str, default: str = "") -> str:
+    """One var from a dotenv file, served from the cache."""
+    return read_dotenv(path).get(key, default)
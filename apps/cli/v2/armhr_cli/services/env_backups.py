@@ -0,0 +1,213 @@
+"""Content-addressed store for .env backups.
+
+Each distinct .env content is stored once, gzip-compressed, as
+~/.armhr/backups/objects/<sha256>.gz. A backup is one line appended to
+~/.armhr/backups/journal.jsonl (time, hash, size, label), so backing up an
+unchanged .env costs a hash and, at most, a few bytes of journal. Consecutive
+backups of identical content collapse into one entry.
+
+Retention keeps the KEEP_RECENT newest entries unconditionally, plus any
+younger than MAX_AGE_DAYS up to MAX_ENTRIES in total; objects no longer
+referenced by the journal are deleted. It is applied whenever a backup is
+stored and the journal is over its size slack or holds an expired entry.
+Objects are created 0600 and the store's directories are 0700. Old-style ``.env.<timestamp>`` copies
+are folded into the store the first time it is used.
+"""
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from armhr_cli.config import BACKUPS_DIR
+
+OBJECTS_DIR: Path = BACKUPS_DIR / "objects"
+JOURNAL_FILE: Path = BACKUPS_DIR / "journal.jsonl"
+
+KEEP_RECENT = 20
+MAX_ENTRIES = 200
+MAX_AGE_DAYS = 30
+# Prune once the journal has grown this many entries past MAX_ENTRIES
+_PRUNE_SLACK = 50
+
+_LEGACY_RE = re.compile(r"^\.env\.(\d{8}_\d{6})$")
+
+
+@dataclass
+class BackupEntry:
+    """One journal entry."""
+
+    at: datetime
+    sha: str
+    size: int
+    label: str = ""
+
+    @property
+    def short(self) -> str:
+        return self.sha[:10]
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _object_path(sha: str) -> Path:
+    return OBJECTS_DIR / f"{sha}.gz"
+
+
+def _private_dir(path: Path) -> None:
+    """Create *path* (and parents) readable by the owner only; .env holds secrets."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    with contextlib.suppress(OSError):
+        os.chmod(path, 0o700)  # mkdir leaves an existing dir's mode alone
+
+
+def _write_object(sha: str, content: bytes) -> None:
+    path = _object_path(sha)
+    if path.exists():
+        return
+    _private_dir(BACKUPS_DIR)
+    _private_dir(OBJECTS_DIR)
+    tmp = path.with_suffix(".tmp")
+    # Created 0600 rather than chmod'ed afterwards, so it is never world-readable
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(gzip.compress(content, mtime=0))
+    os.replace(tmp, path)
+
+
+def _parse_entry(line: str) -> BackupEntry | None:
+    try:
+        raw = json.loads(line)
+        return BackupEntry(
+            at=datetime.fromisoformat(raw["at"]),
+            sha=raw["sha"],
+            size=raw["size"],
+            label=raw.get("label", ""),
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _entry_line(entry: BackupEntry) -> str:
+    data = {
+        "at": entry.at.isoformat(timespec="seconds"),
+        "sha": entry.sha,
+        "size": entry.size,
+        "label": entry.label,
+    }
+    return json.dumps(data) + "\n"
+
+
+def _read_journal() -> list[BackupEntry]:
+    """All entries, oldest first."""
+    try:
+        text = JOURNAL_FILE.read_text()
+    except OSError:
+        return []
+    return [e for e in map(_parse_entry, text.splitlines()) if e is not None]
+
+
+def _import_legacy() -> None:
+    """Fold old full-copy backups (.env.<timestamp>) into the store."""
+    legacy = sorted(p for p in BACKUPS_DIR.glob(".env.*") if _LEGACY_RE.match(p.name))
+    if not legacy:
+        return
+    entries = _read_journal()
+    for path in legacy:
+        ts = _LEGACY_RE.match(path.name).group(1)  # type: ignore[union-attr]
+        try:
+            at = datetime.strptime(ts, "%Y%m%d_%H%M%S")
+        except ValueError:
+            at = datetime.fromtimestamp(path.stat().st_mtime)
+        content = path.read_bytes()
+        sha = content_hash(content)
+        _write_object(sha, content)
+        entries.append(BackupEntry(
+            at=at,
+            sha=sha,
+            size=len(content),
+            label="legacy copy",
+        ))
+    entries.sort(key=lambda e: e.at)
+    _rewrite_journal(_collapse(entries))
+    for path in legacy:
+        path.unlink()
+
+
+def _collapse(entries: list[BackupEntry]) -> list[BackupEntry]:
+    """Drop entries whose content matches the entry right before them."""
+    result: list[BackupEntry] = []
+    for entry in entries:
+        if not result or result[-1].sha != entry.sha:
+            result.append(entry)
+    return result
+
+
+def _rewrite_journal(entries: list[BackupEntry]) -> None:
+    _private_dir(BACKUPS_DIR)
+    tmp = JOURNAL_FILE.with_suffix(".tmp")
+    tmp.write_text("".join(_entry_line(e) for e in entries))
+    os.replace(tmp, JOURNAL_FILE)
+
+
+def store_backup(content: bytes, label: str = "") -> BackupEntry:
+    """Record *content* as the newest backup; returns its journal entry.
+
+    If the newest entry already has this content, that entry is returned
+    and nothing is written.
+    """
+    _import_legacy()
+    sha = content_hash(content)
+    entries = _read_journal()
+    if entries and entries[-1].sha == sha:
+        return entries[-1]
+
+    _write_object(sha, content)
+    entry = BackupEntry(at=datetime.now(), sha=sha, size=len(content), label=label)
+    with open(JOURNAL_FILE, "a") as f:
+        f.write(_entry_line(entry))
+    count = len(entries) + 1
+    # The oldest entry is the first to go, so if it has expired prune has work to do
+    expired = count > KEEP_RECENT and entries[0].at < entry.at - timedelta(days=MAX_AGE_DAYS)
+    if count > MAX_ENTRIES + _PRUNE_SLACK or expired:
+        prune()
+    return entry
+
+
+def list_backups() -> list[BackupEntry]:
+    """Backups newest first (so ``env restore 1`` is the latest)."""
+    _import_legacy()
+    return list(reversed(_read_journal()))
+
+
+def read_backup(entry: BackupEntry) -> bytes:
+    return gzip.decompress(_object_path(entry.sha).read_bytes())
+
+
+def prune(now: datetime | None = None) -> int:
+    """Apply the retention policy; returns the number of journal entries dropped."""
+    entries = _read_journal()
+    cutoff = (now or datetime.now()) - timedelta(days=MAX_AGE_DAYS)
+    newest_first = list(reversed(entries))
+    kept = [
+        e
+        for i, e in enumerate(newest_first)
+        if i < KEEP_RECENT or (i < MAX_ENTRIES and e.at >= cutoff)
+    ]
+    kept.reverse()
+    if len(kept) != len(entries):
+        _rewrite_journal(kept)
+
+    live = {e.sha for e in kept}
+    if OBJECTS_DIR.is_dir():
+        for path in OBJECTS_DIR.glob("*.gz"):
+            if path.name.removesuffix(".gz") not in live:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+    return len(entries) - len(kept)
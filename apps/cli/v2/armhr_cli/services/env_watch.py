@@ -0,0 +1,143 @@
+"""Watch .env and presets.toml for edits made outside the CLI.
+
+Uses the optional `watchfiles` package (inotify on Linux, FSEvents on
+macOS), so nothing is polled; without it the UI refreshes only after CLI
+commands, as before. The parent directories are watched rather than the
+files themselves, because editors and swap_groups replace files by rename.
+
+Events are debounced, then compared against the last snapshot: only groups
+whose active vars or preset definitions changed are reported, along with
+whether the .env content was written by this process (a swap) or by
+something else (an editor).
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from armhr_cli.config import ENV_FILE, GROUP_PREFIXES, PRESETS_FILE
+from armhr_cli.services.envfile import invalidate_cache, is_own_write, read_env, read_presets
+
+try:
+    import watchfiles
+except ImportError:  # optional: pip install watchfiles
+    watchfiles = None
+
+DEBOUNCE_MS = 300
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class EnvChange:
+    """What changed between two snapshots."""
+
+    groups: set[str] = field(default_factory=set)  # active vars or presets differ
+    env_changed: bool = False  # any .env var changed, in a group or not
+    presets_changed: bool = False
+    external: bool = False  # .env changed by something other than the CLI
+
+
+@dataclass
+class _Snapshot:
+    active: dict[str, str]
+    groups: dict[str, dict[str, dict[str, str]]]
+    full: dict[str, dict[str, str]]
+
+
+def _take_snapshot() -> _Snapshot:
+    presets = read_presets()
+    return _Snapshot(active=dict(read_env().active), groups=presets.groups, full=presets.full)
+
+
+def diff_snapshots(old: _Snapshot, new: _Snapshot) -> EnvChange:
+    change = EnvChange(
+        env_changed=old.active != new.active,
+        presets_changed=old.groups != new.groups or old.full != new.full,
+    )
+    for group, prefix in GROUP_PREFIXES.items():
+        before = {k: v for k, v in old.active.items() if k.startswith(prefix)}
+        after = {k: v for k, v in new.active.items() if k.startswith(prefix)}
+        if before != after or old.groups.get(group) != new.groups.get(group):
+            change.groups.add(group)
+    return change
+
+
+class EnvWatcher:
+    """Calls ``on_change`` on the event loop whenever .env or presets.toml change."""
+
+    def __init__(
+        self,
+        on_change: Callable[[EnvChange], None],
+        on_error: Callable[[str], None] | None = None,
+    ) -> None:
+        self.on_change = on_change
+        self.on_error = on_error or _log.warning
+        self._snapshot = _take_snapshot()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def available(self) -> bool:
+        return watchfiles is not None
+
+    @property
+    def watching(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if watchfiles is None or self.watching:
+            return
+        try:
+            self._task = asyncio.get_running_loop().create_task(self._watch())
+        except RuntimeError:
+            pass
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def check(self) -> EnvChange | None:
+        """Re-read both files; report and adopt the new state if anything changed."""
+        # Also lets readers that skip stat() for a while (api, auth) see the edit now
+        invalidate_cache()
+        new = _take_snapshot()
+        change = diff_snapshots(self._snapshot, new)
+        self._snapshot = new
+        if not (change.groups or change.env_changed or change.presets_changed):
+            return None
+        change.external = change.env_changed and not is_own_write(ENV_FILE)
+        return change
+
+    async def _watch(self) -> None:
+        targets = {ENV_FILE.resolve(), PRESETS_FILE.resolve()}
+        dirs = {p.parent for p in targets if p.parent.is_dir()}
+        if not dirs:
+            return
+
+        def only_targets(_change, path: str) -> bool:
+            return Path(path).resolve() in targets
+
+        try:
+            async for _changes in watchfiles.awatch(
+                *dirs,
+                watch_filter=only_targets,
+                debounce=DEBOUNCE_MS,
+                recursive=False,
+            ):
+                self._handle_event()
+        except Exception as e:  # e.g. inotify watch limit: the watch itself is gone
+            self.on_error(f"Stopped watching .env / presets.toml: {e}")
+
+    def _handle_event(self) -> None:
+        """Apply one batch of events; a failure here must not end the watch."""
+        try:
+            # e.g. TOMLDecodeError from a half-saved presets.toml: keep the old
+            # snapshot, and the next save is diffed against it
+            change = self.check()
+            if change is not None:
+                self.on_change(change)
+        except Exception as e:
+            self.on_error(f"Couldn't apply .env / presets.toml change: {e}")
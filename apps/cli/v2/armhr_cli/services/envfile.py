@@ -3,28 +3,44 @@
 Handles:
 - Reading/writing .env files while preserving comments, blank lines, and order
 - Loading preset definitions from ~/.armhr/presets.toml (via stdlib tomllib)
-- Swapping a variable group in .env to a named preset (with backup)
+- Swapping a variable group in .env to a named preset (with backup,
+  see env_backups)
 - Seeding presets.toml from the existing .env commented blocks
+
+Both files are parsed once into an EnvFile / PresetsFile model and cached
+on (mtime, size, inode) via services.dotenv, which also does the line
+parsing; every query reads the cached model, so a UI refresh costs a
+couple of stat() calls until one of the files changes.
 """
 
+import contextlib
 import os
 import re
-import shutil
 import stat
+import tempfile
 import tomllib
-from datetime import datetime
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from armhr_cli.config import BACKUPS_DIR, ENV_FILE, GROUP_PREFIXES, PRESETS_FILE
+from armhr_cli.config import ENV_FILE, GROUP_PREFIXES, PRESETS_FILE
+from armhr_cli.services.dotenv import cached, format_line, invalidate, parse_line, parse_value
+from armhr_cli.services.env_backups import (
+    BackupEntry,
+    content_hash,
+    list_backups,
+    read_backup,
+    store_backup,
+)
+
+# Top-level key env init writes into presets.toml. Files without it were
+# seeded with the raw text after "=" (quotes, inline comments and all), and
+# their values are read through dotenv rules, as the backend saw them.
+PRESETS_FORMAT_KEY = "_format"
+PRESETS_FORMAT = 2
 
 # Pattern for section header comments: # ############### LABEL
 _SECTION_RE = re.compile(r"^#\s*#{3,}\s+(.+)$")
 
-# Pattern for an active (uncommented) key=value line
-_KV_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
-
-# Pattern for a commented-out key=value line: # KEY=value
-_COMMENTED_KV_RE = re.compile(r"^#\s*([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
 
 # Known group keywords used in section headers → group name
 _HEADER_KEYWORDS: dict[str, str] = {
@@ -35,6 +51,160 @@ _HEADER_KEYWORDS: dict[str, str] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Parsed models (cached per file)
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class EnvFile:
+    """A parsed .env: raw lines plus every active (uncommented) var."""
+
+    lines: list[str] = field(default_factory=list)
+    active: dict[str, str] = field(default_factory=dict)
+
+    def vars_with_prefix(self, prefix: str) -> dict[str, str]:
+        return {k: v for k, v in self.active.items() if k.startswith(prefix)}
+
+
+class PresetIndex:
+    """Lookup structures for one group's presets, built when presets load.
+
+    Presets are bucketed by key set; within a bucket each preset is keyed
+    by its frozenset of (key, value) pairs, so an exact match is one hash
+    lookup per distinct key set (usually one per group). The inverted
+    (key, value) -> presets map scores partial matches for ``closest``.
+    """
+
+    def __init__(self, presets: dict[str, dict[str, str]]) -> None:
+        self.presets = presets
+        self._order = {name: i for i, name in enumerate(presets)}
+        self._by_keyset: dict[frozenset[str], dict[frozenset[tuple[str, str]], str]] = {}
+        self._postings: dict[tuple[str, str], list[str]] = {}
+        for name, kvs in presets.items():
+            bucket = self._by_keyset.setdefault(frozenset(kvs), {})
+            bucket.setdefault(frozenset(kvs.items()), name)  # first definition wins
+            for item in kvs.items():
+                self._postings.setdefault(item, []).append(name)
+
+    def match(self, active: dict[str, str]) -> str | None:
+        """First preset (in file order) whose every key has its value in *active*."""
+        found: str | None = None
+        for keys, bucket in self._by_keyset.items():
+            if not keys <= active.keys():
+                continue
+            name = bucket.get(frozenset((k, active[k]) for k in keys))
+            if name is not None and (found is None or self._order[name] < self._order[found]):
+                found = name
+        return found
+
+    def closest(self, active: dict[str, str]) -> tuple[str, list[str]] | None:
+        """(preset, keys that differ) for the preset with the largest share of its values in *active*."""
+        if not self.presets:
+            return None
+        hits: dict[str, int] = {}
+        for item in active.items():
+            for name in self._postings.get(item, ()):
+                hits[name] = hits.get(name, 0) + 1
+
+        # Largest share of the preset matched, then most keys matched, then file order
+        def rank(name: str) -> tuple[float, int, int]:
+            size, hit = len(self.presets[name]), hits.get(name, 0)
+            return -(hit / size if size else 0.0), -hit, self._order[name]
+
+        best = min(hits or self.presets, key=rank)
+        differing = [k for k, v in self.presets[best].items() if active.get(k) != v]
+        return best, differing
+
+
+@dataclass
+class PresetsFile:
+    """A parsed presets.toml.
+
+    ``groups`` is {group: {preset_name: {KEY: value}}}; ``full`` is the
+    ``[_full]`` section, {preset_name: {group: group_preset_name}}.
+    ``index`` holds a PresetIndex per group.
+    """
+
+    groups: dict[str, dict[str, dict[str, str]]] = field(default_factory=dict)
+    full: dict[str, dict[str, str]] = field(default_factory=dict)
+    index: dict[str, PresetIndex] = field(default_factory=dict)
+
+
+def invalidate_cache() -> None:
+    """Drop cached models (after writing a file within the same mtime tick)."""
+    invalidate()
+
+
+def _parse_env(path: Path | None) -> EnvFile:
+    if path is None:
+        return EnvFile()
+    lines = path.read_text().splitlines(keepends=True)
+    return EnvFile(lines=lines, active=_active_vars(lines))
+
+
+def _active_vars(lines: list[str]) -> dict[str, str]:
+    active: dict[str, str] = {}
+    for line in lines:
+        kv = parse_line(line)
+        if kv:
+            active[kv[0]] = kv[1]
+    return active
+
+
+def _commented_kv(stripped: str) -> tuple[str, str] | None:
+    """(key, value) for a commented-out assignment: # KEY=value."""
+    return parse_line(stripped[1:]) if stripped.startswith("#") else None
+
+
+def changed_keys(old: dict[str, str], new: dict[str, str]) -> set[str]:
+    """Keys added, removed or given a different value between two var maps."""
+    return {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+
+
+def _parse_presets(path: Path | None) -> PresetsFile:
+    if path is None:
+        return PresetsFile()
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+
+    # Ensure all values are strings (and unquoted, for a legacy file)
+    legacy = data.get(PRESETS_FORMAT_KEY) != PRESETS_FORMAT
+
+    groups: dict[str, dict[str, dict[str, str]]] = {}
+    for group, presets in data.items():
+        if group.startswith("_"):
+            continue  # skip metadata sections like [_full]
+        if not isinstance(presets, dict):
+            continue
+        groups[group] = {}
+        for preset_name, kvs in presets.items():
+            if not isinstance(kvs, dict):
+                continue
+            groups[group][preset_name] = {
+                k: parse_value(str(v).strip()) if legacy else str(v) for k, v in kvs.items()
+            }
+
+    full: dict[str, dict[str, str]] = {}
+    raw_full = data.get("_full")
+    if isinstance(raw_full, dict):
+        for name, mapping in raw_full.items():
+            if isinstance(mapping, dict):
+                full[name] = {str(k): str(v) for k, v in mapping.items()}
+    index = {group: PresetIndex(presets) for group, presets in groups.items()}
+    return PresetsFile(groups=groups, full=full, index=index)
+
+
+def read_env(env_path: Path | None = None) -> EnvFile:
+    """The parsed .env (cached; treat as read-only)."""
+    return cached(env_path or ENV_FILE, _parse_env)
+
+
+def read_presets(presets_path: Path | None = None) -> PresetsFile:
+    """The parsed presets.toml (cached; treat as read-only)."""
+    return cached(presets_path or PRESETS_FILE, _parse_presets)
+
+
 # ---------------------------------------------------------------------------
 # .env reading
 # ---------------------------------------------------------------------------
@@ -42,19 +212,16 @@ _HEADER_KEYWORDS: dict[str, str] = {
 
 def read_env_lines(env_path: Path | None = None) -> list[str]:
     """Read the .env file and return raw lines (preserving newlines)."""
-    path = env_path or ENV_FILE
-    if not path.exists():
-        return []
-    return path.read_text().splitlines(keepends=True)
+    return list(read_env(env_path).lines)
 
 
 def parse_active_vars(lines: list[str], prefix: str) -> dict[str, str]:
     """Extract active (uncommented) key=value pairs matching a prefix."""
     result: dict[str, str] = {}
     for line in lines:
-        m = _KV_RE.match(line.strip())
-        if m and m.group(1).startswith(prefix):
-            result[m.group(1)] = m.group(2)
+        kv = parse_line(line)
+        if kv and kv[0].startswith(prefix):
+            result[kv[0]] = kv[1]
     return result
 
 
@@ -69,24 +236,7 @@ def load_presets(presets_path: Path | None = None) -> dict[str, dict[str, dict[s
     Keys starting with ``_`` (e.g. ``_full``) are reserved for metadata
     sections and are excluded from the returned group presets.
     """
-    path = presets_path or PRESETS_FILE
-    if not path.exists():
-        return {}
-    with open(path, "rb") as f:
-        data = tomllib.load(f)
-    # Ensure all values are strings
-    result: dict[str, dict[str, dict[str, str]]] = {}
-    for group, presets in data.items():
-        if group.startswith("_"):
-            continue  # skip metadata sections like [_full]
-        if not isinstance(presets, dict):
-            continue
-        result[group] = {}
-        for preset_name, kvs in presets.items():
-            if not isinstance(kvs, dict):
-                continue
-            result[group][preset_name] = {k: str(v) for k, v in kvs.items()}
-    return result
+    return read_presets(presets_path).groups
 
 
 def get_preset(group: str, preset_name: str) -> dict[str, str] | None:
@@ -117,17 +267,25 @@ def identify_active_preset(group: str) -> tuple[str, str | None]:
     if not prefix:
         return "custom", None
 
-    lines = read_env_lines()
-    active = parse_active_vars(lines, prefix)
-    presets = load_presets()
+    active = read_env().vars_with_prefix(prefix)
+    index = read_presets().index.get(group)
+    preset_name = index.match(active) if index else None
+    if preset_name is None:
+        return "custom", None
 
-    for preset_name, preset_vars in presets.get(group, {}).items():
-        if all(active.get(k) == v for k, v in preset_vars.items()):
-            # Pick a representative value for display
-            rep_key = _representative_key(group)
-            rep_val = active.get(rep_key, next(iter(active.values()), ""))
-            return preset_name, f"{rep_key}={rep_val}" if rep_key else None
-    return "custom", None
+    # Pick a representative value for display
+    rep_key = _representative_key(group)
+    rep_val = active.get(rep_key, next(iter(active.values()), ""))
+    return preset_name, f"{rep_key}={rep_val}" if rep_key else None
+
+
+def closest_preset(group: str) -> tuple[str, list[str]] | None:
+    """For a custom group state: (nearest preset, keys whose values differ from it)."""
+    prefix = GROUP_PREFIXES.get(group)
+    index = read_presets().index.get(group)
+    if not prefix or index is None:
+        return None
+    return index.closest(read_env().vars_with_prefix(prefix))
 
 
 def _representative_key(group: str) -> str:
@@ -151,20 +309,7 @@ def load_full_presets(presets_path: Path | None = None) -> dict[str, dict[str, s
 
         {"local": {"auth0": "local", "prism": "local", "db": "local"}}
     """
-    path = presets_path or PRESETS_FILE
-    if not path.exists():
-        return {}
-    with open(path, "rb") as f:
-        data = tomllib.load(f)
-    raw = data.get("_full")
-    if not isinstance(raw, dict):
-        return {}
-    result: dict[str, dict[str, str]] = {}
-    for name, mapping in raw.items():
-        if not isinstance(mapping, dict):
-            continue
-        result[name] = {str(k): str(v) for k, v in mapping.items()}
-    return result
+    return read_presets(presets_path).full
 
 
 def list_full_presets() -> list[str]:
@@ -186,14 +331,7 @@ def env_summary_values() -> list[tuple[str, str]]:
     Reads the current ``.env`` and pulls out the three representative
     keys.  Values longer than 28 chars are truncated with ``…``.
     """
-    lines = read_env_lines()
-    # Collect all active vars in one pass
-    active: dict[str, str] = {}
-    for line in lines:
-        m = _KV_RE.match(line.strip())
-        if m:
-            active[m.group(1)] = m.group(2)
-
+    active = read_env().active
     result: list[tuple[str, str]] = []
     for key, label in _SUMMARY_KEYS:
         val = active.get(key, "–")
@@ -213,7 +351,6 @@ def identify_active_full_preset() -> str | None:
     if not full:
         return None
 
-    # Cache per-group active presets so we only read .env once per group
     active_by_group: dict[str, str] = {}
     for group in GROUP_PREFIXES:
         active_name, _ = identify_active_preset(group)
@@ -230,101 +367,207 @@ def identify_active_full_preset() -> str | None:
 # ---------------------------------------------------------------------------
 
 
-def backup_env(env_path: Path | None = None) -> Path:
-    """Copy .env to ~/.armhr/backups/.env.<timestamp>. Returns backup path."""
+def backup_env(env_path: Path | None = None, label: str = "manual") -> BackupEntry:
+    """Back up .env into the content-addressed store. Returns the journal entry."""
     path = env_path or ENV_FILE
-    BACKUPS_DIR.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    dest = BACKUPS_DIR / f".env.{ts}"
-    shutil.copy2(path, dest)
-    return dest
+    return store_backup(path.read_bytes(), label=label)
+
+
+def restore_env(n: int) -> tuple[bool, str, set[str]]:
+    """Replace .env with backup *n* (1 = newest, as listed by ``env history``).
+
+    The current .env is backed up first, so a restore can itself be undone.
+    Returns (success, message, keys whose active value changed).
+    """
+    backups = list_backups()
+    if not 1 <= n <= len(backups):
+        return False, f"No backup #{n} (have {len(backups)})", set()
+    entry = backups[n - 1]
+    try:
+        content = read_backup(entry)
+    except OSError as e:
+        return False, f"Backup #{n} is unreadable: {e}", set()
+
+    before: dict[str, str] = {}
+    if ENV_FILE.exists():
+        if content_hash(ENV_FILE.read_bytes()) == entry.sha:
+            return True, f".env already matches backup #{n} ({entry.short})", set()
+        before = read_env().active
+        backup_env(label=f"before restore of {entry.short}")
+    _atomic_write(ENV_FILE, content)
+    invalidate_cache()
+    changed = changed_keys(before, _active_vars(content.decode().splitlines()))
+    return True, f"Restored .env from #{n} ({entry.short}, {entry.at:%Y-%m-%d %H:%M})", changed
 
 
 # ---------------------------------------------------------------------------
 # Swap logic
 # ---------------------------------------------------------------------------
 
+# Block header written above each swapped group: # --- db: local ---
+_BLOCK_HEADER_RE = re.compile(r"^#\s*---\s*([A-Za-z0-9_]+):\s*.*---$")
 
-def swap_group(group: str, preset_name: str) -> tuple[bool, str]:
+
+def swap_group(group: str, preset_name: str) -> tuple[bool, str, set[str]]:
     """Replace all active vars for a group with a preset's values.
 
-    Returns (success, message).
+    Returns (success, message, changed keys).
     """
-    prefix = GROUP_PREFIXES.get(group)
-    if not prefix:
-        return False, f"Unknown group: {group}"
+    return swap_groups({group: preset_name})
 
-    preset_vars = get_preset(group, preset_name)
-    if preset_vars is None:
-        available = list_presets().get(group, [])
-        hint = f" Available: {', '.join(available)}" if available else ""
-        return False, f"Preset '{preset_name}' not found for group '{group}'.{hint}"
 
-    if not ENV_FILE.exists():
-        return False, f".env not found at {ENV_FILE}"
+def swap_groups(mapping: dict[str, str]) -> tuple[bool, str, set[str]]:
+    """Swap several groups to presets in one read, one pass and one write.
 
-    # 1. Backup
-    backup_path = backup_env()
+    *mapping* is ``{group: preset_name}``. Every group and preset is
+    validated before anything is touched, so either all groups swap or
+    none do. The .env is backed up once and replaced atomically; if the
+    presets' values are already active, nothing is written at all.
 
-    # 2. Read lines
-    lines = read_env_lines()
+    Returns (success, message, keys whose active value changed).
+    """
+    presets = load_presets()
+    targets: dict[str, tuple[str, dict[str, str]]] = {}  # group -> (prefix, preset vars)
+    for group, preset_name in mapping.items():
+        prefix = GROUP_PREFIXES.get(group)
+        if not prefix:
+            return False, f"Unknown group: {group}", set()
+        preset_vars = presets.get(group, {}).get(preset_name)
+        if preset_vars is None:
+            available = sorted(presets.get(group, {}))
+            hint = f" Available: {', '.join(available)}" if available else ""
+            return False, f"Preset '{preset_name}' not found for group '{group}'.{hint}", set()
+        targets[group] = (prefix, preset_vars)
 
-    # 3. Find all active (uncommented) lines matching the prefix
-    removal_indices: list[int] = []
+    if not ENV_FILE.exists():
+        return False, f".env not found at {ENV_FILE}", set()
+
+    swapped = ", ".join(f"{g} → {p}" for g, p in mapping.items())
+    env = read_env()
+    new_lines = _rewrite_groups(env.lines, mapping, targets)
+    changed = changed_keys(env.active, _active_vars(new_lines))
+    if not changed:
+        return True, f"Already on {swapped} · .env unchanged", changed
+
+    backup = backup_env(label=f"before {swapped}")
+    _atomic_write(ENV_FILE, "".join(new_lines))
+    invalidate_cache()
+    return True, f"Swapped {swapped} (backup: {backup.short})", changed
+
+
+def _rewrite_groups(
+    lines: list[str],
+    mapping: dict[str, str],
+    targets: dict[str, tuple[str, dict[str, str]]],
+) -> list[str]:
+    """Return *lines* with each target group's active vars replaced by its preset.
+
+    A group's new block goes where its first active var was; groups with
+    no active vars go after their last commented-out var (else at the
+    end). The previous ``# --- group: preset ---`` header of a swapped
+    group is dropped so headers don't pile up.
+    """
+
+    def group_of(key: str) -> str | None:
+        for group, (prefix, _vars) in targets.items():
+            if key.startswith(prefix):
+                return group
+        return None
+
+    # Pass 1: classify lines and find insert positions
+    owner: list[str | None] = [None] * len(lines)  # group whose line is replaced
+    first_active: dict[str, int] = {}
+    last_commented: dict[str, int] = {}
     for i, line in enumerate(lines):
         stripped = line.strip()
-        m = _KV_RE.match(stripped)
-        if m and m.group(1).startswith(prefix):
-            removal_indices.append(i)
-
-    if not removal_indices:
-        # No existing lines — append at the end of the managed block area
-        insert_at = _find_insert_position(lines, prefix)
-    else:
-        insert_at = removal_indices[0]
-
-    # 4. Build replacement block
-    header = f"# --- {group}: {preset_name} ---\n"
-    new_lines = [header]
-    for key, value in preset_vars.items():
-        new_lines.append(f"{key}={value}\n")
-
-    # 5. Reconstruct the file: remove old lines, insert new block
-    result_lines: list[str] = []
-    inserted = False
-    for i, line in enumerate(lines):
-        if i in set(removal_indices):
-            if not inserted:
-                result_lines.extend(new_lines)
-                inserted = True
-            # Skip the old line
+        kv = parse_line(stripped)
+        if kv:
+            group = group_of(kv[0])
+            if group:
+                owner[i] = group
+                first_active.setdefault(group, i)
             continue
-        result_lines.append(line)
+        header = _BLOCK_HEADER_RE.match(stripped)
+        if header and header.group(1) in targets:
+            owner[i] = header.group(1)
+            continue
+        cm = _commented_kv(stripped)
+        if cm:
+            group = group_of(cm[0])
+            if group:
+                last_commented[group] = i
+
+    blocks: dict[str, list[str]] = {}
+    for group, (_prefix, preset_vars) in targets.items():
+        blocks[group] = [f"# --- {group}: {mapping[group]} ---\n"]
+        blocks[group].extend(format_line(key, value) for key, value in preset_vars.items())
+
+    # Groups with nothing active get inserted before original line N
+    inserts: dict[int, list[str]] = {}
+    for group in targets:
+        if group not in first_active:
+            at = last_commented[group] + 1 if group in last_commented else len(lines)
+            inserts.setdefault(at, []).extend(blocks[group])
+
+    # Pass 2: one linear rewrite
+    result: list[str] = []
+    for i, line in enumerate(lines):
+        result.extend(inserts.get(i, ()))
+        group = owner[i]
+        if group is None:
+            result.append(line)
+        elif first_active.get(group) == i:
+            result.extend(blocks[group])
+    if result and not result[-1].endswith("\n") and len(lines) in inserts:
+        result[-1] += "\n"  # don't glue the appended block onto the last line
+    result.extend(inserts.get(len(lines), ()))
+    return result
+
 
-    # If nothing was removed (no existing vars), insert at computed position
-    if not inserted:
-        result_lines[insert_at:insert_at] = new_lines
+# Hash of the last content this process wrote to each path, so the file
+# watcher can tell the CLI's own swaps from edits made elsewhere
+_own_writes: dict[Path, str] = {}
 
-    # 6. Write back
-    ENV_FILE.write_text("".join(result_lines))
 
-    return True, f"Swapped {group} → {preset_name} (backup: {backup_path.name})"
+def is_own_write(path: Path) -> bool:
+    """True if *path* still holds exactly what this process last wrote to it."""
+    try:
+        return _own_writes.get(path) == content_hash(path.read_bytes())
+    except OSError:
+        return False
 
 
-def _find_insert_position(lines: list[str], prefix: str) -> int:
-    """Find a reasonable position to insert a new group block.
+def _atomic_write(path: Path, data: str | bytes) -> None:
+    """Replace *path* with *data* via temp file + fsync + rename.
 
-    Looks for commented-out lines matching the prefix and inserts after
-    the last one. Falls back to end of file.
+    Readers (e.g. a backend starting up) see either the old file or the
+    new one, never a partial write. The original file mode is kept.
     """
-    last_commented = -1
-    for i, line in enumerate(lines):
-        m = _COMMENTED_KV_RE.match(line.strip())
-        if m and m.group(1).startswith(prefix):
-            last_commented = i
-    if last_commented >= 0:
-        return last_commented + 1
-    return len(lines)
+    _own_writes[path] = content_hash(data if isinstance(data, bytes) else data.encode())
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        mode = None
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    if os.name == "posix":
+        # Persist the rename itself
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 # ---------------------------------------------------------------------------
@@ -375,17 +618,17 @@ def seed_presets_from_env() -> tuple[bool, str]:
 
         if current_group and current_preset:
             # Try commented-out key=value
-            cm = _COMMENTED_KV_RE.match(stripped)
+            cm = _commented_kv(stripped)
             if cm:
-                key, val = cm.group(1), cm.group(2)
+                key, val = cm
                 if key.startswith(GROUP_PREFIXES.get(current_group, "\x00")):
                     current_vars[key] = val
                 continue
 
             # Try active key=value
-            am = _KV_RE.match(stripped)
+            am = parse_line(stripped)
             if am:
-                key, val = am.group(1), am.group(2)
+                key, val = am
                 if key.startswith(GROUP_PREFIXES.get(current_group, "\x00")):
                     current_vars[key] = val
                 continue
@@ -406,17 +649,24 @@ def seed_presets_from_env() -> tuple[bool, str]:
         return False, "No preset sections found in .env"
 
     # Build TOML string
-    toml_parts: list[str] = []
+    toml_parts: list[str] = [f"{PRESETS_FORMAT_KEY} = {PRESETS_FORMAT}", ""]
     for group, preset, kvs in sections:
         toml_parts.append(f"[{group}.{preset}]")
         for key, val in kvs.items():
             # Quote the value for valid TOML
-            escaped = val.replace("\\", "\\\\").replace('"', '\\"')
+            escaped = (
+                val.replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n")
+                .replace("\r", "\\r")
+                .replace("\t", "\\t")
+            )
             toml_parts.append(f'{key} = "{escaped}"')
         toml_parts.append("")
 
     PRESETS_FILE.parent.mkdir(parents=True, exist_ok=True)
     PRESETS_FILE.write_text("\n".join(toml_parts) + "\n")
+    invalidate_cache()
 
     # Set restrictive permissions (owner read/write only)
     os.chmod(PRESETS_FILE, stat.S_IRUSR | stat.S_IWUSR)
@@ -3,18 +3,21 @@
 Multi-repo aware: can operate on backend, frontend, or both.
 """
 
+import asyncio
 import json
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import TypeVar
 
-from armhr_cli.config import BACKEND_ROOT, FRONTEND_ROOT
+from armhr_cli.config import BACKEND_ROOT, GIT_REPOS
+from armhr_cli.services.git_status import fetch_scheduler, status_cache
 from armhr_cli.services.process import run_command
 
-REPO_ROOTS: dict[str, Path] = {
-    "backend": BACKEND_ROOT,
-    "frontend": FRONTEND_ROOT,
-}
+REPO_ROOTS: dict[str, Path] = GIT_REPOS
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -28,14 +31,18 @@ class GitStatus:
     untracked: list[str]
     ahead: int
     behind: int
+    upstream: str | None = None
+    fetch_age: float | None = None  # seconds since last fetch
+    conflicted: list[str] = field(default_factory=list)
+    renamed: dict[str, str] = field(default_factory=dict)
 
     @property
     def is_clean(self) -> bool:
-        return not (self.staged or self.unstaged or self.untracked)
+        return not (self.staged or self.unstaged or self.untracked or self.conflicted)
 
     @property
     def has_changes(self) -> bool:
-        return bool(self.staged or self.unstaged or self.untracked)
+        return bool(self.staged or self.unstaged or self.untracked or self.conflicted)
 
 
 @dataclass
@@ -52,6 +59,9 @@ class PullRequest:
     created_at: datetime
     updated_at: datetime
     draft: bool
+    repo: str = ""
+    checks: str | None = None  # statusCheckRollup: SUCCESS / FAILURE / PENDING / ...
+    review: str | None = None  # reviewDecision: APPROVED / CHANGES_REQUESTED / ...
 
 
 class GitHubService:
@@ -60,56 +70,13 @@ class GitHubService:
     def __init__(self, cwd: str | Path | None = None) -> None:
         self.cwd = str(cwd) if cwd else str(BACKEND_ROOT)
 
-    async def get_status(self) -> GitStatus | None:
-        """Get current git status."""
+    async def get_status(self, fresh: bool = False) -> GitStatus | None:
+        """Get current git status, served from the status cache when unchanged."""
         try:
-            _, branch_out, _ = await run_command(
-                "git",
-                "branch",
-                "--show-current",
-                cwd=self.cwd,
-            )
-            branch = branch_out.strip()
-
-            _, status_out, _ = await run_command(
-                "git",
-                "status",
-                "--porcelain",
-                cwd=self.cwd,
-            )
-
-            staged: list[str] = []
-            unstaged: list[str] = []
-            untracked: list[str] = []
-
-            for line in status_out.strip().split("\n"):
-                if not line:
-                    continue
-                index_status = line[0]
-                worktree_status = line[1]
-                filename = line[3:]
-
-                if index_status == "?":
-                    untracked.append(filename)
-                elif index_status != " ":
-                    staged.append(filename)
-
-                if worktree_status not in (" ", "?"):
-                    unstaged.append(filename)
-
-            _, ab_out, _ = await run_command(
-                "git",
-                "rev-list",
-                "--left-right",
-                "--count",
-                f"HEAD...origin/{branch}",
-                cwd=self.cwd,
-            )
-            ahead, behind = 0, 0
-            if ab_out.strip():
-                parts = ab_out.strip().split()
-                if len(parts) == 2:
-                    ahead, behind = int(parts[0]), int(parts[1])
+            cache = status_cache(self.cwd)
+            snap = await cache.get(fresh=fresh)
+            if snap is None:
+                return None
 
             # Derive repo label from path
             cwd_path = Path(self.cwd).resolve()
@@ -121,16 +88,24 @@ class GitHubService:
 
             return GitStatus(
                 repo=repo_label,
-                branch=branch,
-                staged=staged,
-                unstaged=unstaged,
-                untracked=untracked,
-                ahead=ahead,
-                behind=behind,
+                branch=snap.branch,
+                staged=snap.staged,
+                unstaged=snap.unstaged,
+                untracked=snap.untracked,
+                ahead=snap.ahead,
+                behind=snap.behind,
+                upstream=snap.upstream,
+                fetch_age=cache.fetch_age(),
+                conflicted=snap.conflicted,
+                renamed=snap.renamed,
             )
         except Exception:
             return None
 
+    def start_background_fetch(self) -> None:
+        """Keep ahead/behind current with periodic background fetches."""
+        fetch_scheduler.add(self.cwd)
+
     async def add_files(self, files: list[str] | None = None) -> tuple[bool, str]:
         """Stage files for commit."""
         if files:
@@ -266,3 +241,30 @@ class GitHubService:
         args = ("git", "diff", "--staged") if staged else ("git", "diff")
         code, stdout, stderr = await run_command(*args, cwd=self.cwd)
         return code == 0, stdout if code == 0 else stderr
+
+
+def configured_repos() -> dict[str, Path]:
+    """Configured repos whose directory exists."""
+    return {name: path for name, path in REPO_ROOTS.items() if path.is_dir()}
+
+
+async def run_per_repo(
+    op: Callable[[str, "GitHubService"], Awaitable[T]],
+    repos: dict[str, Path] | None = None,
+) -> AsyncIterator[tuple[str, T]]:
+    """Run ``op`` against every repo concurrently.
+
+    Yields (repo name, result) in completion order, so callers can render
+    each repo as soon as it is done; total time is the slowest repo.
+
+    Args:
+        op: Coroutine taking (repo name, service) for one repo.
+        repos: Repos to run on (defaults to configured_repos()).
+    """
+
+    async def _one(name: str, path: Path) -> tuple[str, T]:
+        return name, await op(name, GitHubService(cwd=path))
+
+    targets = configured_repos() if repos is None else repos
+    for next_done in asyncio.as_completed([_one(n, p) for n, p in targets.items()]):
+        yield await next_done
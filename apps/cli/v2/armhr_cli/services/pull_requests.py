@@ -0,0 +1,235 @@
+"""Open pull requests across every configured repo.
+
+All repos are fetched in one `gh api graphql` request (one aliased
+`repository` field per repo), including each PR's CI check rollup and
+review decision. Results are cached in memory: reads within TTL are served
+as-is, older reads return the cached data immediately and refresh in the
+background, and a background loop keeps the cache warm while the app runs.
+"""
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from armhr_cli.services.github import PullRequest, configured_repos
+from armhr_cli.services.process import run_command
+
+# Matches git@github.com:o/n.git, https://github.com/o/n, ssh://git@github.com/o/n.git
+_GITHUB_REMOTE = re.compile(r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$")
+
+_PR_FIELDS = """
+fragment pr on PullRequest {
+  number
+  title
+  state
+  url
+  isDraft
+  headRefName
+  baseRefName
+  createdAt
+  updatedAt
+  author { login }
+  reviewDecision
+  commits(last: 1) { nodes { commit { statusCheckRollup { state } } } }
+}
+"""
+
+_slugs: dict[Path, tuple[str, str] | None] = {}
+
+
+@dataclass
+class PRSnapshot:
+    """Open PRs per repo from one refresh."""
+
+    prs: dict[str, list[PullRequest]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    fetched_at: float = 0.0  # time.time()
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+async def repo_slug(path: Path) -> tuple[str, str] | None:
+    """(owner, name) from the repo's origin remote, or None if not on GitHub."""
+    if path not in _slugs:
+        code, stdout, _ = await run_command(
+            "git",
+            "remote",
+            "get-url",
+            "origin",
+            cwd=path,
+        )
+        match = _GITHUB_REMOTE.search(stdout.strip()) if code == 0 else None
+        _slugs[path] = (match.group(1), match.group(2)) if match else None
+    return _slugs[path]
+
+
+def build_query(count: int) -> str:
+    """GraphQL document with one aliased repository lookup per repo."""
+    params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{\n"
+        f"    pullRequests(states: OPEN, first: 50, "
+        f"orderBy: {{field: UPDATED_AT, direction: DESC}}) {{ nodes {{ ...pr }} }}\n"
+        f"  }}"
+        for i in range(count)
+    )
+    return f"query({params}) {{\n{fields}\n}}\n{_PR_FIELDS}"
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _parse_pr(repo: str, node: dict) -> PullRequest:
+    commits = (node.get("commits") or {}).get("nodes") or []
+    rollup = (commits[0]["commit"].get("statusCheckRollup") or {}) if commits else {}
+    return PullRequest(
+        number=node["number"],
+        title=node["title"],
+        state=node["state"],
+        url=node["url"],
+        head_branch=node["headRefName"],
+        base_branch=node["baseRefName"],
+        author=(node.get("author") or {}).get("login", "ghost"),
+        created_at=_parse_time(node["createdAt"]),
+        updated_at=_parse_time(node["updatedAt"]),
+        draft=node["isDraft"],
+        repo=repo,
+        checks=rollup.get("state"),
+        review=node.get("reviewDecision"),
+    )
+
+
+async def fetch_open_prs(repos: dict[str, Path] | None = None) -> PRSnapshot:
+    """Fetch open PRs for all repos in a single GraphQL round trip."""
+    targets = configured_repos() if repos is None else repos
+    snap = PRSnapshot(fetched_at=time.time())
+
+    names = list(targets)
+    slugs = await asyncio.gather(*(repo_slug(targets[n]) for n in names))
+    resolved: list[tuple[str, tuple[str, str]]] = []
+    for name, slug in zip(names, slugs):
+        if slug is None:
+            snap.errors[name] = "no GitHub origin remote"
+        else:
+            resolved.append((name, slug))
+    if not resolved:
+        return snap
+
+    args = ["gh", "api", "graphql", "-f", f"query={build_query(len(resolved))}"]
+    for i, (_name, (owner, repo)) in enumerate(resolved):
+        args += ["-f", f"o{i}={owner}", "-f", f"n{i}={repo}"]
+
+    try:
+        code, stdout, stderr = await run_command(*args)
+    except OSError as e:
+        for name, _slug in resolved:
+            snap.errors[name] = str(e)
+        return snap
+
+    # gh exits non-zero on partial errors (e.g. one repo not visible) but
+    # still prints the data for the rest, so parse stdout either way.
+    try:
+        data = json.loads(stdout).get("data") or {}
+    except ValueError:
+        message = (stderr.strip() or "gh api graphql failed").splitlines()[0]
+        for name, _slug in resolved:
+            snap.errors[name] = message
+        return snap
+
+    for i, (name, (owner, repo)) in enumerate(resolved):
+        node = data.get(f"r{i}")
+        if node is None:
+            snap.errors[name] = f"{owner}/{repo} not accessible" if code == 0 else stderr.strip()
+            continue
+        snap.prs[name] = [_parse_pr(name, n) for n in node["pullRequests"]["nodes"]]
+    return snap
+
+
+class PRDashboard:
+    """TTL cache over fetch_open_prs with single-flight background refresh."""
+
+    TTL = 60.0
+    REFRESH_INTERVAL = 180.0
+
+    def __init__(self) -> None:
+        self.snapshot: PRSnapshot | None = None
+        self.last_error: str | None = None  # why the latest refresh failed, if it did
+        self._inflight: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def refreshing(self) -> bool:
+        return self._inflight is not None and not self._inflight.done()
+
+    def is_fresh(self) -> bool:
+        return self.snapshot is not None and self.snapshot.age < self.TTL
+
+    async def get(self, fresh: bool = False) -> PRSnapshot:
+        """Return cached PRs, fetching only when forced or nothing is cached.
+
+        A stale (older than TTL) snapshot is still returned immediately;
+        a background refresh is started so the next read is current.
+        """
+        if fresh or self.snapshot is None:
+            return await self.refresh()
+        if not self.is_fresh():
+            self._start_refresh()
+        return self.snapshot
+
+    async def refresh(self) -> PRSnapshot:
+        """Fetch now, joining a refresh already in flight."""
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Task:
+        if not self.refreshing:
+            self._inflight = asyncio.get_running_loop().create_task(self._refresh())
+            self._inflight.add_done_callback(self._refresh_done)
+        assert self._inflight is not None
+        return self._inflight
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        # Retrieves the exception even when nobody awaits the task (a
+        # background refresh), and keeps it for `prs` to report
+        if task.cancelled():
+            return
+        error = task.exception()
+        self.last_error = None if error is None else (str(error).strip() or type(error).__name__)
+
+    async def _refresh(self) -> PRSnapshot:
+        snap = await fetch_open_prs()
+        self.snapshot = snap
+        return snap
+
+    def start(self) -> None:
+        """Keep the cache warm with a refresh every REFRESH_INTERVAL seconds."""
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        except RuntimeError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                pass  # kept in last_error by _refresh_done; try again next tick
+            await asyncio.sleep(self.REFRESH_INTERVAL)
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.refreshing:
+            self._inflight.cancel()
+
+
+pr_dashboard = PRDashboard()
@@ -18,6 +18,7 @@ PREF_DEFAULTS: dict[str, bool] = {
     "clear_output_on_cmd": True,
     "input_at_top": False,
     "stacked_logs": False,
+    "env_restart_prompt": True,
 }
 
 # Maps pref key → env var name for backward compat overrides
@@ -26,6 +27,7 @@ _PREF_ENV_MAP: dict[str, str] = {
     "clear_output_on_cmd": "ARMHR_CLEAR_OUTPUT",
     "input_at_top": "ARMHR_INPUT_TOP",
     "stacked_logs": "ARMHR_STACKED_LOGS",
+    "env_restart_prompt": "ARMHR_ENV_RESTART_PROMPT",
 }
 
 KEYBINDING_DEFAULTS: dict[str, str] = {
@@ -99,6 +101,13 @@ def get_keybinding(action: str) -> str:
     return str(bindings.get(action, KEYBINDING_DEFAULTS.get(action, "")))
 
 
+def get_extra_repos() -> dict[str, Path]:
+    """Return extra git repos from the [repos] table (name = "path")."""
+    data = load_settings()
+    repos = data.get("repos", {})
+    return {name: Path(str(path)).expanduser() for name, path in repos.items()}
+
+
 # ── Write ────────────────────────────────────────────────────────────────
 
 
@@ -124,6 +133,14 @@ def _build_toml(data: dict) -> str:
             lines.append(f'{k} = "{escaped}"')
         lines.append("")
 
+    repos = data.get("repos", {})
+    if repos:
+        lines.append("[repos]")
+        for k, v in repos.items():
+            escaped = str(v).replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'{k} = "{escaped}"')
+        lines.append("")
+
     return "\n".join(lines) + "\n"
 
 
@@ -0,0 +1,202 @@
+"""Git worktrees for running several branches side by side.
+
+A worktree here is one branch checked out for both the backend and the
+frontend under ~/.armhr/worktrees/<name>/. Each one is assigned a port
+slot: slot N runs every service on its MONITORED_PORTS base + N, so the
+main checkout (slot 0) and up to range-1 worktrees never collide and all
+stay visible to the port scanner.
+
+The name -> slot/branch registry lives in ~/.armhr/worktrees.json.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from armhr_cli.config import BACKEND_ROOT, FRONTEND_ROOT, MONITORED_PORTS, STATE_DIR
+from armhr_cli.services.process import run_command
+
+WORKTREES_DIR: Path = STATE_DIR / "worktrees"
+REGISTRY_FILE: Path = STATE_DIR / "worktrees.json"
+
+# Repos a worktree checks out; keys match the "backend"/"frontend" port groups
+WORKTREE_REPOS: dict[str, Path] = {
+    "backend": BACKEND_ROOT,
+    "frontend": FRONTEND_ROOT,
+}
+
+# Slot 0 is the main checkout; worktrees take 1..MAX_SLOT
+MAX_SLOT: int = min(int(meta["range"]) for meta in MONITORED_PORTS.values()) - 1  # type: ignore[arg-type]
+
+
+@dataclass
+class Worktree:
+    """A named branch checkout with its own port slot."""
+
+    name: str
+    branch: str
+    slot: int
+    paths: dict[str, Path] = field(default_factory=dict)  # repo group -> checkout dir
+
+    def port(self, service: str) -> int:
+        """Port for a MONITORED_PORTS service (e.g. "backend", "hcm") in this slot."""
+        return int(MONITORED_PORTS[service]["base"]) + self.slot  # type: ignore[arg-type]
+
+
+def _load() -> dict[str, Worktree]:
+    try:
+        raw = json.loads(REGISTRY_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return {
+        name: Worktree(
+            name=name,
+            branch=entry["branch"],
+            slot=entry["slot"],
+            paths={group: Path(p) for group, p in entry["paths"].items()},
+        )
+        for name, entry in raw.items()
+    }
+
+
+def _save(worktrees: dict[str, Worktree]) -> None:
+    REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        wt.name: {
+            "branch": wt.branch,
+            "slot": wt.slot,
+            "paths": {group: str(p) for group, p in wt.paths.items()},
+        }
+        for wt in worktrees.values()
+    }
+    REGISTRY_FILE.write_text(json.dumps(data, indent=2))
+
+
+def list_worktrees() -> list[Worktree]:
+    """Registered worktrees, ordered by slot."""
+    return sorted(_load().values(), key=lambda wt: wt.slot)
+
+
+def get_worktree(name: str) -> Worktree | None:
+    return _load().get(name)
+
+
+def _free_slot(worktrees: dict[str, Worktree]) -> int | None:
+    used = {wt.slot for wt in worktrees.values()}
+    for slot in range(1, MAX_SLOT + 1):
+        if slot not in used:
+            return slot
+    return None
+
+
+async def _ref_exists(repo: Path, ref: str) -> bool:
+    code, _, _ = await run_command(
+        "git",
+        "rev-parse",
+        "--verify",
+        "--quiet",
+        ref,
+        cwd=repo,
+    )
+    return code == 0
+
+
+async def _add_checkout(repo: Path, path: Path, branch: str) -> tuple[bool, str]:
+    """Check ``branch`` out at ``path``.
+
+    Uses the local branch if there is one, else tracks origin/<branch>, else
+    detaches at the repo's HEAD (the branch may only exist in the other repo).
+    """
+    if await _ref_exists(repo, f"refs/heads/{branch}"):
+        args = ("git", "worktree", "add", str(path), branch)
+        how = branch
+    elif await _ref_exists(repo, f"refs/remotes/origin/{branch}"):
+        args = ("git", "worktree", "add", "--track", "-b", branch, str(path), f"origin/{branch}")
+        how = f"origin/{branch}"
+    else:
+        args = ("git", "worktree", "add", "--detach", str(path))
+        how = "HEAD (detached)"
+
+    code, _, stderr = await run_command(*args, cwd=repo)
+    if code != 0:
+        return False, stderr.strip().splitlines()[-1] if stderr.strip() else "git worktree add failed"
+    return True, how
+
+
+async def create_worktree(name: str, branch: str) -> tuple[bool, list[str]]:
+    """Create worktrees for ``branch`` in every repo and assign a port slot.
+
+    Returns:
+        (ok, per-repo messages). On failure nothing is registered and any
+        checkout that did succeed is removed again.
+    """
+    worktrees = _load()
+    if name in worktrees:
+        return False, [f"worktree '{name}' already exists"]
+    slot = _free_slot(worktrees)
+    if slot is None:
+        return False, [f"all {MAX_SLOT} port slots are in use -- remove a worktree first"]
+
+    repos = {group: repo for group, repo in WORKTREE_REPOS.items() if repo.is_dir()}
+    paths = {group: WORKTREES_DIR / name / group for group in repos}
+    for path in paths.values():
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    results = await asyncio.gather(
+        *(_add_checkout(repos[group], paths[group], branch) for group in repos),
+    )
+    messages = [f"{group}: {msg}" for group, (_, msg) in zip(repos, results)]
+
+    if not all(ok for ok, _ in results):
+        await asyncio.gather(
+            *(
+                _remove_checkout(repos[group], paths[group])
+                for group, (ok, _) in zip(repos, results)
+                if ok
+            ),
+        )
+        return False, messages
+
+    worktrees[name] = Worktree(name=name, branch=branch, slot=slot, paths=paths)
+    _save(worktrees)
+    return True, messages
+
+
+async def _remove_checkout(repo: Path, path: Path) -> tuple[bool, str]:
+    code, _, stderr = await run_command(
+        "git",
+        "worktree",
+        "remove",
+        "--force",
+        str(path),
+        cwd=repo,
+    )
+    return code == 0, stderr.strip()
+
+
+async def remove_worktree(name: str) -> tuple[bool, str]:
+    """Remove a worktree's checkouts and free its slot."""
+    worktrees = _load()
+    wt = worktrees.get(name)
+    if wt is None:
+        return False, f"no worktree named '{name}'"
+
+    results = await asyncio.gather(
+        *(
+            _remove_checkout(WORKTREE_REPOS[group], path)
+            for group, path in wt.paths.items()
+            if group in WORKTREE_REPOS and path.exists()
+        ),
+    )
+    errors = [err for ok, err in results if not ok]
+    if errors:
+        return False, errors[0].splitlines()[-1] if errors[0] else "git worktree remove failed"
+
+    del worktrees[name]
+    _save(worktrees)
+    try:
+        (WORKTREES_DIR / name).rmdir()
+    except OSError:
+        pass
+    return True, f"Removed worktree {name} (slot {wt.slot} freed)"
@@ -2,6 +2,9 @@ import path from 'path'
 
 /** @type {import('next').NextConfig} */
 const nextConfig = {
+  // Blue/green local builds (petehome `build swap`) write into .next-releases/<id>
+  // and then point the .next symlink at it; normal builds still use .next
+  distDir: process.env.NEXT_DIST_DIR || '.next',
   turbopack: {
     root: path.resolve(import.meta.dirname, '../..'),
   },
@@ -37,8 +37,25 @@ if (!fs.existsSync(keyPath) || !fs.existsSync(certPath)) {
   process.exit(1)
 }
 
+// `petehome build swap` points .next at a finished production build in
+// .next-releases/. Serve that build: the dev server would ignore it and write
+// its own output (.next/dev) into the release. `build dev` removes the link.
+function isReleaseLink(p) {
+  try {
+    return fs.lstatSync(p).isSymbolicLink()
+  } catch {
+    return false
+  }
+}
+
+const releaseActive = isReleaseLink(path.join(__dirname, '..', '.next'))
+const nodeEnv = releaseActive ? 'production' : process.env.NODE_ENV || 'development'
+
 console.log(`Starting Next.js HTTPS server...`)
 console.log(`Command: node ${serverPath}`)
+if (releaseActive) {
+  console.log(`Serving the release .next points at (production mode)`)
+}
 
 const child = spawn('node', [serverPath], {
   cwd: path.join(__dirname, '..'),
@@ -47,7 +64,7 @@ const child = spawn('node', [serverPath], {
   windowsHide: true,
   env: {
     ...process.env,
-    NODE_ENV: process.env.NODE_ENV || 'development',
+    NODE_ENV: nodeEnv,
     CUSTOM_SERVER: 'true',
   },
 })